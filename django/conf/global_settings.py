@@ -312,6 +312,15 @@ FILE_UPLOAD_PERMISSIONS = None
 # see https://docs.python.org/3/library/os.html#files-and-directories.
 FILE_UPLOAD_DIRECTORY_PERMISSIONS = None
 
+# Header, such as 'X-Sendfile' or 'X-Accel-Redirect', with which FileResponse
+# lets the front-end web server send files instead of Django.
+FILE_RESPONSE_OFFLOAD_HEADER = None
+
+# Mapping of directories to the path or URL prefix that the front-end web
+# server expects in the offload header for the files they contain. If empty,
+# the header contains the absolute path of any file.
+FILE_RESPONSE_OFFLOAD_PATHS = {}
+
 # Python module path where user will place custom format definition.
 # The directory where this setting is pointing should contain subdirectories
 # named as the locales, containing a formats.py file
@@ -443,6 +452,10 @@ SECURE_PROXY_SSL_HEADER = None
 # phase the middleware will be applied in reverse order.
 MIDDLEWARE = []
 
+# Whether to count the calls to each middleware and the time spent in it. The
+# counters are available in the middleware_stats attribute of the handler.
+MIDDLEWARE_STATS = False
+
 ############
 # SESSIONS #
 ############
@@ -489,6 +502,8 @@ CACHES = {
 CACHE_MIDDLEWARE_KEY_PREFIX = ''
 CACHE_MIDDLEWARE_SECONDS = 600
 CACHE_MIDDLEWARE_ALIAS = 'default'
+# The cache used by QuerySet.cache(). None disables the query cache.
+QUERYSET_CACHE_ALIAS = None
 
 ##################
 # AUTHENTICATION #
@@ -525,6 +540,14 @@ AUTH_PASSWORD_VALIDATORS = []
 
 SIGNING_BACKEND = 'django.core.signing.TimestampSigner'
 
+########
+# JSON #
+########
+
+# The class used to encode and decode JSON by JsonResponse, the JSON
+# serializers, signing, and JSONField.
+JSON_BACKEND = 'django.core.serializers.json.JSONBackend'
+
 ########
 # CSRF #
 ########
@@ -612,6 +635,10 @@ STATICFILES_FINDERS = [
 # Migration module overrides for apps, by app label.
 MIGRATION_MODULES = {}
 
+# Directory in which loaded migrations and project states are cached between
+# runs, or None to disable the cache.
+MIGRATION_CACHE_DIR = None
+
 #################
 # SYSTEM CHECKS #
 #################
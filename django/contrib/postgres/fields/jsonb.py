@@ -1,9 +1,8 @@
-import json
-
 from psycopg2.extras import Json
 
 from django.contrib.postgres import forms, lookups
 from django.core import exceptions
+from django.core.serializers.json import get_json_backend
 from django.db.models import (
     Field, TextField, Transform, lookups as builtin_lookups,
 )
@@ -23,8 +22,7 @@ class JsonAdapter(Json):
         super().__init__(adapted, dumps=dumps)
 
     def dumps(self, obj):
-        options = {'cls': self.encoder} if self.encoder else {}
-        return json.dumps(obj, **options)
+        return get_json_backend().dumps(obj, cls=self.encoder)
 
 
 class JSONField(CheckFieldDefaultMixin, Field):
@@ -63,9 +61,8 @@ class JSONField(CheckFieldDefaultMixin, Field):
 
     def validate(self, value, model_instance):
         super().validate(value, model_instance)
-        options = {'cls': self.encoder} if self.encoder else {}
         try:
-            json.dumps(value, **options)
+            get_json_backend().dumps(value, cls=self.encoder)
         except TypeError:
             raise exceptions.ValidationError(
                 self.error_messages['invalid'],
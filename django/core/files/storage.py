@@ -218,13 +218,19 @@ class FileSystemStorage(Storage):
         return self._value_or_setting(self._directory_permissions_mode, settings.FILE_UPLOAD_DIRECTORY_PERMISSIONS)
 
     def _open(self, name, mode='rb'):
-        return File(open(self.path(name), mode))
-
-    def _save(self, name, content):
         full_path = self.path(name)
+        if not set(mode) & {'w', 'a', 'x'}:
+            return File(open(full_path, mode))
+        # Files opened for writing, such as by StorageFileUploadHandler, are
+        # created like saved files.
+        self._create_directory(os.path.dirname(full_path))
+        file = File(open(full_path, mode))
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+        return file
 
-        # Create any intermediate directories that do not exist.
-        directory = os.path.dirname(full_path)
+    def _create_directory(self, directory):
+        """Create directory and any intermediate directories."""
         if not os.path.exists(directory):
             try:
                 if self.directory_permissions_mode is not None:
@@ -245,6 +251,10 @@ class FileSystemStorage(Storage):
         if not os.path.isdir(directory):
             raise IOError("%s exists and is not a directory." % directory)
 
+    def _save(self, name, content):
+        full_path = self.path(name)
+        self._create_directory(os.path.dirname(full_path))
+
         # There's a potential race condition between get_available_name and
         # saving the file; it's possible that two threads might return the
         # same name, at which point all sorts of fun happens. So we need to
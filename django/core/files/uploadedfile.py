@@ -10,7 +10,7 @@ from django.core.files import temp as tempfile
 from django.core.files.base import File
 
 __all__ = ('UploadedFile', 'TemporaryUploadedFile', 'InMemoryUploadedFile',
-           'SimpleUploadedFile')
+           'StoredUploadedFile', 'SimpleUploadedFile')
 
 
 class UploadedFile(File):
@@ -96,6 +96,35 @@ class InMemoryUploadedFile(UploadedFile):
         return False
 
 
+class StoredUploadedFile(UploadedFile):
+    """
+    A file uploaded straight to a storage (i.e. stream-to-storage).
+    """
+    def __init__(self, storage, storage_name, name, content_type, size, charset, content_type_extra=None):
+        while True:
+            try:
+                # Don't truncate a file created with the same name since it
+                # was found to be available.
+                file = storage.open(storage_name, 'xb')
+                break
+            except FileExistsError:
+                available_name = storage.get_available_name(storage_name)
+                if available_name == storage_name:
+                    raise
+                storage_name = available_name
+        super().__init__(file, name, content_type, size, charset, content_type_extra)
+        self.storage = storage
+        self.storage_name = storage_name
+        self.hexdigest = None
+
+    def open(self, mode='rb'):
+        if not self.closed:
+            self.seek(0)
+        else:
+            self.file = self.storage.open(self.storage_name, mode)
+        return self
+
+
 class SimpleUploadedFile(InMemoryUploadedFile):
     """
     A simple representation of a file, which just has content, size, and a name.
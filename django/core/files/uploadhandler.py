@@ -2,18 +2,21 @@
 Base file upload handler classes, and the built-in concrete subclasses
 """
 
+import hashlib
+import posixpath
 from io import BytesIO
 
 from django.conf import settings
+from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import (
-    InMemoryUploadedFile, TemporaryUploadedFile,
+    InMemoryUploadedFile, StoredUploadedFile, TemporaryUploadedFile,
 )
 from django.utils.module_loading import import_string
 
 __all__ = [
     'UploadFileException', 'StopUpload', 'SkipFile', 'FileUploadHandler',
-    'TemporaryFileUploadHandler', 'MemoryFileUploadHandler', 'load_handler',
-    'StopFutureHandlers'
+    'TemporaryFileUploadHandler', 'MemoryFileUploadHandler',
+    'StorageFileUploadHandler', 'load_handler', 'StopFutureHandlers'
 ]
 
 
@@ -127,6 +130,14 @@ class FileUploadHandler:
         """
         pass
 
+    def upload_interrupted(self):
+        """
+        Signal that the upload of the current file was interrupted, by
+        SkipFile, StopUpload, or an error. Subclasses should discard the data
+        received for it.
+        """
+        pass
+
 
 class TemporaryFileUploadHandler(FileUploadHandler):
     """
@@ -192,6 +203,58 @@ class MemoryFileUploadHandler(FileUploadHandler):
         )
 
 
+class StorageFileUploadHandler(FileUploadHandler):
+    """
+    Upload handler that streams data straight to a storage, computing a hash
+    of it on the fly, so that large files aren't written twice.
+    """
+    # The storage the files are written to, default_storage if None.
+    storage = None
+    # The directory of the storage the files are written to.
+    upload_to = ''
+    # The hashlib algorithm of StoredUploadedFile.hexdigest.
+    hash_algorithm = 'sha256'
+
+    def get_storage(self):
+        return default_storage if self.storage is None else self.storage
+
+    def get_storage_name(self, storage, file_name):
+        """Return an available name in storage for the uploaded file."""
+        name = storage.generate_filename(posixpath.join(self.upload_to, file_name))
+        return storage.get_available_name(name)
+
+    def new_file(self, *args, **kwargs):
+        """
+        Open the file of the storage to write the data to as it's coming in.
+        """
+        super().new_file(*args, **kwargs)
+        storage = self.get_storage()
+        self.file = StoredUploadedFile(
+            storage, self.get_storage_name(storage, self.file_name), self.file_name,
+            self.content_type, 0, self.charset, self.content_type_extra,
+        )
+        self.hash = hashlib.new(self.hash_algorithm)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.hash.update(raw_data)
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        file = self.file
+        del self.file
+        file.close()
+        file.open()
+        file.size = file_size
+        file.hexdigest = self.hash.hexdigest()
+        return file
+
+    def upload_interrupted(self):
+        if hasattr(self, 'file'):
+            self.file.close()
+            self.file.storage.delete(self.file.storage_name)
+            del self.file
+
+
 def load_handler(path, *args, **kwargs):
     """
     Given a path to a handler, return an instance of that handler.
@@ -1,23 +1,154 @@
 import logging
+import threading
 import types
+from collections import OrderedDict
+from time import perf_counter
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
 from django.db import connections, transaction
 from django.urls import get_resolver, set_urlconf
+from django.utils.deprecation import MiddlewareMixin
 from django.utils.log import log_response
 from django.utils.module_loading import import_string
 
-from .exception import convert_exception_to_response, get_exception_response
+from .exception import (
+    convert_exception_to_response, get_exception_response,
+    response_for_exception,
+)
 
 logger = logging.getLogger('django.request')
 
 
+class MiddlewareStats:
+    """
+    Counters of a middleware, collected when settings.MIDDLEWARE_STATS is
+    True: the number of requests it processed, the number of them it
+    answered without calling the next middleware in process_request(), and
+    the cumulative time in seconds spent in it and in the middleware and view
+    it called.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self):
+        return '<%s: calls=%d short_circuits=%d time=%.6f>' % (
+            self.__class__.__name__, self.calls, self.short_circuits, self.time,
+        )
+
+    def record(self, elapsed, short_circuit=False):
+        with self.lock:
+            self.calls += 1
+            self.time += elapsed
+            if short_circuit:
+                self.short_circuits += 1
+
+    def reset(self):
+        with self.lock:
+            self.calls = 0
+            self.short_circuits = 0
+            self.time = 0.0
+
+
+class MiddlewareMixinChain:
+    """
+    Call the process_request() and process_response() hooks of consecutive
+    MiddlewareMixin instances in a single loop rather than through a pair of
+    nested calls per middleware. Exceptions raised by a hook are converted to
+    responses, as if each middleware was wrapped by
+    convert_exception_to_response().
+
+    middleware is a list of (process_request, process_response,
+    skip_path_prefixes, stats) tuples, outermost first.
+    """
+    def __init__(self, get_response, middleware):
+        self.get_response = get_response
+        self.middleware = middleware
+
+    def __call__(self, request):
+        path = request.path_info
+        response = None
+        called = []
+        for process_request, process_response, skip_path_prefixes, stats in self.middleware:
+            if skip_path_prefixes and path.startswith(skip_path_prefixes):
+                continue
+            start = perf_counter() if stats is not None else None
+            if process_request is not None:
+                try:
+                    response = process_request(request)
+                except Exception as exc:
+                    response = self.response_for_exception(request, exc, called)
+                    if stats is not None:
+                        stats.record(perf_counter() - start, short_circuit=True)
+                    break
+            called.append((process_response, stats, start, bool(response)))
+            if response:
+                break
+        else:
+            try:
+                response = self.get_response(request)
+            except Exception as exc:
+                # The innermost middleware converts the exception.
+                if not called:
+                    raise
+                called.pop()
+                response = self.response_for_exception(request, exc, called)
+
+        while called:
+            process_response, stats, start, short_circuit = called.pop()
+            if process_response is not None:
+                try:
+                    response = process_response(request, response)
+                except Exception as exc:
+                    response = self.response_for_exception(request, exc, called)
+            if stats is not None:
+                stats.record(perf_counter() - start, short_circuit)
+        return response
+
+    def response_for_exception(self, request, exc, called):
+        """
+        Convert an exception raised by a middleware to a response. If that
+        fails, the enclosing middleware in called converts the new exception
+        instead and its process_response() isn't called, as with nested
+        convert_exception_to_response() wrappers.
+        """
+        while True:
+            try:
+                return response_for_exception(request, exc)
+            except Exception as new_exc:
+                if not called:
+                    raise
+                called.pop()
+                exc = new_exc
+
+
+def wrap_middleware(mw_instance, get_response, skip_path_prefixes, stats):
+    """
+    Wrap a middleware so that requests whose path starts with one of
+    skip_path_prefixes go straight to get_response and, if stats isn't None,
+    the calls to the middleware are recorded in it.
+    """
+    def middleware(request):
+        if skip_path_prefixes and request.path_info.startswith(skip_path_prefixes):
+            return get_response(request)
+        if stats is None:
+            return mw_instance(request)
+        start = perf_counter()
+        try:
+            return mw_instance(request)
+        finally:
+            stats.record(perf_counter() - start)
+    return middleware
+
+
 class BaseHandler:
     _view_middleware = None
     _template_response_middleware = None
     _exception_middleware = None
+    _hook_skip_path_prefixes = None
     _middleware_chain = None
+    middleware_stats = None
 
     def load_middleware(self):
         """
@@ -28,6 +159,8 @@ class BaseHandler:
         self._view_middleware = []
         self._template_response_middleware = []
         self._exception_middleware = []
+        self._hook_skip_path_prefixes = {}
+        middleware_stats = []
 
         handler = convert_exception_to_response(self._get_response)
         for middleware_path in reversed(settings.MIDDLEWARE):
@@ -47,19 +180,68 @@ class BaseHandler:
                     'Middleware factory %s returned None.' % middleware_path
                 )
 
+            # Middleware may declare path prefixes for which it's irrelevant,
+            # such as the static files or health checks, so it isn't called.
+            skip_path_prefixes = tuple(getattr(mw_instance, 'skip_path_prefixes', ()))
+            stats = None
+            if settings.MIDDLEWARE_STATS:
+                stats = MiddlewareStats()
+                middleware_stats.append((middleware_path, stats))
+
+            hooks = []
             if hasattr(mw_instance, 'process_view'):
                 self._view_middleware.insert(0, mw_instance.process_view)
+                hooks.append(mw_instance.process_view)
             if hasattr(mw_instance, 'process_template_response'):
                 self._template_response_middleware.append(mw_instance.process_template_response)
+                hooks.append(mw_instance.process_template_response)
             if hasattr(mw_instance, 'process_exception'):
                 self._exception_middleware.append(mw_instance.process_exception)
+                hooks.append(mw_instance.process_exception)
+            if skip_path_prefixes:
+                for hook in hooks:
+                    self._hook_skip_path_prefixes[hook] = skip_path_prefixes
 
+            if isinstance(mw_instance, MiddlewareMixin) and type(mw_instance).__call__ is MiddlewareMixin.__call__:
+                # Flatten the request and response phases of consecutive
+                # MiddlewareMixin instances which don't override __call__().
+                # Each instance keeps the chain of the following ones as its
+                # get_response.
+                entry = (
+                    getattr(mw_instance, 'process_request', None),
+                    getattr(mw_instance, 'process_response', None),
+                    skip_path_prefixes,
+                    stats,
+                )
+                if isinstance(handler, MiddlewareMixinChain):
+                    handler = MiddlewareMixinChain(handler.get_response, [entry] + handler.middleware)
+                else:
+                    handler = MiddlewareMixinChain(handler, [entry])
+                continue
+
+            if skip_path_prefixes or stats is not None:
+                mw_instance = wrap_middleware(mw_instance, handler, skip_path_prefixes, stats)
             handler = convert_exception_to_response(mw_instance)
 
+        if settings.MIDDLEWARE_STATS:
+            self.middleware_stats = OrderedDict(reversed(middleware_stats))
+        else:
+            self.middleware_stats = None
+
         # We only assign to this when initialization is complete as it is used
         # as a flag for initialization being complete.
         self._middleware_chain = handler
 
+    def _active_hooks(self, hooks, request):
+        """
+        Return the hooks of the middleware which don't skip the path of the
+        request.
+        """
+        if not self._hook_skip_path_prefixes:
+            return hooks
+        path = request.path_info
+        return [hook for hook in hooks if not path.startswith(self._hook_skip_path_prefixes.get(hook, ()))]
+
     def make_view_atomic(self, view):
         non_atomic_requests = getattr(view, '_non_atomic_requests', set())
         for db in connections.all():
@@ -113,7 +295,7 @@ class BaseHandler:
         request.resolver_match = resolver_match
 
         # Apply view middleware
-        for middleware_method in self._view_middleware:
+        for middleware_method in self._active_hooks(self._view_middleware, request):
             response = middleware_method(request, callback, callback_args, callback_kwargs)
             if response:
                 break
@@ -140,7 +322,7 @@ class BaseHandler:
         # If the response supports deferred rendering, apply template
         # response middleware and then render the response
         elif hasattr(response, 'render') and callable(response.render):
-            for middleware_method in self._template_response_middleware:
+            for middleware_method in self._active_hooks(self._template_response_middleware, request):
                 response = middleware_method(request, response)
                 # Complain if the template response middleware returned None (a common error).
                 if response is None:
@@ -162,7 +344,7 @@ class BaseHandler:
         Pass the exception to the exception middleware. If no middleware
         return a response for this exception, raise it.
         """
-        for middleware_method in self._exception_middleware:
+        for middleware_method in self._active_hooks(self._exception_middleware, request):
             response = middleware_method(request, exception)
             if response:
                 return response
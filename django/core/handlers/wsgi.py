@@ -80,21 +80,42 @@ class WSGIRequest(HttpRequest):
         self.META['PATH_INFO'] = path_info
         self.META['SCRIPT_NAME'] = script_name
         self.method = environ['REQUEST_METHOD'].upper()
-        self.content_type, self.content_params = cgi.parse_header(environ.get('CONTENT_TYPE', ''))
-        if 'charset' in self.content_params:
+        self._read_started = False
+        self.resolver_match = None
+
+    # The content type, the encoding, and the body stream are set up on first
+    # access, since most requests, e.g. GET requests, don't need them.
+    @cached_property
+    def _content_type_header(self):
+        return cgi.parse_header(self.environ.get('CONTENT_TYPE', ''))
+
+    @cached_property
+    def content_type(self):
+        return self._content_type_header[0]
+
+    @cached_property
+    def content_params(self):
+        return self._content_type_header[1]
+
+    @cached_property
+    def _encoding(self):
+        charset = self.content_params.get('charset')
+        if charset is not None:
             try:
-                codecs.lookup(self.content_params['charset'])
+                codecs.lookup(charset)
             except LookupError:
                 pass
             else:
-                self.encoding = self.content_params['charset']
+                return charset
+        return None
+
+    @cached_property
+    def _stream(self):
         try:
-            content_length = int(environ.get('CONTENT_LENGTH'))
+            content_length = int(self.environ.get('CONTENT_LENGTH'))
         except (ValueError, TypeError):
             content_length = 0
-        self._stream = LimitedStream(self.environ['wsgi.input'], content_length)
-        self._read_started = False
-        self.resolver_match = None
+        return LimitedStream(self.environ['wsgi.input'], content_length)
 
     def _get_scheme(self):
         return self.environ.get('wsgi.url_scheme')
@@ -142,6 +163,9 @@ class WSGIHandler(base.BaseHandler):
 
         response._handler_class = self.__class__
 
+        if getattr(response, 'file_to_stream', None) is not None:
+            response.offload()
+
         status = '%d %s' % (response.status_code, response.reason_phrase)
         response_headers = list(response.items())
         for c in response.cookies.values():
@@ -1,17 +1,68 @@
+import os
 import warnings
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from django.apps import apps
 from django.core import serializers
 from django.core.management.base import BaseCommand, CommandError
 from django.core.management.utils import parse_apps_and_model_labels
-from django.db import DEFAULT_DB_ALIAS, router
+from django.db import DEFAULT_DB_ALIAS, connections, router
 
 
 class ProxyModelWarning(Warning):
     pass
 
 
+class ModelRow:
+    """
+    Stand-in for a model instance built from a values_list() row. It provides
+    what the built-in serializers use to serialize the concrete fields of a
+    model: the field values as attributes, pk, and _meta.
+    """
+    def __init__(self, opts, values):
+        self.__dict__.update(values)
+        self._meta = opts
+
+    @property
+    def pk(self):
+        return getattr(self, self._meta.pk.attname)
+
+
+def can_serialize_rows(model, format, use_natural_foreign_keys, use_natural_primary_keys):
+    """
+    Return whether the objects of model can be serialized from ModelRow
+    objects rather than model instances.
+    """
+    serializer = serializers.get_serializer(format)
+    if serializer.__module__ != serializers.BUILTIN_SERIALIZERS.get(format):
+        return False
+    opts = model._meta.concrete_model._meta
+    if use_natural_primary_keys and hasattr(model, 'natural_key'):
+        return False
+    if use_natural_foreign_keys and any(
+        field.remote_field and hasattr(field.remote_field.model, 'natural_key')
+        for field in opts.local_fields
+    ):
+        return False
+    # Many-to-many values are read through the related managers of instances.
+    return not any(
+        field.serialize and field.remote_field.through._meta.auto_created
+        for field in opts.many_to_many
+    )
+
+
+def iter_rows(queryset, chunk_size=2000):
+    """
+    Yield ModelRow objects for the rows of queryset, fetched in chunks with a
+    server-side cursor where the database supports it.
+    """
+    opts = queryset.model._meta
+    attnames = [field.attname for field in opts.concrete_model._meta.local_fields]
+    for row in queryset.values_list(*attnames).iterator(chunk_size=chunk_size):
+        yield ModelRow(opts, zip(attnames, row))
+
+
 class Command(BaseCommand):
     help = (
         "Output the contents of the database as a fixture of the given format "
@@ -64,6 +115,15 @@ class Command(BaseCommand):
             '-o', '--output',
             help='Specifies file to which the output is written.'
         )
+        parser.add_argument(
+            '--output-dir',
+            help='Specifies a directory to which the objects of each model are '
+                 'written, in a file named app_label.model_name.format.',
+        )
+        parser.add_argument(
+            '--parallel', type=int, default=1,
+            help='Number of models dumped concurrently with --output-dir. Defaults to 1.',
+        )
 
     def handle(self, *app_labels, **options):
         format = options['format']
@@ -71,6 +131,8 @@ class Command(BaseCommand):
         using = options['database']
         excludes = options['exclude']
         output = options['output']
+        output_dir = options['output_dir']
+        parallel = options['parallel']
         show_traceback = options['traceback']
         use_natural_foreign_keys = options['use_natural_foreign_keys']
         use_natural_primary_keys = options['use_natural_primary_keys']
@@ -82,6 +144,13 @@ class Command(BaseCommand):
         else:
             primary_keys = []
 
+        if output and output_dir:
+            raise CommandError("--output and --output-dir can't be used together.")
+        if parallel < 1:
+            raise CommandError("--parallel must be a positive integer.")
+        if parallel > 1 and not output_dir:
+            raise CommandError("--parallel requires --output-dir.")
+
         excluded_models, excluded_apps = parse_apps_and_model_labels(excludes)
 
         if not app_labels:
@@ -140,11 +209,8 @@ class Command(BaseCommand):
 
             raise CommandError("Unknown serialization format: %s" % format)
 
-        def get_objects(count_only=False):
-            """
-            Collate the objects to be serialized. If count_only is True, just
-            count the number of objects to be serialized.
-            """
+        def get_querysets():
+            """Yield the model and queryset of each model to serialize."""
             models = serializers.sort_dependencies(app_list.items())
             for model in models:
                 if model in excluded_models:
@@ -163,28 +229,63 @@ class Command(BaseCommand):
                     queryset = objects.using(using).order_by(model._meta.pk.name)
                     if primary_keys:
                         queryset = queryset.filter(pk__in=primary_keys)
-                    if count_only:
-                        yield queryset.order_by().count()
-                    else:
-                        yield from queryset.iterator()
+                    yield model, queryset
+
+        def get_objects(querysets):
+            """
+            Collate the objects to be serialized. Models are only instantiated
+            when the serializer needs them.
+            """
+            for model, queryset in querysets:
+                if can_serialize_rows(model, format, use_natural_foreign_keys, use_natural_primary_keys):
+                    yield from iter_rows(queryset)
+                else:
+                    yield from queryset.iterator()
+
+        def serialize(querysets, stream, progress_output=None, object_count=0):
+            serializers.serialize(
+                format, get_objects(querysets), indent=indent,
+                use_natural_foreign_keys=use_natural_foreign_keys,
+                use_natural_primary_keys=use_natural_primary_keys,
+                stream=stream, progress_output=progress_output,
+                object_count=object_count,
+            )
+
+        def dump_model(model, queryset):
+            path = os.path.join(output_dir, '%s.%s' % (model._meta.label_lower, format))
+            try:
+                with open(path, 'w') as stream:
+                    serialize([(model, queryset)], stream)
+            finally:
+                # Close the connection of the worker thread.
+                if parallel > 1:
+                    connections[using].close()
+            return path
 
         try:
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+                querysets = list(get_querysets())
+                if parallel > 1:
+                    with ThreadPoolExecutor(max_workers=parallel) as pool:
+                        futures = [pool.submit(dump_model, model, queryset) for model, queryset in querysets]
+                    paths = [future.result() for future in futures]
+                else:
+                    paths = [dump_model(model, queryset) for model, queryset in querysets]
+                if options['verbosity'] >= 2:
+                    for path in paths:
+                        self.stdout.write('Wrote %s\n' % path)
+                return
             self.stdout.ending = None
             progress_output = None
             object_count = 0
             # If dumpdata is outputting to stdout, there is no way to display progress
             if output and self.stdout.isatty() and options['verbosity'] > 0:
                 progress_output = self.stdout
-                object_count = sum(get_objects(count_only=True))
+                object_count = sum(queryset.order_by().count() for model, queryset in get_querysets())
             stream = open(output, 'w') if output else None
             try:
-                serializers.serialize(
-                    format, get_objects(), indent=indent,
-                    use_natural_foreign_keys=use_natural_foreign_keys,
-                    use_natural_primary_keys=use_natural_primary_keys,
-                    stream=stream or self.stdout, progress_output=progress_output,
-                    object_count=object_count,
-                )
+                serialize(get_querysets(), stream or self.stdout, progress_output, object_count)
             finally:
                 if stream:
                     stream.close()
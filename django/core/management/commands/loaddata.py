@@ -31,6 +31,8 @@ READ_STDIN = '-'
 
 class Command(BaseCommand):
     help = 'Installs the named fixture(s) in the database.'
+    # Number of objects of a model buffered in --bulk mode.
+    bulk_batch_size = 1000
     missing_args_message = (
         "No database fixture specified. Please provide the path of at least "
         "one fixture in the command line."
@@ -59,6 +61,13 @@ class Command(BaseCommand):
             '--format',
             help='Format of serialized data when reading from stdin.',
         )
+        parser.add_argument(
+            '--bulk', action='store_true',
+            help='Insert objects in batches of objects of the same model '
+                 'rather than saving them one by one. Signals aren\'t sent and '
+                 'objects whose primary key already exists raise an '
+                 'IntegrityError instead of being updated.',
+        )
 
     def handle(self, *fixture_labels, **options):
         self.ignore = options['ignore']
@@ -67,6 +76,7 @@ class Command(BaseCommand):
         self.verbosity = options['verbosity']
         self.excluded_models, self.excluded_apps = parse_apps_and_model_labels(options['exclude'])
         self.format = options['format']
+        self.bulk = options['bulk']
 
         with transaction.atomic(using=self.using):
             self.loaddata(fixture_labels)
@@ -110,6 +120,7 @@ class Command(BaseCommand):
 
         with connection.constraint_checks_disabled():
             self.objs_with_deferred_fields = []
+            self.bulk_objects = {}
             for fixture_label in fixture_labels:
                 self.load_label(fixture_label)
             for obj in self.objs_with_deferred_fields:
@@ -177,24 +188,28 @@ class Command(BaseCommand):
                     if router.allow_migrate_model(self.using, obj.object.__class__):
                         loaded_objects_in_fixture += 1
                         self.models.add(obj.object.__class__)
-                        try:
-                            obj.save(using=self.using)
-                            if show_progress:
-                                self.stdout.write(
-                                    '\rProcessed %i object(s).' % loaded_objects_in_fixture,
-                                    ending=''
-                                )
-                        # psycopg2 raises ValueError if data contains NUL chars.
-                        except (DatabaseError, IntegrityError, ValueError) as e:
-                            e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
-                                'app_label': obj.object._meta.app_label,
-                                'object_name': obj.object._meta.object_name,
-                                'pk': obj.object.pk,
-                                'error_msg': e,
-                            },)
-                            raise
+                        if self.bulk and self.can_bulk_create(obj):
+                            self.add_to_bulk(obj)
+                        else:
+                            try:
+                                obj.save(using=self.using)
+                            # psycopg2 raises ValueError if data contains NUL chars.
+                            except (DatabaseError, IntegrityError, ValueError) as e:
+                                e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
+                                    'app_label': obj.object._meta.app_label,
+                                    'object_name': obj.object._meta.object_name,
+                                    'pk': obj.object.pk,
+                                    'error_msg': e,
+                                },)
+                                raise
+                        if show_progress:
+                            self.stdout.write(
+                                '\rProcessed %i object(s).' % loaded_objects_in_fixture,
+                                ending=''
+                            )
                     if obj.deferred_fields:
                         self.objs_with_deferred_fields.append(obj)
+                self.flush_bulk()
                 if objects and show_progress:
                     self.stdout.write('')  # add a newline after progress indicator
                 self.loaded_object_count += loaded_objects_in_fixture
@@ -214,6 +229,67 @@ class Command(BaseCommand):
                     RuntimeWarning
                 )
 
+    def can_bulk_create(self, obj):
+        """
+        Return whether the deserialized object can be inserted with
+        bulk_create(). Objects without a primary key are saved so that their
+        primary key is set for the objects referring to them, and
+        bulk_create() doesn't support multi-table inheritance.
+        """
+        opts = obj.object._meta
+        return obj.object.pk is not None and not any(
+            parent._meta.concrete_model is not opts.concrete_model
+            for parent in opts.get_parent_list()
+        )
+
+    def add_to_bulk(self, obj):
+        """
+        Buffer a deserialized object until enough objects of its model are
+        collected to be inserted at once. Foreign key constraints aren't
+        checked until all fixtures are loaded, so the order of the inserts
+        doesn't matter.
+        """
+        model = obj.object.__class__
+        objs = self.bulk_objects.setdefault(model, [])
+        objs.append(obj)
+        if len(objs) >= self.bulk_batch_size:
+            self.bulk_create(model)
+
+    def bulk_create(self, model):
+        objs = self.bulk_objects.pop(model, [])
+        instances = [obj.object for obj in objs]
+        try:
+            # Insert the values as they are in the fixtures, like
+            # Model.save_base(raw=True) does, so that pre_save() doesn't
+            # replace the values of auto_now and auto_now_add fields.
+            fields = model._meta.local_concrete_fields
+            queryset = model._base_manager.using(self.using)
+            batch_size = max(connections[self.using].ops.bulk_batch_size(fields, instances), 1)
+            for i in range(0, len(instances), batch_size):
+                queryset._insert(instances[i:i + batch_size], fields=fields, raw=True, using=self.using)
+            for instance in instances:
+                instance._state.adding = False
+                instance._state.db = self.using
+            for obj in objs:
+                if obj.m2m_data:
+                    for accessor_name, object_list in obj.m2m_data.items():
+                        getattr(obj.object, accessor_name).set(object_list)
+                    obj.m2m_data = None
+        # psycopg2 raises ValueError if data contains NUL chars.
+        except (DatabaseError, IntegrityError, ValueError) as e:
+            e.args = ("Could not load %(app_label)s.%(object_name)s objects (pk=%(pks)s): %(error_msg)s" % {
+                'app_label': model._meta.app_label,
+                'object_name': model._meta.object_name,
+                'pks': ', '.join(str(obj.object.pk) for obj in objs),
+                'error_msg': e,
+            },)
+            raise
+
+    def flush_bulk(self):
+        """Insert the objects buffered in --bulk mode."""
+        for model in list(self.bulk_objects):
+            self.bulk_create(model)
+
     @functools.lru_cache(maxsize=None)
     def find_fixtures(self, fixture_label):
         """Find fixture files for a given label."""
@@ -343,8 +419,18 @@ class SingleZipReader(zipfile.ZipFile):
         if len(self.namelist()) != 1:
             raise ValueError("Zip-compressed fixtures must contain one file.")
 
-    def read(self):
-        return zipfile.ZipFile.read(self, self.namelist()[0])
+        self._member = None
+
+    def read(self, size=-1):
+        # Stream the file rather than decompressing it at once.
+        if self._member is None:
+            self._member = self.open(self.namelist()[0])
+        return self._member.read(size)
+
+    def close(self):
+        if self._member is not None:
+            self._member.close()
+        super().close()
 
 
 def humanize(dirname):
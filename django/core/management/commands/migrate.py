@@ -1,6 +1,8 @@
 import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
+from io import StringIO
 
 from django.apps import apps
 from django.core.checks import Tags, run_checks
@@ -13,7 +15,7 @@ from django.core.management.sql import (
 from django.db import DEFAULT_DB_ALIAS, connections, router
 from django.db.migrations.autodetector import MigrationAutodetector
 from django.db.migrations.executor import MigrationExecutor
-from django.db.migrations.loader import AmbiguityError
+from django.db.migrations.loader import AmbiguityError, MigrationLoader
 from django.db.migrations.state import ModelState, ProjectState
 from django.utils.module_loading import module_has_submodule
 from django.utils.text import Truncator
@@ -41,6 +43,11 @@ class Command(BaseCommand):
             default=DEFAULT_DB_ALIAS,
             help='Nominates a database to synchronize. Defaults to the "default" database.',
         )
+        parser.add_argument(
+            '--databases', nargs='+', metavar='DATABASE',
+            help='Nominates several databases to synchronize concurrently. '
+                 'Overrides --database.',
+        )
         parser.add_argument(
             '--fake', action='store_true',
             help='Mark migrations as run without actually running them.',
@@ -77,6 +84,9 @@ class Command(BaseCommand):
             if module_has_submodule(app_config.module, "management"):
                 import_module('.management', app_config.name)
 
+        if options['databases']:
+            return self.migrate_databases(*args, **options)
+
         # Get the database we're operating from
         db = options['database']
         connection = connections[db]
@@ -244,7 +254,45 @@ class Command(BaseCommand):
             self.verbosity, self.interactive, connection.alias, apps=post_migrate_apps, plan=plan,
         )
 
-    def migration_progress_callback(self, action, migration=None, fake=False):
+    def migrate_databases(self, *args, **options):
+        """
+        Migrate the databases given by --databases concurrently, each one in
+        its own thread. The output of each database is written once all of
+        them are done.
+        """
+        databases = options['databases']
+        for db in databases:
+            if db not in connections:
+                raise CommandError("Database '%s' doesn't exist." % db)
+        # Import the migration modules once before the threads load them.
+        MigrationLoader(None, ignore_no_migrations=True)
+        commands = OrderedDict(
+            (db, type(self)(stdout=StringIO(), stderr=StringIO(), no_color=options['no_color']))
+            for db in databases
+        )
+
+        def migrate(db, command):
+            command.style = self.style
+            try:
+                command.handle(*args, **dict(options, database=db, databases=None))
+            finally:
+                connections[db].close()
+
+        with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+            futures = [pool.submit(migrate, db, command) for db, command in commands.items()]
+        failed = []
+        for (db, command), future in zip(commands.items(), futures):
+            if self.verbosity >= 1:
+                self.stdout.write(self.style.MIGRATE_HEADING("Database '%s':" % db))
+            self.stdout.write(command.stdout._out.getvalue(), ending='')
+            self.stderr.write(command.stderr._out.getvalue(), ending='')
+            if future.exception() is not None:
+                self.stderr.write("Error migrating database '%s': %s" % (db, future.exception()))
+                failed.append(db)
+        if failed:
+            raise CommandError('Migrating the database(s) %s failed.' % ', '.join("'%s'" % db for db in failed))
+
+    def migration_progress_callback(self, action, migration=None, fake=False, rows=None):
         if self.verbosity >= 1:
             compute_time = self.verbosity > 1
             if action == "apply_start":
@@ -269,6 +317,10 @@ class Command(BaseCommand):
                     self.stdout.write(self.style.SUCCESS(" FAKED" + elapsed))
                 else:
                     self.stdout.write(self.style.SUCCESS(" OK" + elapsed))
+            elif action == "batch_success":
+                if compute_time:
+                    self.stdout.write(" %d rows..." % rows, ending="")
+                    self.stdout.flush()
             elif action == "render_start":
                 if compute_time:
                     self.start = time.time()
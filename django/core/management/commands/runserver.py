@@ -46,6 +46,15 @@ class Command(BaseCommand):
             '--nothreading', action='store_false', dest='use_threading',
             help='Tells Django to NOT use threading.',
         )
+        parser.add_argument(
+            '--threads', type=int,
+            help='Maximum number of threads handling connections in each process '
+                 '(default: a thread per connection).',
+        )
+        parser.add_argument(
+            '--processes', type=int, default=1,
+            help='Number of processes handling connections (default: 1).',
+        )
         parser.add_argument(
             '--noreload', action='store_false', dest='use_reloader',
             help='Tells Django to NOT use the auto-reloader.',
@@ -71,6 +80,13 @@ class Command(BaseCommand):
         if self.use_ipv6 and not socket.has_ipv6:
             raise CommandError('Your Python does not support IPv6.')
         self._raw_ipv6 = False
+        if options['threads'] is not None and options['threads'] < 1:
+            raise CommandError('--threads must be a positive integer.')
+        if options['processes'] < 1:
+            raise CommandError('--processes must be a positive integer.')
+        if options['processes'] > 1 and not hasattr(os, 'fork'):
+            raise CommandError('--processes requires os.fork(), which is unavailable on this platform.')
+
         if not options['addrport']:
             self.addr = ''
             self.port = self.default_port
@@ -136,7 +152,8 @@ class Command(BaseCommand):
         try:
             handler = self.get_handler(*args, **options)
             run(self.addr, int(self.port), handler,
-                ipv6=self.use_ipv6, threading=threading, server_cls=self.server_cls)
+                ipv6=self.use_ipv6, threading=threading, server_cls=self.server_cls,
+                threads=options['threads'], processes=options['processes'])
         except socket.error as e:
             # Use helpful error messages instead of ugly tracebacks.
             ERRORS = {
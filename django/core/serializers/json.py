@@ -2,19 +2,30 @@
 Serialize data to/from JSON
 """
 
+import codecs
 import datetime
 import decimal
+import functools
 import json
+import re
 import uuid
 
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.core.serializers.base import DeserializationError
 from django.core.serializers.python import (
     Deserializer as PythonDeserializer, Serializer as PythonSerializer,
 )
 from django.utils.duration import duration_iso_string
 from django.utils.functional import Promise
+from django.utils.module_loading import import_string
 from django.utils.timezone import is_aware
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Serializer(PythonSerializer):
     """Convert a queryset to JSON."""
@@ -29,6 +40,7 @@ class Serializer(PythonSerializer):
             # Prevent trailing spaces
             self.json_kwargs['separators'] = (',', ': ')
         self.json_kwargs.setdefault('cls', DjangoJSONEncoder)
+        self._dumps = get_json_backend().dumps
 
     def start_serialization(self):
         self._init_options()
@@ -50,7 +62,9 @@ class Serializer(PythonSerializer):
                 self.stream.write(" ")
         if indent:
             self.stream.write("\n")
-        json.dump(self.get_dump_object(obj), self.stream, **self.json_kwargs)
+        # Write each object at once rather than each token, json.dumps() also
+        # uses the C encoder when possible.
+        self.stream.write(self._dumps(self.get_dump_object(obj), **self.json_kwargs))
         self._current = None
 
     def getvalue(self):
@@ -59,13 +73,14 @@ class Serializer(PythonSerializer):
 
 
 def Deserializer(stream_or_string, **options):
-    """Deserialize a stream or string of JSON data."""
-    if not isinstance(stream_or_string, (bytes, str)):
-        stream_or_string = stream_or_string.read()
-    if isinstance(stream_or_string, bytes):
-        stream_or_string = stream_or_string.decode()
+    """
+    Deserialize a stream or string of JSON data.
+
+    The stream is parsed incrementally, so that the objects of large fixtures
+    are yielded as they're read instead of being loaded in memory at once.
+    """
     try:
-        objects = json.loads(stream_or_string)
+        objects = iter_array_items(iter_chunks(stream_or_string))
         yield from PythonDeserializer(objects, **options)
     except (GeneratorExit, DeserializationError):
         raise
@@ -73,6 +88,93 @@ def Deserializer(stream_or_string, **options):
         raise DeserializationError() from exc
 
 
+CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def iter_chunks(stream_or_string):
+    """
+    Yield the text of a stream or string in chunks of (at most) CHUNK_SIZE
+    characters or bytes, decoding bytes as UTF-8.
+    """
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    if isinstance(stream_or_string, str):
+        yield stream_or_string
+        return
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    while True:
+        data = stream_or_string.read(CHUNK_SIZE)
+        chunk = decoder.decode(data, final=not data) if isinstance(data, bytes) else data
+        if chunk:
+            yield chunk
+        if not data:
+            break
+
+
+def iter_array_items(chunks):
+    """
+    Parse a JSON array from an iterable of text chunks and yield its items as
+    soon as they're complete. Only the text of the item being parsed is kept
+    in memory.
+    """
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    buffer = ''
+    pos = 0
+    eof = False
+    # What's expected next: '[', the first item or ']', an item, ',' or ']'
+    # after an item, and only whitespace after the closing bracket.
+    start, first_item, item, separator, end = range(5)
+    state = start
+    while True:
+        pos = WHITESPACE.match(buffer, pos).end()
+        if pos < len(buffer):
+            char = buffer[pos]
+            if state == start:
+                if char != '[':
+                    raise ValueError("Expected '[' at the start of the JSON data.")
+                pos += 1
+                state = first_item
+                continue
+            if state == separator or (state == first_item and char == ']'):
+                if char == ']':
+                    state = end
+                elif char == ',':
+                    state = item
+                else:
+                    raise ValueError("Expected ',' or ']' after an item of the JSON array.")
+                pos += 1
+                continue
+            if state == end:
+                raise ValueError('Extra data after the JSON array.')
+            try:
+                obj, obj_end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # An item which ends with the buffer may be truncated, e.g.
+                # a number, unless there's nothing left to read.
+                if obj_end < len(buffer) or eof:
+                    yield obj
+                    pos = obj_end
+                    state = separator
+                    continue
+        elif eof:
+            break
+        # More data is needed.
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+        else:
+            buffer = buffer[pos:] + chunk
+            pos = 0
+    if state != end:
+        raise ValueError('Unexpected end of the JSON data.')
+
+
 class DjangoJSONEncoder(json.JSONEncoder):
     """
     JSONEncoder subclass that knows how to encode date/time, decimal types, and
@@ -102,3 +204,87 @@ class DjangoJSONEncoder(json.JSONEncoder):
             return str(o)
         else:
             return super().default(o)
+
+
+class JSONBackend:
+    """
+    The default JSON_BACKEND, based on the json module.
+
+    dumps() and dumps_bytes() take the arguments of json.dumps(). The values
+    that JSON doesn't support are encoded by the cls encoder, which defaults
+    to DjangoJSONEncoder.
+    """
+    def dumps(self, obj, cls=DjangoJSONEncoder, **kwargs):
+        """Return obj encoded to a JSON string."""
+        return json.dumps(obj, cls=cls, **kwargs)
+
+    def dumps_bytes(self, obj, cls=DjangoJSONEncoder, **kwargs):
+        """Return obj encoded to UTF-8 JSON bytes."""
+        return self.dumps(obj, cls=cls, **kwargs).encode()
+
+    def loads(self, s, **kwargs):
+        """Return the object decoded from a JSON string or bytes."""
+        return json.loads(s, **kwargs)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    A JSON_BACKEND based on the orjson library, which encodes dates, times,
+    and UUIDs natively and outputs bytes directly.
+
+    Unlike the json module, it doesn't escape non-ASCII characters, it always
+    uses compact separators, and it keeps the microseconds of times. The json
+    module is used for arguments orjson doesn't support, such as a cls other
+    than DjangoJSONEncoder.
+    """
+    def __init__(self):
+        if orjson is None:
+            raise ImproperlyConfigured('OrjsonBackend requires the orjson library.')
+
+    def get_option(self, cls, kwargs):
+        """
+        Return the orjson option for the arguments of json.dumps(), or None if
+        orjson can't honor them.
+        """
+        if cls is not None and cls is not DjangoJSONEncoder:
+            return None
+        option = orjson.OPT_NON_STR_KEYS
+        if cls is None:
+            # Only encode the types the json module supports.
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        else:
+            option |= orjson.OPT_UTC_Z
+        for name, value in kwargs.items():
+            if name == 'sort_keys':
+                if value:
+                    option |= orjson.OPT_SORT_KEYS
+            elif name == 'indent':
+                if value == 2:
+                    option |= orjson.OPT_INDENT_2
+                elif value is not None:
+                    return None
+            # Formatting options that don't change the decoded data.
+            elif name not in {'ensure_ascii', 'separators'}:
+                return None
+        return option
+
+    def dumps(self, obj, cls=DjangoJSONEncoder, **kwargs):
+        return self.dumps_bytes(obj, cls=cls, **kwargs).decode()
+
+    def dumps_bytes(self, obj, cls=DjangoJSONEncoder, **kwargs):
+        option = self.get_option(cls, kwargs)
+        if option is None:
+            return super().dumps(obj, cls=cls, **kwargs).encode()
+        default = None if cls is None else cls().default
+        return orjson.dumps(obj, default=default, option=option)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+@functools.lru_cache()
+def get_json_backend():
+    """Return an instance of the JSON_BACKEND setting."""
+    return import_string(settings.JSON_BACKEND)()
@@ -0,0 +1,63 @@
+"""
+Serialize data to/from JSON Lines
+"""
+
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.json import (
+    DjangoJSONEncoder, get_json_backend, iter_chunks,
+)
+from django.core.serializers.python import (
+    Deserializer as PythonDeserializer, Serializer as PythonSerializer,
+)
+
+
+class Serializer(PythonSerializer):
+    """Convert a queryset to JSON Lines."""
+    internal_use_only = False
+
+    def _init_options(self):
+        self._current = None
+        self.json_kwargs = self.options.copy()
+        self.json_kwargs.pop('stream', None)
+        self.json_kwargs.pop('fields', None)
+        self.json_kwargs.pop('indent', None)
+        self.json_kwargs['separators'] = (',', ': ')
+        self.json_kwargs.setdefault('cls', DjangoJSONEncoder)
+        self._dumps = get_json_backend().dumps
+
+    def start_serialization(self):
+        self._init_options()
+
+    def end_object(self, obj):
+        # self._current has the field data
+        # Write each object at once rather than each token, json.dumps() also
+        # uses the C encoder when possible.
+        self.stream.write(self._dumps(self.get_dump_object(obj), **self.json_kwargs))
+        self.stream.write("\n")
+        self._current = None
+
+    def getvalue(self):
+        # Grandparent super
+        return super(PythonSerializer, self).getvalue()
+
+
+def Deserializer(stream_or_string, **options):
+    """Deserialize a stream or string of JSON Lines data."""
+    loads = get_json_backend().loads
+    try:
+        objects = (loads(line) for line in iter_lines(iter_chunks(stream_or_string)) if line.strip())
+        yield from PythonDeserializer(objects, **options)
+    except (GeneratorExit, DeserializationError):
+        raise
+    except Exception as exc:
+        raise DeserializationError() from exc
+
+
+def iter_lines(chunks):
+    """Yield the lines of an iterable of text chunks."""
+    pending = ''
+    for chunk in chunks:
+        lines = (pending + chunk).split('\n')
+        pending = lines.pop()
+        yield from lines
+    yield pending
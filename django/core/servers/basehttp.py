@@ -7,14 +7,23 @@ This is a simple server for use in testing or debugging Django apps. It hasn't
 been reviewed for security issues. DON'T USE IT FOR PRODUCTION USE!
 """
 
+import atexit
 import logging
+import os
+import queue
+import selectors
+import signal
 import socket
 import socketserver
 import sys
+import threading
+import time
 from wsgiref import simple_server
 
 from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.wsgi import LimitedStream
 from django.core.wsgi import get_wsgi_application
+from django.db import connections
 from django.utils.module_loading import import_string
 
 __all__ = ('WSGIServer', 'WSGIRequestHandler')
@@ -50,8 +59,8 @@ def get_internal_wsgi_application():
 
 
 def is_broken_pipe_error():
-    exc_type, exc_value = sys.exc_info()[:2]
-    return issubclass(exc_type, socket.error) and exc_value.args[0] == 32
+    exc_type, _, _ = sys.exc_info()
+    return issubclass(exc_type, (BrokenPipeError, ConnectionAbortedError, ConnectionResetError))
 
 
 class WSGIServer(simple_server.WSGIServer):
@@ -72,7 +81,53 @@ class WSGIServer(simple_server.WSGIServer):
             super().handle_error(request, client_address)
 
 
-class ThreadedWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+class ThreadPoolMixIn(socketserver.ThreadingMixIn):
+    """
+    If max_threads is set, handle each connection in one of a bounded pool of
+    worker threads rather than in a new thread. Connections wait in a queue
+    while all the workers are busy, and idle persistent connections are closed
+    to free their worker for them.
+    """
+    max_threads = None
+    daemon_threads = True
+    _request_queue = None
+
+    def has_waiting_requests(self):
+        """Return True if connections are waiting for a worker thread."""
+        return self._request_queue is not None and not self._request_queue.empty()
+
+    def process_request(self, request, client_address):
+        if self.max_threads is None:
+            super().process_request(request, client_address)
+            return
+        if self._request_queue is None:
+            self._request_queue = queue.Queue()
+            self._workers = []
+        if len(self._workers) < self.max_threads:
+            worker = threading.Thread(target=self.process_request_queue)
+            worker.daemon = self.daemon_threads
+            worker.start()
+            self._workers.append(worker)
+        self._request_queue.put((request, client_address))
+
+    def process_request_queue(self):
+        while True:
+            item = self._request_queue.get()
+            if item is None:
+                break
+            self.process_request_thread(*item)
+
+    def server_close(self):
+        super().server_close()
+        if self._request_queue is not None:
+            for worker in self._workers:
+                self._request_queue.put(None)
+            if not self.daemon_threads:
+                for worker in self._workers:
+                    worker.join()
+
+
+class ThreadedWSGIServer(ThreadPoolMixIn, WSGIServer):
     """A threaded version of the WSGIServer"""
     pass
 
@@ -80,6 +135,58 @@ class ThreadedWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
 class ServerHandler(simple_server.ServerHandler):
     http_version = '1.1'
 
+    def __init__(self, stdin, stdout, stderr, environ, **kwargs):
+        # Limit the request body to its Content-Length, so that reading it
+        # doesn't consume the next request on a persistent connection.
+        try:
+            content_length = int(environ.get('CONTENT_LENGTH'))
+        except (ValueError, TypeError):
+            content_length = 0
+        super().__init__(LimitedStream(stdin, content_length), stdout, stderr, environ, **kwargs)
+
+    def cleanup_headers(self):
+        super().cleanup_headers()
+        # HTTP/1.1 requires support for persistent connections. Close the
+        # connection if the client asked for it, if the length of the content
+        # is unknown, as its end is marked by closing the connection, or if
+        # the server handles connections one at a time, as a persistent
+        # connection would block other clients.
+        if (self.request_handler.close_connection or
+                'Content-Length' not in self.headers or
+                not isinstance(self.request_handler.server, socketserver.ThreadingMixIn)):
+            self.headers['Connection'] = 'close'
+            self.request_handler.close_connection = True
+
+    def close(self):
+        try:
+            # Discard the unread part of the request body, a chunk at a time
+            # so that a large body isn't held in memory.
+            stdin = self.get_stdin()
+            while stdin._read_limited(64 * 1024):
+                pass
+        finally:
+            super().close()
+
+    def sendfile(self):
+        """
+        Send the file of a FileResponse with socket.sendfile(), which uses
+        os.sendfile() where available to copy it to the socket in the kernel.
+        Return False to send files without a file descriptor in Python.
+        """
+        filelike = self.result.filelike
+        try:
+            filelike.fileno()
+            offset = filelike.tell()
+        except (AttributeError, OSError, ValueError):
+            return False
+        count = self.headers.get('Content-Length')
+        count = int(count) if count else None
+        if not self.headers_sent:
+            self.send_headers()
+        self._flush()
+        self.bytes_sent += self.request_handler.connection.sendfile(filelike, offset, count)
+        return True
+
     def handle_error(self):
         # Ignore broken pipe errors, otherwise pass on
         if not is_broken_pipe_error():
@@ -88,6 +195,9 @@ class ServerHandler(simple_server.ServerHandler):
 
 class WSGIRequestHandler(simple_server.WSGIRequestHandler):
     protocol_version = 'HTTP/1.1'
+    # The number of seconds to wait for the next request on a persistent
+    # connection.
+    keep_alive_timeout = 5
 
     def address_string(self):
         # Short-circuit parent method to not call socket.getfqdn
@@ -135,6 +245,41 @@ class WSGIRequestHandler(simple_server.WSGIRequestHandler):
         return super().get_environ()
 
     def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self.wait_for_request():
+            self.handle_one_request()
+
+    def wait_for_request(self):
+        """
+        Wait up to keep_alive_timeout seconds for the next request on the
+        persistent connection. Return False to close the connection if there
+        isn't any or if other connections are waiting for a worker thread.
+        """
+        # The next request may already be buffered.
+        self.connection.setblocking(False)
+        try:
+            buffered = self.rfile.peek(1)
+        except BlockingIOError:
+            buffered = b''
+        finally:
+            self.connection.settimeout(self.timeout)
+        if buffered:
+            return True
+        has_waiting_requests = getattr(self.server, 'has_waiting_requests', lambda: False)
+        deadline = time.monotonic() + self.keep_alive_timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.connection, selectors.EVENT_READ)
+            while not has_waiting_requests():
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                if selector.select(min(timeout, 0.1)):
+                    return True
+        self.close_connection = True
+        return False
+
+    def handle_one_request(self):
         """Copy of WSGIRequestHandler.handle() but with different ServerHandler"""
         self.raw_requestline = self.rfile.readline(65537)
         if len(self.raw_requestline) > 65536:
@@ -144,6 +289,10 @@ class WSGIRequestHandler(simple_server.WSGIRequestHandler):
             self.send_error(414)
             return
 
+        if not self.raw_requestline:
+            self.close_connection = True
+            return
+
         if not self.parse_request():  # An error code has been sent, just exit
             return
 
@@ -154,10 +303,50 @@ class WSGIRequestHandler(simple_server.WSGIRequestHandler):
         handler.run(self.server.get_app())
 
 
-def run(addr, port, wsgi_handler, ipv6=False, threading=False, server_cls=WSGIServer):
+def fork_workers(httpd, processes):
+    """
+    Fork processes - 1 child processes which serve requests on the listening
+    socket of httpd along with the current process. The children exit when
+    the current process does.
+    """
+    # Database connections can't be shared between processes.
+    connections.close_all()
+    parent_pid = os.getpid()
+    children = []
+    for i in range(processes - 1):
+        pid = os.fork()
+        if pid == 0:
+            # Never run the cleanup of the parent process, such as the
+            # destruction of test databases, in a child.
+            try:
+                threading.Thread(target=watch_parent, args=(parent_pid,), daemon=True).start()
+                httpd.serve_forever()
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    def stop_workers():
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+    atexit.register(stop_workers)
+
+
+def watch_parent(parent_pid):
+    """Exit the current process when its parent process exits."""
+    while os.getppid() == parent_pid:
+        time.sleep(1)
+    os._exit(0)
+
+
+def run(addr, port, wsgi_handler, ipv6=False, threading=False, server_cls=WSGIServer, threads=None, processes=1):
     server_address = (addr, port)
     if threading:
-        httpd_cls = type('WSGIServer', (socketserver.ThreadingMixIn, server_cls), {})
+        attrs = {} if threads is None else {'max_threads': threads}
+        httpd_cls = type('WSGIServer', (ThreadPoolMixIn, server_cls), attrs)
     else:
         httpd_cls = server_cls
     httpd = httpd_cls(server_address, WSGIRequestHandler, ipv6=ipv6)
@@ -170,4 +359,6 @@ def run(addr, port, wsgi_handler, ipv6=False, threading=False, server_cls=WSGISe
         # isn't terminating correctly.
         httpd.daemon_threads = True
     httpd.set_app(wsgi_handler)
+    if processes > 1:
+        fork_workers(httpd, processes)
     httpd.serve_forever()
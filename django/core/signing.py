@@ -35,12 +35,12 @@ These functions make use of all of them.
 
 import base64
 import datetime
-import json
 import re
 import time
 import zlib
 
 from django.conf import settings
+from django.core.serializers.json import get_json_backend
 from django.utils import baseconv
 from django.utils.crypto import constant_time_compare, salted_hmac
 from django.utils.encoding import force_bytes
@@ -80,14 +80,14 @@ def get_cookie_signer(salt='django.core.signing.get_cookie_signer'):
 
 class JSONSerializer:
     """
-    Simple wrapper around json to be used in signing.dumps and
+    Simple wrapper around the JSON_BACKEND to be used in signing.dumps and
     signing.loads.
     """
     def dumps(self, obj):
-        return json.dumps(obj, separators=(',', ':')).encode('latin-1')
+        return get_json_backend().dumps_bytes(obj, cls=None, separators=(',', ':'))
 
     def loads(self, data):
-        return json.loads(data.decode('latin-1'))
+        return get_json_backend().loads(data.decode())
 
 
 def dumps(obj, key=None, salt='django.core.signing', serializer=JSONSerializer, compress=False):
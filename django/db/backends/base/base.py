@@ -1,4 +1,6 @@
+import asyncio
 import copy
+import functools
 import time
 import warnings
 from collections import deque
@@ -531,6 +533,37 @@ class BaseDatabaseWrapper:
                 % (self.alias, self._thread_ident, _thread.get_ident())
             )
 
+    # ##### Async query execution #####
+
+    async def run_async(self, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs), which queries this database synchronously,
+        without blocking the event loop and return its result.
+
+        func() runs on the thread dedicated to this alias, except in an atomic
+        block, where it runs on the current thread so that it's part of the
+        transaction. Backends using a native async driver may override this
+        method.
+        """
+        if self.in_atomic_block:
+            return func(*args, **kwargs)
+        from django.db import connections
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            connections.async_executor(self.alias),
+            functools.partial(self._run_in_async_thread, self.alias, func, args, kwargs),
+        )
+
+    @staticmethod
+    def _run_in_async_thread(alias, func, args, kwargs):
+        from django.db import connections
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # Unlike a request, the thread doesn't end, so apply CONN_MAX_AGE
+            # and discard broken connections after each call.
+            connections[alias].close_if_unusable_or_obsolete()
+
     # ##### Miscellaneous #####
 
     def prepare_database(self):
@@ -1,11 +1,15 @@
+import hashlib
 import os
 import sys
+import tempfile
+from importlib.util import find_spec
 from io import StringIO
 
 from django.apps import apps
 from django.conf import settings
 from django.core import serializers
 from django.db import router
+from django.utils.version import get_version
 
 # The prefix to put on the default database name when creating
 # the test database.
@@ -61,16 +65,29 @@ class BaseDatabaseCreation:
         settings.DATABASES[self.connection.alias]["NAME"] = test_database_name
         self.connection.settings_dict["NAME"] = test_database_name
 
-        # We report migrate messages at one level lower than that requested.
-        # This ensures we don't get flooded with messages during testing
-        # (unless you really ask to be flooded).
-        call_command(
-            'migrate',
-            verbosity=max(verbosity - 1, 0),
-            interactive=False,
-            database=self.connection.alias,
-            run_syncdb=True,
-        )
+        # Restore the snapshot of a database migrated with the same migrations
+        # and models, if any, rather than running the migrations again.
+        snapshot_name = None
+        if self.connection.settings_dict['TEST'].get('SNAPSHOT') and not keepdb:
+            snapshot_name = self._get_test_db_snapshot_name(self._get_test_db_snapshot_key())
+        if snapshot_name and self._restore_test_db_snapshot(snapshot_name, verbosity):
+            if verbosity >= 1:
+                self.log('Restored test database snapshot for alias %s.' % (
+                    self._get_database_display_str(verbosity, test_database_name),
+                ))
+        else:
+            # We report migrate messages at one level lower than that requested.
+            # This ensures we don't get flooded with messages during testing
+            # (unless you really ask to be flooded).
+            call_command(
+                'migrate',
+                verbosity=max(verbosity - 1, 0),
+                interactive=False,
+                database=self.connection.alias,
+                run_syncdb=True,
+            )
+            if snapshot_name:
+                self._create_test_db_snapshot(snapshot_name, verbosity)
 
         # We then serialize the current state of the database into a string
         # and store it on the connection. This slightly horrific process is so people
@@ -196,6 +213,91 @@ class BaseDatabaseCreation:
 
         return test_database_name
 
+    def _get_test_db_snapshot_key(self):
+        """
+        Return a hash of what determines the contents of a freshly migrated
+        test database: the migration files of the apps with migrations and the
+        tables of the apps without migrations.
+        """
+        from django.db.migrations.loader import MigrationLoader
+
+        loader = MigrationLoader(None, ignore_no_migrations=True)
+        hasher = hashlib.md5()
+        hasher.update(('%s\n%s\n' % (get_version(), self.connection.settings_dict['ENGINE'])).encode())
+        unmigrated_models = []
+        for app_config in sorted(apps.get_app_configs(), key=lambda app_config: app_config.label):
+            hasher.update(('%s\n' % app_config.label).encode())
+            if app_config.label in loader.migrated_apps:
+                module_name, _ = loader.migrations_module(app_config.label)
+                for path in self._get_module_files(module_name):
+                    hasher.update(('%s\n' % os.path.basename(path)).encode())
+                    with open(path, 'rb') as f:
+                        hasher.update(f.read())
+            else:
+                unmigrated_models.extend(
+                    model for model in app_config.get_models()
+                    if model._meta.can_migrate(self.connection)
+                )
+        # Tables of apps without migrations are created by migrate's
+        # run_syncdb, so hash the SQL it runs.
+        with self.connection.schema_editor(collect_sql=True, atomic=False) as editor:
+            for model in unmigrated_models:
+                editor.create_model(model)
+        for sql in editor.collected_sql:
+            hasher.update(('%s\n' % sql).encode())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _get_module_files(module_name):
+        """Return the sorted paths of the Python files of a package."""
+        try:
+            spec = find_spec(module_name)
+        except (ImportError, ValueError):
+            return []
+        if spec is None:
+            return []
+        paths = []
+        for location in spec.submodule_search_locations or ():
+            paths.extend(
+                os.path.join(location, name) for name in os.listdir(location)
+                if name.endswith('.py')
+            )
+        return sorted(paths)
+
+    def _get_test_db_snapshot_name(self, key):
+        """
+        Return the name of the snapshot of the test database for a snapshot
+        key, or None if the backend doesn't support snapshots.
+        """
+        return None
+
+    def _create_test_db_snapshot(self, snapshot_name, verbosity):
+        """
+        Internal implementation - save a snapshot of the migrated test db, and
+        remove the snapshots of the previous migrations.
+        """
+        raise NotImplementedError(
+            'subclasses of BaseDatabaseCreation that support snapshots must '
+            'provide a _create_test_db_snapshot() method'
+        )
+
+    def _restore_test_db_snapshot(self, snapshot_name, verbosity):
+        """
+        Internal implementation - replace the test db by a snapshot. Return
+        False if the snapshot doesn't exist.
+        """
+        raise NotImplementedError(
+            'subclasses of BaseDatabaseCreation that support snapshots must '
+            'provide a _restore_test_db_snapshot() method'
+        )
+
+    def _get_test_db_snapshot_dir(self):
+        """
+        Return the directory of snapshot files, for backends storing them in
+        files.
+        """
+        return settings.MIGRATION_CACHE_DIR or os.path.join(tempfile.gettempdir(), 'django_test_snapshots')
+
     def clone_test_db(self, suffix, verbosity=1, autoclobber=False, keepdb=False):
         """
         Clone a test database.
@@ -265,6 +265,17 @@ class BaseDatabaseFeatures:
     # INSERT?
     supports_ignore_conflicts = True
 
+    # Can indexes be added and removed without blocking writes to the table
+    # (see BaseDatabaseSchemaEditor.add_index())? Must this be done outside of
+    # a transaction?
+    supports_online_index_changes = False
+    online_index_changes_require_autocommit = False
+
+    # Can rows be bulk loaded and exported with COPY (see QuerySet.copy_from()
+    # and copy_to())? In which formats?
+    supports_copy = False
+    supported_copy_formats = set()
+
     def __init__(self, connection):
         self.connection = connection
 
@@ -253,6 +253,13 @@ class BaseDatabaseOperations:
         """
         return cursor.lastrowid
 
+    def replication_lag(self, cursor):
+        """
+        Return the number of seconds the database, a replica, lags behind its
+        primary, 0 if it isn't a replica, or None if the backend can't tell.
+        """
+        return None
+
     def lookup_cast(self, lookup_type, internal_type=None):
         """
         Return the string to use in a query when performing lookups
@@ -671,6 +678,22 @@ class BaseDatabaseOperations:
             raise ValueError('Unknown options: %s' % ', '.join(sorted(options.keys())))
         return self.explain_prefix
 
+    def copy_from(self, cursor, table, columns, rows):
+        """
+        Load rows, sequences of values prepared for the database, into the
+        given columns of table with a COPY ... FROM statement. Return the
+        number of rows loaded.
+        """
+        raise NotSupportedError('This backend does not support COPY.')
+
+    def copy_to(self, cursor, sql, params, file, format='csv', header=False):
+        """
+        Write the result of the query sql with params to file, in the given
+        format, with a COPY ... TO statement. Return the number of rows
+        written.
+        """
+        raise NotSupportedError('This backend does not support COPY.')
+
     def insert_statement(self, ignore_conflicts=False):
         return 'INSERT INTO'
 
@@ -8,6 +8,7 @@ from django.db.backends.ddl_references import (
 from django.db.backends.utils import split_identifier
 from django.db.models import Index
 from django.db.transaction import TransactionManagementError, atomic
+from django.db.utils import NotSupportedError
 from django.utils import timezone
 from django.utils.encoding import force_bytes
 
@@ -79,15 +80,20 @@ class BaseDatabaseSchemaEditor:
 
     sql_create_index = "CREATE INDEX %(name)s ON %(table)s (%(columns)s)%(extra)s"
     sql_delete_index = "DROP INDEX %(name)s"
+    sql_create_index_online = None
+    sql_delete_index_online = None
 
     sql_create_pk = "ALTER TABLE %(table)s ADD CONSTRAINT %(name)s PRIMARY KEY (%(columns)s)"
     sql_delete_pk = "ALTER TABLE %(table)s DROP CONSTRAINT %(name)s"
 
     sql_delete_procedure = 'DROP PROCEDURE %(procedure)s'
 
-    def __init__(self, connection, collect_sql=False, atomic=True):
+    def __init__(self, connection, collect_sql=False, atomic=True, progress_callback=None):
         self.connection = connection
         self.collect_sql = collect_sql
+        # Called by long running operations, e.g. RunPythonInBatches, with an
+        # action name and keyword arguments describing their progress.
+        self.progress_callback = progress_callback
         if self.collect_sql:
             self.collected_sql = []
         self.atomic_migration = self.connection.features.can_rollback_ddl and atomic
@@ -337,13 +343,39 @@ class BaseDatabaseSchemaEditor:
             if isinstance(sql, Statement) and sql.references_table(model._meta.db_table):
                 self.deferred_sql.remove(sql)
 
-    def add_index(self, model, index):
-        """Add an index on a model."""
-        self.execute(index.create_sql(model, self))
+    def add_index(self, model, index, online=False):
+        """
+        Add an index on a model. If online is True and the database supports
+        it, build the index without blocking writes to the table.
+        """
+        statement = index.create_sql(model, self)
+        if online and self._can_change_index_online():
+            statement.template = self.sql_create_index_online
+        self.execute(statement)
 
-    def remove_index(self, model, index):
-        """Remove an index from a model."""
-        self.execute(index.remove_sql(model, self))
+    def remove_index(self, model, index, online=False):
+        """
+        Remove an index from a model. If online is True and the database
+        supports it, drop the index without blocking writes to the table.
+        """
+        if online and self._can_change_index_online():
+            self.execute(self.sql_delete_index_online % {
+                'table': self.quote_name(model._meta.db_table),
+                'name': self.quote_name(index.name),
+            })
+        else:
+            self.execute(index.remove_sql(model, self))
+
+    def _can_change_index_online(self):
+        features = self.connection.features
+        if not features.supports_online_index_changes:
+            return False
+        if features.online_index_changes_require_autocommit and self.connection.in_atomic_block:
+            raise NotSupportedError(
+                '%s cannot change indexes online inside a transaction. Set '
+                'atomic = False on the migration.' % self.connection.display_name
+            )
+        return True
 
     def add_constraint(self, model, constraint):
         """Add a check constraint to a model."""
@@ -1,3 +1,5 @@
+import glob
+import os
 import subprocess
 import sys
 
@@ -70,3 +72,32 @@ class DatabaseCreation(BaseDatabaseCreation):
         load_proc = subprocess.Popen(load_cmd, stdin=dump_proc.stdout, stdout=subprocess.PIPE)
         dump_proc.stdout.close()    # allow dump_proc to receive a SIGPIPE if load_proc exits.
         load_proc.communicate()
+
+    def _get_test_db_snapshot_name(self, key):
+        return os.path.join(
+            self._get_test_db_snapshot_dir(),
+            'test-%s-%s.sql' % (self.connection.alias, key),
+        )
+
+    def _create_test_db_snapshot(self, snapshot_name, verbosity):
+        directory = os.path.dirname(snapshot_name)
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, 'test-%s-*.sql' % glob.escape(self.connection.alias))):
+            if path != snapshot_name:
+                os.remove(path)
+        dump_cmd = DatabaseClient.settings_to_cmd_args(self.connection.settings_dict)
+        dump_cmd[0] = 'mysqldump'
+        dump_cmd[-1] = self.connection.settings_dict['NAME']
+        tmp_name = '%s.%d.tmp' % (snapshot_name, os.getpid())
+        with open(tmp_name, 'wb') as f:
+            subprocess.check_call(dump_cmd, stdout=f)
+        os.replace(tmp_name, snapshot_name)
+
+    def _restore_test_db_snapshot(self, snapshot_name, verbosity):
+        if not os.path.exists(snapshot_name):
+            return False
+        load_cmd = DatabaseClient.settings_to_cmd_args(self.connection.settings_dict)
+        load_cmd[-1] = self.connection.settings_dict['NAME']
+        with open(snapshot_name, 'rb') as f:
+            subprocess.check_call(load_cmd, stdin=f)
+        return True
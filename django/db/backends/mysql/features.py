@@ -65,6 +65,10 @@ class DatabaseFeatures(BaseDatabaseFeatures):
         "Confirm support for introspected foreign keys"
         return self._mysql_storage_engine != 'MyISAM'
 
+    @cached_property
+    def supports_online_index_changes(self):
+        return self._mysql_storage_engine != 'MyISAM'
+
     @cached_property
     def has_zoneinfo_database(self):
         # Test if the time zone definitions are installed.
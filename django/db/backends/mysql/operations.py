@@ -152,6 +152,17 @@ class DatabaseOperations(BaseDatabaseOperations):
     def random_function_sql(self):
         return 'RAND()'
 
+    def replication_lag(self, cursor):
+        cursor.execute('SHOW SLAVE STATUS')
+        row = cursor.fetchone()
+        if row is None:
+            # Not a replica.
+            return 0
+        columns = [column[0] for column in cursor.description]
+        lag = row[columns.index('Seconds_Behind_Master')]
+        # NULL means that replication isn't running.
+        return float('inf') if lag is None else float(lag)
+
     def sql_flush(self, style, tables, sequences, allow_cascade=False):
         # NB: The generated SQL below is specific to MySQL
         # 'TRUNCATE x;', 'TRUNCATE y;', 'TRUNCATE z;'... style SQL statements
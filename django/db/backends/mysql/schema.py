@@ -20,6 +20,8 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
     sql_delete_fk = "ALTER TABLE %(table)s DROP FOREIGN KEY %(name)s"
 
     sql_delete_index = "DROP INDEX %(name)s ON %(table)s"
+    sql_create_index_online = "CREATE INDEX %(name)s ON %(table)s (%(columns)s)%(extra)s ALGORITHM=INPLACE LOCK=NONE"
+    sql_delete_index_online = "DROP INDEX %(name)s ON %(table)s ALGORITHM=INPLACE LOCK=NONE"
 
     sql_create_pk = "ALTER TABLE %(table)s ADD CONSTRAINT %(name)s PRIMARY KEY (%(columns)s)"
     sql_delete_pk = "ALTER TABLE %(table)s DROP PRIMARY KEY"
@@ -75,3 +75,39 @@ class DatabaseCreation(BaseDatabaseCreation):
                 except Exception as e:
                     self.log('Got an error cloning the test database: %s' % e)
                     sys.exit(2)
+
+    def _get_test_db_snapshot_name(self, key):
+        # PostgreSQL truncates identifiers to 63 characters.
+        return '%s_snapshot_%s' % (self.connection.settings_dict['NAME'][:40], key[:12])
+
+    def _create_test_db_snapshot(self, snapshot_name, verbosity):
+        # CREATE DATABASE ... WITH TEMPLATE ... requires closing connections
+        # to the template database.
+        self.connection.close()
+        prefix = snapshot_name[:-12]
+        with self._nodb_connection.cursor() as cursor:
+            # Drop the snapshots of previous migrations.
+            cursor.execute(
+                "SELECT datname FROM pg_catalog.pg_database WHERE datname LIKE %s",
+                [prefix.replace('\\', '\\\\').replace('_', '\\_').replace('%', '\\%') + '%'],
+            )
+            for (database_name,) in cursor.fetchall():
+                if database_name != snapshot_name:
+                    cursor.execute('DROP DATABASE %s' % self._quote_name(database_name))
+            cursor.execute('CREATE DATABASE %s %s' % (
+                self._quote_name(snapshot_name),
+                self._get_database_create_suffix(template=self.connection.settings_dict['NAME']),
+            ))
+
+    def _restore_test_db_snapshot(self, snapshot_name, verbosity):
+        self.connection.close()
+        test_database_name = self.connection.settings_dict['NAME']
+        with self._nodb_connection.cursor() as cursor:
+            if not self._database_exists(cursor, snapshot_name):
+                return False
+            cursor.execute('DROP DATABASE %s' % self._quote_name(test_database_name))
+            cursor.execute('CREATE DATABASE %s %s' % (
+                self._quote_name(test_database_name),
+                self._get_database_create_suffix(template=snapshot_name),
+            ))
+        return True
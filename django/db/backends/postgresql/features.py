@@ -30,6 +30,10 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     requires_sqlparse_for_splitting = False
     greatest_least_ignores_nulls = True
     can_clone_databases = True
+    supports_online_index_changes = True
+    online_index_changes_require_autocommit = True
+    supports_copy = True
+    supported_copy_formats = {'BINARY', 'CSV', 'TEXT'}
     supports_temporal_subtraction = True
     supports_slicing_ordering_in_compound = True
     create_test_procedure_without_params_sql = """
@@ -4,6 +4,8 @@ from django.conf import settings
 from django.db import NotSupportedError
 from django.db.backends.base.operations import BaseDatabaseOperations
 
+from .utils import CopyReader
+
 
 class DatabaseOperations(BaseDatabaseOperations):
     cast_char_field_without_max_length = 'varchar'
@@ -74,6 +76,23 @@ class DatabaseOperations(BaseDatabaseOperations):
         """
         return [item[0] for item in cursor.fetchall()]
 
+    def replication_lag(self, cursor):
+        # PostgreSQL 10 renamed the pg_last_xlog_*_location() functions.
+        if self.connection.features.is_postgresql_10:
+            receive, replay = 'pg_last_wal_receive_lsn()', 'pg_last_wal_replay_lsn()'
+        else:
+            receive, replay = 'pg_last_xlog_receive_location()', 'pg_last_xlog_replay_location()'
+        cursor.execute(
+            "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+            "WHEN %s = %s THEN 0 "
+            "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END" % (receive, replay)
+        )
+        lag = cursor.fetchone()[0]
+        # A replica that has replayed everything it received isn't lagging,
+        # even if the primary has been idle since the last replayed
+        # transaction. NULL means that no transaction has been replayed yet.
+        return float('inf') if lag is None else float(lag)
+
     def lookup_cast(self, lookup_type, internal_type=None):
         lookup = '%s'
 
@@ -278,5 +297,29 @@ class DatabaseOperations(BaseDatabaseOperations):
             prefix += ' (%s)' % ', '.join('%s %s' % i for i in extra.items())
         return prefix
 
+    def copy_from(self, cursor, table, columns, rows):
+        sql = 'COPY %s (%s) FROM STDIN' % (
+            self.quote_name(table), ', '.join(self.quote_name(column) for column in columns),
+        )
+        cursor.copy_expert(sql, CopyReader(rows))
+        return cursor.rowcount
+
+    def copy_to(self, cursor, sql, params, file, format='csv', header=False):
+        supported_formats = self.connection.features.supported_copy_formats
+        normalized_format = format.upper()
+        if normalized_format not in supported_formats:
+            raise ValueError('%s is not a recognized format. Allowed formats: %s' % (
+                normalized_format, ', '.join(sorted(supported_formats)),
+            ))
+        if header and normalized_format != 'CSV':
+            raise ValueError('header is only supported with the CSV format.')
+        options = ['FORMAT %s' % normalized_format]
+        if header:
+            options.append('HEADER')
+        # COPY doesn't take parameters.
+        query = cursor.mogrify(sql, params).decode()
+        cursor.copy_expert('COPY (%s) TO STDOUT WITH (%s)' % (query, ', '.join(options)), file)
+        return cursor.rowcount
+
     def ignore_conflicts_suffix_sql(self, ignore_conflicts=None):
         return 'ON CONFLICT DO NOTHING' if ignore_conflicts else super().ignore_conflicts_suffix_sql(ignore_conflicts)
@@ -1,3 +1,7 @@
+import datetime
+
+from psycopg2.extras import Inet, Json, Range
+
 from django.utils.timezone import utc
 
 
@@ -5,3 +9,89 @@ def utc_tzinfo_factory(offset):
     if offset != 0:
         raise AssertionError("database connection isn't set to UTC")
     return utc
+
+
+# Characters escaped in the text format of COPY.
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def quote_copy_element(text):
+    """Quote an element of an array, hstore, or range literal."""
+    return '"%s"' % text.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def copy_text(value):
+    """
+    Return the text PostgreSQL parses as value, a value prepared for the
+    database (e.g. by Field.get_db_prep_save()), in COPY ... FROM.
+    """
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    if isinstance(value, datetime.timedelta):
+        return '%d days %d seconds %d microseconds' % (value.days, value.seconds, value.microseconds)
+    if isinstance(value, (list, tuple)):
+        return '{%s}' % ','.join(
+            'NULL' if item is None else
+            copy_text(item) if isinstance(item, (list, tuple)) else
+            quote_copy_element(copy_text(item))
+            for item in value
+        )
+    if isinstance(value, dict):
+        # hstore
+        return ', '.join(
+            '%s=>%s' % (quote_copy_element(key), 'NULL' if item is None else quote_copy_element(item))
+            for key, item in value.items()
+        )
+    if isinstance(value, Json):
+        return value.dumps(value.adapted)
+    if isinstance(value, Inet):
+        return str(value.addr)
+    if isinstance(value, Range):
+        if value.isempty:
+            return 'empty'
+        return '%s%s,%s%s' % (
+            '[' if value.lower_inc else '(',
+            '' if value.lower is None else quote_copy_element(copy_text(value.lower)),
+            '' if value.upper is None else quote_copy_element(copy_text(value.upper)),
+            ']' if value.upper_inc else ')',
+        )
+    # psycopg2.Binary()
+    adapted = getattr(value, 'adapted', None)
+    if isinstance(adapted, (bytes, bytearray, memoryview)):
+        return copy_text(adapted)
+    return str(value)
+
+
+class CopyReader:
+    """
+    File-like object for COPY ... FROM STDIN which encodes rows in the text
+    format of COPY as they're read, so that all the rows aren't in memory at
+    once.
+    """
+    def __init__(self, rows):
+        self.rows = iter(rows)
+        self.buffer = b''
+
+    def encode_row(self, row):
+        return '\t'.join(
+            '\\N' if value is None else copy_text(value).translate(COPY_ESCAPES)
+            for value in row
+        ) + '\n'
+
+    def read(self, size=-1):
+        lines = [self.buffer]
+        length = len(self.buffer)
+        while size < 0 or length < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            line = self.encode_row(row).encode()
+            lines.append(line)
+            length += len(line)
+        data = b''.join(lines)
+        if size < 0:
+            size = length
+        self.buffer = data[size:]
+        return data[:size]
@@ -1,6 +1,9 @@
+import glob
 import os
 import shutil
 import sys
+from contextlib import closing
+from sqlite3 import dbapi2 as Database
 
 from django.db.backends.base.creation import BaseDatabaseCreation
 
@@ -78,6 +81,45 @@ class DatabaseCreation(BaseDatabaseCreation):
                 self.log('Got an error cloning the test database: %s' % e)
                 sys.exit(2)
 
+    def _get_test_db_snapshot_name(self, key):
+        if self.is_in_memory_db(self.connection.settings_dict['NAME']) and not hasattr(Database.Connection, 'backup'):
+            # Copying in-memory databases requires the backup API (Python 3.7+).
+            return None
+        return os.path.join(
+            self._get_test_db_snapshot_dir(),
+            'test-%s-%s.sqlite3' % (self.connection.alias, key),
+        )
+
+    def _create_test_db_snapshot(self, snapshot_name, verbosity):
+        directory, filename = os.path.split(snapshot_name)
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, 'test-%s-*.sqlite3' % glob.escape(self.connection.alias))):
+            if path != snapshot_name:
+                os.remove(path)
+        tmp_name = '%s.%d.tmp' % (snapshot_name, os.getpid())
+        source_database_name = self.connection.settings_dict['NAME']
+        if self.is_in_memory_db(source_database_name):
+            self.connection.ensure_connection()
+            with closing(Database.connect(tmp_name)) as target:
+                self.connection.connection.backup(target)
+        else:
+            self.connection.close()
+            shutil.copy(source_database_name, tmp_name)
+        os.replace(tmp_name, snapshot_name)
+
+    def _restore_test_db_snapshot(self, snapshot_name, verbosity):
+        if not os.path.exists(snapshot_name):
+            return False
+        target_database_name = self.connection.settings_dict['NAME']
+        if self.is_in_memory_db(target_database_name):
+            self.connection.ensure_connection()
+            with closing(Database.connect(snapshot_name)) as source:
+                source.backup(self.connection.connection)
+        else:
+            self.connection.close()
+            shutil.copy(snapshot_name, target_database_name)
+        return True
+
     def _destroy_test_db(self, test_database_name, verbosity):
         if test_database_name and not self.is_in_memory_db(test_database_name):
             # Remove the SQLite database file
@@ -12,6 +12,7 @@ from django.db.migrations.questioner import MigrationQuestioner
 from django.db.migrations.utils import (
     COMPILED_REGEX_TYPE, RegexObject, get_migration_name_timestamp,
 )
+from django.utils.functional import cached_property
 
 from .topological_sort import stable_topological_sort
 
@@ -125,38 +126,48 @@ class MigrationAutodetector:
         self.altered_constraints = {}
 
         # Prepare some old/new state and model lists, separating
-        # proxy models and ignoring unmigrated apps.
-        self.old_apps = self.from_state.concrete_apps
-        self.new_apps = self.to_state.apps
+        # proxy models and ignoring unmigrated apps. Model states are used
+        # rather than rendered models so that the states don't need to be
+        # rendered at all when nothing changed.
         self.old_model_keys = set()
         self.old_proxy_keys = set()
         self.old_unmanaged_keys = set()
         self.new_model_keys = set()
         self.new_proxy_keys = set()
         self.new_unmanaged_keys = set()
-        for al, mn in self.from_state.models:
-            model = self.old_apps.get_model(al, mn)
-            if not model._meta.managed:
+        for (al, mn), model_state in self.from_state.models.readonly_items():
+            if not model_state.options.get('managed', True):
                 self.old_unmanaged_keys.add((al, mn))
             elif al not in self.from_state.real_apps:
-                if model._meta.proxy:
+                if model_state.options.get('proxy', False):
                     self.old_proxy_keys.add((al, mn))
                 else:
                     self.old_model_keys.add((al, mn))
 
-        for al, mn in self.to_state.models:
-            model = self.new_apps.get_model(al, mn)
-            if not model._meta.managed:
+        for (al, mn), model_state in self.to_state.models.readonly_items():
+            if not model_state.options.get('managed', True):
                 self.new_unmanaged_keys.add((al, mn))
             elif (
                 al not in self.from_state.real_apps or
                 (convert_apps and al in convert_apps)
             ):
-                if model._meta.proxy:
+                if model_state.options.get('proxy', False):
                     self.new_proxy_keys.add((al, mn))
                 else:
                     self.new_model_keys.add((al, mn))
 
+        # Skip the models which are the same in both states, and everything
+        # if no model was added, removed, or changed.
+        self.unchanged_model_keys = self._get_unchanged_model_keys()
+        if (self.old_model_keys == self.new_model_keys and
+                self.old_proxy_keys == self.new_proxy_keys and
+                self.old_unmanaged_keys == self.new_unmanaged_keys and
+                self.unchanged_model_keys.issuperset(
+                    self.old_model_keys | self.old_proxy_keys | self.old_unmanaged_keys
+                )):
+            self.migrations = {}
+            return self.migrations
+
         # Renames have to come first
         self.generate_renamed_models()
 
@@ -198,15 +209,54 @@ class MigrationAutodetector:
 
         return self.migrations
 
+    @cached_property
+    def old_apps(self):
+        return self.from_state.concrete_apps
+
+    @cached_property
+    def new_apps(self):
+        return self.to_state.apps
+
+    def get_model_fingerprint(self, model_state):
+        """
+        Return what the generate_*() methods compare between the old and the
+        new state of a model. No operation is needed for a model whose
+        fingerprint is the same in both states.
+        """
+        return (
+            sorted((name, self.deep_deconstruct(field)) for name, field in model_state.fields),
+            model_state.options,
+            model_state.bases,
+            model_state.managers,
+        )
+
+    def _get_unchanged_model_keys(self):
+        """
+        Return the keys of the models that have the same fingerprint and are
+        of the same kind (concrete, proxy, or unmanaged) in both states.
+        """
+        unchanged = set()
+        for old_keys, new_keys in (
+            (self.old_model_keys, self.new_model_keys),
+            (self.old_proxy_keys, self.new_proxy_keys),
+            (self.old_unmanaged_keys, self.new_unmanaged_keys),
+        ):
+            for key in old_keys & new_keys:
+                old_model_state = self.from_state.models.readonly_get(key)
+                new_model_state = self.to_state.models.readonly_get(key)
+                if self.get_model_fingerprint(old_model_state) == self.get_model_fingerprint(new_model_state):
+                    unchanged.add(key)
+        return unchanged
+
     def _prepare_field_lists(self):
         """
         Prepare field lists and a list of the fields that used through models
         in the old state so dependencies can be made from the through model
         deletion to the field that uses it.
         """
-        self.kept_model_keys = self.old_model_keys & self.new_model_keys
-        self.kept_proxy_keys = self.old_proxy_keys & self.new_proxy_keys
-        self.kept_unmanaged_keys = self.old_unmanaged_keys & self.new_unmanaged_keys
+        self.kept_model_keys = (self.old_model_keys & self.new_model_keys) - self.unchanged_model_keys
+        self.kept_proxy_keys = (self.old_proxy_keys & self.new_proxy_keys) - self.unchanged_model_keys
+        self.kept_unmanaged_keys = (self.old_unmanaged_keys & self.new_unmanaged_keys) - self.unchanged_model_keys
         self.through_users = {}
         self.old_field_keys = {
             (app_label, model_name, x)
@@ -224,7 +274,7 @@ class MigrationAutodetector:
 
     def _generate_through_model_map(self):
         """Through model map generation."""
-        for app_label, model_name in sorted(self.old_model_keys):
+        for app_label, model_name in sorted(self.old_model_keys - self.unchanged_model_keys):
             old_model_name = self.renamed_models.get((app_label, model_name), model_name)
             old_model_state = self.from_state.models[app_label, old_model_name]
             for field_name, field in old_model_state.fields:
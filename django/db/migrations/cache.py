@@ -0,0 +1,234 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from importlib import import_module
+from importlib.util import find_spec
+
+from django.conf import settings
+from django.utils.functional import cached_property
+from django.utils.version import get_version
+
+from .migration import SwappableTuple
+
+
+class CachedMigration:
+    """
+    Stand in for a migration read from the migration cache. The attributes
+    needed to build the migration graph are available right away, the
+    migration module is only imported when anything else is accessed.
+    """
+    def __init__(self, name, app_label, module_name, dependencies, run_before, replaces, initial, atomic):
+        self.name = name
+        self.app_label = app_label
+        self.module_name = module_name
+        self.dependencies = dependencies
+        self.run_before = run_before
+        self.replaces = replaces
+        self.initial = initial
+        self.atomic = atomic
+
+    @cached_property
+    def migration(self):
+        """The migration loaded from its module."""
+        return import_module(self.module_name).Migration(self.name, self.app_label)
+
+    def __getattr__(self, name):
+        if name.startswith('__') or 'module_name' not in self.__dict__:
+            raise AttributeError(name)
+        return getattr(self.migration, name)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, CachedMigration) and
+            self.name == other.name and
+            self.app_label == other.app_label
+        )
+
+    def __repr__(self):
+        return "<Migration %s.%s>" % (self.app_label, self.name)
+
+    def __str__(self):
+        return "%s.%s" % (self.app_label, self.name)
+
+    def __hash__(self):
+        return hash("%s.%s" % (self.app_label, self.name))
+
+
+class StateCache(dict):
+    """
+    Cache of the project states of a migration graph (see
+    MigrationGraph.make_plan_state()) which is persisted in a directory.
+
+    Clearing it, which the graph does whenever it changes, stops persisting
+    it since the states no longer match the migration files.
+    """
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+
+    def _get_path(self, key):
+        plan, real_apps = key
+        digest = hashlib.md5(repr((sorted(plan), sorted(real_apps))).encode()).hexdigest()
+        return os.path.join(self.directory, 'state-%s.pickle' % digest)
+
+    def __missing__(self, key):
+        if self.directory is None:
+            raise KeyError(key)
+        try:
+            with open(self._get_path(key), 'rb') as f:
+                project_state = pickle.load(f)
+        except Exception:
+            # A missing, corrupt, or outdated file, e.g. referring to a field
+            # class that no longer exists.
+            raise KeyError(key)
+        super().__setitem__(key, project_state)
+        return project_state
+
+    def __setitem__(self, key, project_state):
+        super().__setitem__(key, project_state)
+        if self.directory is not None:
+            _write(self._get_path(key), project_state)
+
+    def clear(self):
+        super().clear()
+        self.directory = None
+
+
+def _write(path, value):
+    """
+    Pickle value into path atomically. Ignore values which can't be pickled,
+    such as states with a lambda as a field default.
+    """
+    try:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory)
+    try:
+        with open(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class MigrationCache:
+    """
+    Persist the migrations loaded from disk and the project states built from
+    them in settings.MIGRATION_CACHE_DIR, so that later runs don't need to
+    import the migration modules and replay their operations as long as the
+    migration files don't change.
+
+    The cache entries are keyed on the modification times and sizes of the
+    files in the migration modules, the installed apps, and the settings
+    which change how migrations are loaded.
+    """
+    def __init__(self, directory, modules, ignore_no_migrations=False):
+        """
+        `modules` is a list of (app_label, module_name, explicit) tuples as
+        returned by MigrationLoader.migrations_module().
+        """
+        self.directory = os.path.join(directory, self.get_fingerprint(modules, ignore_no_migrations))
+
+    @classmethod
+    def get_fingerprint(cls, modules, ignore_no_migrations):
+        parts = [
+            get_version(), sys.version, settings.AUTH_USER_MODEL, ignore_no_migrations,
+        ]
+        for app_label, module_name, explicit in modules:
+            parts.append((app_label, module_name, explicit, cls.get_files(module_name)))
+        return hashlib.md5(repr(parts).encode()).hexdigest()
+
+    @staticmethod
+    def get_files(module_name):
+        """
+        Return the (path, modification time, size) of the files of a module
+        without importing it.
+        """
+        if module_name is None:
+            return None
+        try:
+            spec = find_spec(module_name)
+        except (ImportError, ValueError):
+            return None
+        if spec is None:
+            return None
+        paths = set()
+        for location in spec.submodule_search_locations or ():
+            try:
+                entries = list(os.scandir(location))
+            except OSError:
+                continue
+            paths.update(entry.path for entry in entries if entry.name != '__pycache__')
+        if spec.has_location:
+            paths.add(spec.origin)
+        files = []
+        for path in sorted(paths):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((path, stat.st_mtime_ns, stat.st_size))
+        return files
+
+    @property
+    def migrations_path(self):
+        return os.path.join(self.directory, 'migrations.pickle')
+
+    def load_migrations(self):
+        """
+        Return (disk_migrations, migrated_apps, unmigrated_apps) as set by
+        MigrationLoader.load_disk(), or None if they aren't cached.
+        """
+        try:
+            with open(self.migrations_path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception:
+            # A missing, corrupt, or outdated file.
+            return None
+        # Swappable dependencies depend on the settings when the migrations
+        # were imported.
+        for setting, value in data['swappable_settings'].items():
+            if getattr(settings, setting, None) != value:
+                return None
+        disk_migrations = {}
+        for key, attrs in data['migrations'].items():
+            attrs['dependencies'] = [
+                SwappableTuple(dependency, setting) if setting else dependency
+                for dependency, setting in attrs['dependencies']
+            ]
+            disk_migrations[key] = CachedMigration(key[1], key[0], **attrs)
+        return disk_migrations, data['migrated_apps'], data['unmigrated_apps']
+
+    def save_migrations(self, disk_migrations, migrated_apps, unmigrated_apps):
+        migrations = {}
+        swappable_settings = {}
+        for key, migration in disk_migrations.items():
+            dependencies = []
+            for dependency in migration.dependencies:
+                setting = getattr(dependency, 'setting', None)
+                if setting:
+                    swappable_settings[setting] = getattr(settings, setting, None)
+                dependencies.append((tuple(dependency), setting))
+            migrations[key] = {
+                'module_name': migration.__class__.__module__,
+                'dependencies': dependencies,
+                'run_before': list(migration.run_before),
+                'replaces': list(migration.replaces),
+                'initial': migration.initial,
+                'atomic': migration.atomic,
+            }
+        _write(self.migrations_path, {
+            'migrations': migrations,
+            'migrated_apps': migrated_apps,
+            'unmigrated_apps': unmigrated_apps,
+            'swappable_settings': swappable_settings,
+        })
+
+    def get_state_cache(self):
+        return StateCache(self.directory)
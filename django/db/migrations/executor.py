@@ -66,7 +66,7 @@ class MigrationExecutor:
         Create a project state including all the applications without
         migrations and applied migrations if with_applied_migrations=True.
         """
-        state = ProjectState(real_apps=list(self.loader.unmigrated_apps))
+        real_apps = list(self.loader.unmigrated_apps)
         if with_applied_migrations:
             # Create the forwards plan Django would follow on an empty database
             full_plan = self.migration_plan(self.loader.graph.leaf_nodes(), clean_start=True)
@@ -74,10 +74,14 @@ class MigrationExecutor:
                 self.loader.graph.nodes[key] for key in self.loader.applied_migrations
                 if key in self.loader.graph.nodes
             }
-            for migration, _ in full_plan:
-                if migration in applied_migrations:
-                    migration.mutate_state(state, preserve=False)
-        return state
+            # The graph caches the rendered state of each set of applied
+            # migrations.
+            plan = [
+                (migration.app_label, migration.name) for migration, _ in full_plan
+                if migration in applied_migrations
+            ]
+            return self.loader.graph.make_plan_state(plan, real_apps=real_apps)
+        return ProjectState(real_apps=real_apps)
 
     def migrate(self, targets, plan=None, state=None, fake=False, fake_initial=False):
         """
@@ -218,7 +222,9 @@ class MigrationExecutor:
         statements = []
         state = None
         for migration, backwards in plan:
-            with self.connection.schema_editor(collect_sql=True, atomic=migration.atomic) as schema_editor:
+            with self.connection.schema_editor(
+                collect_sql=True, atomic=migration.is_atomic(self.connection)
+            ) as schema_editor:
                 if state is None:
                     state = self.loader.project_state((migration.app_label, migration.name), at_end=False)
                 if not backwards:
@@ -240,7 +246,10 @@ class MigrationExecutor:
                     fake = True
             if not fake:
                 # Alright, do it normally
-                with self.connection.schema_editor(atomic=migration.atomic) as schema_editor:
+                with self.connection.schema_editor(
+                    atomic=migration.is_atomic(self.connection),
+                    progress_callback=self._operation_progress_callback(migration),
+                ) as schema_editor:
                     state = migration.apply(state, schema_editor)
         # For replacement migrations, record individual statuses
         if migration.replaces:
@@ -258,7 +267,10 @@ class MigrationExecutor:
         if self.progress_callback:
             self.progress_callback("unapply_start", migration, fake)
         if not fake:
-            with self.connection.schema_editor(atomic=migration.atomic) as schema_editor:
+            with self.connection.schema_editor(
+                atomic=migration.is_atomic(self.connection),
+                progress_callback=self._operation_progress_callback(migration),
+            ) as schema_editor:
                 state = migration.unapply(state, schema_editor)
         # For replacement migrations, record individual statuses
         if migration.replaces:
@@ -271,6 +283,14 @@ class MigrationExecutor:
             self.progress_callback("unapply_success", migration, fake)
         return state
 
+    def _operation_progress_callback(self, migration):
+        """
+        Return the callback through which the operations of a migration report
+        their progress, e.g. the batches of RunPythonInBatches.
+        """
+        if self.progress_callback:
+            return lambda action, **kwargs: self.progress_callback(action, migration, **kwargs)
+
     def check_replacements(self):
         """
         Mark replacement migrations applied if their replaced set all are.
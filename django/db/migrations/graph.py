@@ -123,6 +123,7 @@ class MigrationGraph:
         self.node_map = {}
         self.nodes = {}
         self.cached = False
+        self.state_cache = {}
 
     def add_node(self, key, migration):
         # If the key already exists, then it must be a dummy node.
@@ -243,6 +244,7 @@ class MigrationGraph:
         [n.raise_error() for n in self.node_map.values() if isinstance(n, DummyNode)]
 
     def clear_cache(self):
+        self.state_cache.clear()
         if self.cached:
             for node in self.nodes:
                 self.node_map[node].__dict__.pop('_ancestors', None)
@@ -353,12 +355,12 @@ class MigrationGraph:
         return len(self.nodes), sum(len(node.parents) for node in self.node_map.values())
 
     def _generate_plan(self, nodes, at_end):
-        plan = []
+        plan = OrderedSet()
         for node in nodes:
             for migration in self.forwards_plan(node):
-                if migration not in plan and (at_end or migration not in nodes):
-                    plan.append(migration)
-        return plan
+                if at_end or migration not in nodes:
+                    plan.add(migration)
+        return list(plan)
 
     def make_state(self, nodes=None, at_end=True, real_apps=None):
         """
@@ -373,10 +375,28 @@ class MigrationGraph:
         if not isinstance(nodes[0], tuple):
             nodes = [nodes]
         plan = self._generate_plan(nodes, at_end)
-        project_state = ProjectState(real_apps=real_apps)
-        for node in plan:
-            project_state = self.nodes[node].mutate_state(project_state, preserve=False)
-        return project_state
+        return self.make_plan_state(plan, real_apps=real_apps)
+
+    def make_plan_state(self, plan, real_apps=None):
+        """
+        Return a ProjectState with the migrations of the given plan, a list of
+        nodes, applied in order.
+
+        The state is cached per set of nodes until the graph changes and each
+        call returns a clone of it. Its models are rendered when it's requested
+        again, so that later clones share them.
+        """
+        key = (frozenset(plan), frozenset(real_apps or ()))
+        try:
+            project_state = self.state_cache[key]
+        except KeyError:
+            project_state = ProjectState(real_apps=real_apps)
+            for node in plan:
+                project_state = self.nodes[node].mutate_state(project_state, preserve=False)
+            self.state_cache[key] = project_state
+        else:
+            project_state.apps  # Render all -- performance critical
+        return project_state.clone()
 
     def __contains__(self, node):
         return node in self.nodes
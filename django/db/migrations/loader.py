@@ -4,6 +4,7 @@ from importlib import import_module, reload
 
 from django.apps import apps
 from django.conf import settings
+from django.db.migrations.cache import MigrationCache
 from django.db.migrations.graph import MigrationGraph
 from django.db.migrations.recorder import MigrationRecorder
 
@@ -45,6 +46,7 @@ class MigrationLoader:
         self.disk_migrations = None
         self.applied_migrations = None
         self.ignore_no_migrations = ignore_no_migrations
+        self.cache = None
         if load:
             self.build_graph()
 
@@ -61,8 +63,32 @@ class MigrationLoader:
             app_package_name = apps.get_app_config(app_label).name
             return '%s.%s' % (app_package_name, MIGRATIONS_MODULE_NAME), False
 
+    def get_cache(self):
+        """
+        Return the MigrationCache for the installed apps if the
+        MIGRATION_CACHE_DIR setting is set, None otherwise.
+        """
+        if settings.MIGRATION_CACHE_DIR is None:
+            return None
+        modules = [
+            (app_config.label, *self.migrations_module(app_config.label))
+            for app_config in apps.get_app_configs()
+        ]
+        return MigrationCache(settings.MIGRATION_CACHE_DIR, modules, self.ignore_no_migrations)
+
     def load_disk(self):
         """Load the migrations from all INSTALLED_APPS from disk."""
+        self.cache = self.get_cache()
+        if self.cache is not None:
+            cached = self.cache.load_migrations()
+            if cached is not None:
+                self.disk_migrations, self.migrated_apps, self.unmigrated_apps = cached
+                return
+        self._load_disk()
+        if self.cache is not None:
+            self.cache.save_migrations(self.disk_migrations, self.migrated_apps, self.unmigrated_apps)
+
+    def _load_disk(self):
         self.disk_migrations = {}
         self.unmigrated_apps = set()
         self.migrated_apps = set()
@@ -268,6 +294,9 @@ class MigrationLoader:
                         exc.node
                     ) from exc
             raise exc
+        if self.cache is not None:
+            # Reuse the project states of earlier runs.
+            self.graph.state_cache = self.cache.get_state_cache()
 
     def check_consistent_history(self, connection):
         """
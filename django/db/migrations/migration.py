@@ -73,6 +73,16 @@ class Migration:
     def __hash__(self):
         return hash("%s.%s" % (self.app_label, self.name))
 
+    def is_atomic(self, connection):
+        """
+        Return whether the migration is applied inside a transaction on the
+        given connection, i.e. it's atomic and none of its operations need to
+        run outside of a transaction, like indexes created online.
+        """
+        return self.atomic and all(
+            operation.can_run_in_transaction(connection) for operation in self.operations
+        )
+
     def mutate_state(self, project_state, preserve=True):
         """
         Take a ProjectState and return a new one with the migration's
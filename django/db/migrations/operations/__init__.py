@@ -5,13 +5,15 @@ from .models import (
     AlterUniqueTogether, CreateModel, DeleteModel, RemoveConstraint,
     RemoveIndex, RenameModel,
 )
-from .special import RunPython, RunSQL, SeparateDatabaseAndState
+from .special import (
+    RunPython, RunPythonInBatches, RunSQL, SeparateDatabaseAndState,
+)
 
 __all__ = [
     'CreateModel', 'DeleteModel', 'AlterModelTable', 'AlterUniqueTogether',
     'RenameModel', 'AlterIndexTogether', 'AlterModelOptions', 'AddIndex',
     'RemoveIndex', 'AddField', 'RemoveField', 'AlterField', 'RenameField',
     'AddConstraint', 'RemoveConstraint',
-    'SeparateDatabaseAndState', 'RunSQL', 'RunPython',
+    'SeparateDatabaseAndState', 'RunSQL', 'RunPython', 'RunPythonInBatches',
     'AlterOrderWithRespectTo', 'AlterModelManagers',
 ]
@@ -80,6 +80,14 @@ class Operation:
         """
         return "%s: %s" % (self.__class__.__name__, self._constructor_args)
 
+    def can_run_in_transaction(self, connection):
+        """
+        Return whether the operation can be applied inside a transaction on
+        the given connection. Migrations containing an operation that can't
+        are applied without one.
+        """
+        return True
+
     def references_model(self, name, app_label=None):
         """
         Return True if there is a chance this operation references the given
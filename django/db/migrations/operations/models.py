@@ -723,7 +723,7 @@ class IndexOperation(Operation):
 class AddIndex(IndexOperation):
     """Add an index on a model."""
 
-    def __init__(self, model_name, index):
+    def __init__(self, model_name, index, online=False):
         self.model_name = model_name
         if not index.name:
             raise ValueError(
@@ -731,6 +731,7 @@ class AddIndex(IndexOperation):
                 "argument. %r doesn't have one." % index
             )
         self.index = index
+        self.online = online
 
     def state_forwards(self, app_label, state):
         model_state = state.models[app_label, self.model_name_lower]
@@ -742,18 +743,23 @@ class AddIndex(IndexOperation):
     def database_forwards(self, app_label, schema_editor, from_state, to_state):
         model = to_state.apps.get_model(app_label, self.model_name)
         if self.allow_migrate_model(schema_editor.connection.alias, model):
-            schema_editor.add_index(model, self.index)
+            schema_editor.add_index(model, self.index, online=self.online)
 
     def database_backwards(self, app_label, schema_editor, from_state, to_state):
         model = from_state.apps.get_model(app_label, self.model_name)
         if self.allow_migrate_model(schema_editor.connection.alias, model):
-            schema_editor.remove_index(model, self.index)
+            schema_editor.remove_index(model, self.index, online=self.online)
+
+    def can_run_in_transaction(self, connection):
+        return not (self.online and connection.features.online_index_changes_require_autocommit)
 
     def deconstruct(self):
         kwargs = {
             'model_name': self.model_name,
             'index': self.index,
         }
+        if self.online:
+            kwargs['online'] = True
         return (
             self.__class__.__qualname__,
             [],
@@ -771,9 +777,10 @@ class AddIndex(IndexOperation):
 class RemoveIndex(IndexOperation):
     """Remove an index from a model."""
 
-    def __init__(self, model_name, name):
+    def __init__(self, model_name, name, online=False):
         self.model_name = model_name
         self.name = name
+        self.online = online
 
     def state_forwards(self, app_label, state):
         model_state = state.models[app_label, self.model_name_lower]
@@ -786,20 +793,25 @@ class RemoveIndex(IndexOperation):
         if self.allow_migrate_model(schema_editor.connection.alias, model):
             from_model_state = from_state.models[app_label, self.model_name_lower]
             index = from_model_state.get_index_by_name(self.name)
-            schema_editor.remove_index(model, index)
+            schema_editor.remove_index(model, index, online=self.online)
 
     def database_backwards(self, app_label, schema_editor, from_state, to_state):
         model = to_state.apps.get_model(app_label, self.model_name)
         if self.allow_migrate_model(schema_editor.connection.alias, model):
             to_model_state = to_state.models[app_label, self.model_name_lower]
             index = to_model_state.get_index_by_name(self.name)
-            schema_editor.add_index(model, index)
+            schema_editor.add_index(model, index, online=self.online)
+
+    def can_run_in_transaction(self, connection):
+        return not (self.online and connection.features.online_index_changes_require_autocommit)
 
     def deconstruct(self):
         kwargs = {
             'model_name': self.model_name,
             'name': self.name,
         }
+        if self.online:
+            kwargs['online'] = True
         return (
             self.__class__.__qualname__,
             [],
@@ -1,4 +1,7 @@
-from django.db import router
+import time
+
+from django.db import router, transaction
+from django.utils.functional import cached_property
 
 from .base import Operation
 
@@ -201,3 +204,126 @@ class RunPython(Operation):
     @staticmethod
     def noop(apps, schema_editor):
         return None
+
+
+class RunPythonInBatches(Operation):
+    """
+    Run Python code over the rows of a model in batches of consecutive primary
+    keys, committing each batch in its own transaction.
+
+    The last primary key of each batch is recorded by the MigrationRecorder,
+    so an interrupted run continues after the last committed batch.
+    """
+
+    reduces_to_sql = False
+    atomic = False
+
+    def __init__(self, model_name, code, reverse_code=None, batch_size=1000, sleep=0, hints=None, elidable=False):
+        self.model_name = model_name
+        if not callable(code):
+            raise ValueError("RunPythonInBatches must be supplied with a callable")
+        self.code = code
+        if reverse_code is not None and not callable(reverse_code):
+            raise ValueError("RunPythonInBatches must be supplied with callable arguments")
+        self.reverse_code = reverse_code
+        if batch_size < 1:
+            raise ValueError("RunPythonInBatches batch_size must be a positive integer")
+        self.batch_size = batch_size
+        self.sleep = sleep
+        self.hints = hints or {}
+        self.elidable = elidable
+
+    @cached_property
+    def model_name_lower(self):
+        return self.model_name.lower()
+
+    def deconstruct(self):
+        kwargs = {
+            'model_name': self.model_name,
+            'code': self.code,
+        }
+        if self.reverse_code is not None:
+            kwargs['reverse_code'] = self.reverse_code
+        if self.batch_size != 1000:
+            kwargs['batch_size'] = self.batch_size
+        if self.sleep:
+            kwargs['sleep'] = self.sleep
+        if self.hints:
+            kwargs['hints'] = self.hints
+        return (
+            self.__class__.__qualname__,
+            [],
+            kwargs
+        )
+
+    @property
+    def reversible(self):
+        return self.reverse_code is not None
+
+    def can_run_in_transaction(self, connection):
+        return False
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        from_state.clear_delayed_apps_cache()
+        if router.allow_migrate(
+                schema_editor.connection.alias, app_label, model_name=self.model_name_lower, **self.hints):
+            self._run_batches(self.code, app_label, schema_editor, from_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if self.reverse_code is None:
+            raise NotImplementedError("You cannot reverse this operation")
+        if router.allow_migrate(
+                schema_editor.connection.alias, app_label, model_name=self.model_name_lower, **self.hints):
+            self._run_batches(self.reverse_code, app_label, schema_editor, from_state)
+
+    def _run_batches(self, code, app_label, schema_editor, state):
+        """
+        Call code(apps, schema_editor, queryset) with a queryset of each batch
+        of rows, in primary key order, starting after the recorded progress.
+        """
+        # The recorder defines models, so it can't be imported before the
+        # app registry is ready.
+        from django.db.migrations.recorder import MigrationRecorder
+
+        connection = schema_editor.connection
+        if connection.in_atomic_block:
+            # Batches can't be committed separately, so don't record progress
+            # that would be rolled back along with them.
+            recorder = None
+        else:
+            recorder = MigrationRecorder(connection)
+            recorder.ensure_progress_schema()
+        progress_name = '%s:%s.%s' % (self.model_name_lower, code.__module__, code.__qualname__)
+        model = state.apps.get_model(app_label, self.model_name)
+        manager = model._base_manager.db_manager(connection.alias)
+        last_key = recorder.get_progress(app_label, progress_name) if recorder else None
+        if last_key is not None:
+            last_key = model._meta.pk.to_python(last_key)
+        rows = 0
+        while True:
+            queryset = manager.order_by('pk')
+            if last_key is not None:
+                queryset = queryset.filter(pk__gt=last_key)
+            keys = list(queryset.values_list('pk', flat=True)[:self.batch_size])
+            if not keys:
+                break
+            with transaction.atomic(using=connection.alias):
+                code(state.apps, schema_editor, queryset.filter(pk__lte=keys[-1]))
+                if recorder:
+                    recorder.record_progress(app_label, progress_name, str(keys[-1]))
+            last_key = keys[-1]
+            rows += len(keys)
+            if schema_editor.progress_callback:
+                schema_editor.progress_callback('batch_success', rows=rows)
+            if len(keys) < self.batch_size:
+                break
+            if self.sleep:
+                time.sleep(self.sleep)
+        if recorder:
+            recorder.clear_progress(app_label, progress_name)
+
+    def describe(self):
+        return "Raw Python operation on %s in batches" % self.model_name
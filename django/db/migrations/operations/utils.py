@@ -4,8 +4,8 @@ from django.db.models.fields.related import RECURSIVE_RELATIONSHIP_CONSTANT
 
 
 def is_referenced_by_foreign_key(state, model_name_lower, field, field_name):
-    for state_app_label, state_model in state.models:
-        for _, f in state.models[state_app_label, state_model].fields:
+    for (state_app_label, state_model), model_state in state.models.readonly_items():
+        for _, f in model_state.fields:
             if (f.related_model and
                     '%s.%s' % (state_app_label, model_name_lower) == f.related_model.lower() and
                     hasattr(f, 'to_fields')):
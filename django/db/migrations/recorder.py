@@ -32,6 +32,20 @@ class MigrationRecorder:
         def __str__(self):
             return "Migration %s for %s" % (self.name, self.app)
 
+    class MigrationProgress(models.Model):
+        app = models.CharField(max_length=255)
+        name = models.CharField(max_length=255)
+        last_key = models.TextField()
+        updated = models.DateTimeField(default=now)
+
+        class Meta:
+            apps = Apps()
+            app_label = "migrations"
+            db_table = "django_migrations_progress"
+
+        def __str__(self):
+            return "Progress of %s for %s" % (self.name, self.app)
+
     def __init__(self, connection):
         self.connection = connection
 
@@ -39,6 +53,10 @@ class MigrationRecorder:
     def migration_qs(self):
         return self.Migration.objects.using(self.connection.alias)
 
+    @property
+    def progress_qs(self):
+        return self.MigrationProgress.objects.using(self.connection.alias)
+
     def has_table(self):
         """Return True if the django_migrations table exists."""
         return self.Migration._meta.db_table in self.connection.introspection.table_names(self.connection.cursor())
@@ -56,6 +74,25 @@ class MigrationRecorder:
         except DatabaseError as exc:
             raise MigrationSchemaMissing("Unable to create the django_migrations table (%s)" % exc)
 
+    def has_progress_table(self):
+        """Return True if the django_migrations_progress table exists."""
+        return self.MigrationProgress._meta.db_table in self.connection.introspection.table_names(
+            self.connection.cursor()
+        )
+
+    def ensure_progress_schema(self):
+        """
+        Ensure the table storing the progress of resumable operations exists.
+        It's only created when such an operation first runs.
+        """
+        if self.has_progress_table():
+            return
+        try:
+            with self.connection.schema_editor() as editor:
+                editor.create_model(self.MigrationProgress)
+        except DatabaseError as exc:
+            raise MigrationSchemaMissing("Unable to create the django_migrations_progress table (%s)" % exc)
+
     def applied_migrations(self):
         """Return a set of (app, name) of applied migrations."""
         if self.has_table():
@@ -75,6 +112,29 @@ class MigrationRecorder:
         self.ensure_schema()
         self.migration_qs.filter(app=app, name=name).delete()
 
+    def get_progress(self, app, name):
+        """
+        Return the last key recorded by record_progress() for the resumable
+        operation `name` of an app, or None if there isn't any.
+        """
+        if self.has_progress_table():
+            return self.progress_qs.filter(app=app, name=name).values_list('last_key', flat=True).first()
+        return None
+
+    def record_progress(self, app, name, last_key):
+        """
+        Record the last key processed by a resumable operation. The table must
+        have been created by ensure_progress_schema().
+        """
+        updated = self.progress_qs.filter(app=app, name=name).update(last_key=last_key, updated=now())
+        if not updated:
+            self.progress_qs.create(app=app, name=name, last_key=last_key)
+
+    def clear_progress(self, app, name):
+        """Forget the progress of a resumable operation once it's done."""
+        if self.has_progress_table():
+            self.progress_qs.filter(app=app, name=name).delete()
+
     def flush(self):
         """Delete all migration records. Useful for testing migrations."""
         self.migration_qs.all().delete()
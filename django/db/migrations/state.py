@@ -77,6 +77,100 @@ def get_related_models_recursive(model):
     return seen - {(model._meta.app_label, model._meta.model_name)}
 
 
+class CopyOnWriteModelStates(dict):
+    """
+    Map (app_label, model_name) to ModelState, sharing ModelStates between
+    cloned ProjectStates until they're retrieved.
+
+    Operations mutate the ModelStates they retrieve from ProjectState.models,
+    so a shared ModelState is cloned the first time it's retrieved. Cloning a
+    ProjectState is then proportional to the number of models, rather than to
+    the number of their fields and options, and only the models actually
+    changed by an operation are cloned.
+    """
+    def __init__(self, *args, shared=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shared = set(shared)
+
+    def __getitem__(self, key):
+        model_state = super().__getitem__(key)
+        if key in self.shared:
+            model_state = model_state.clone()
+            super().__setitem__(key, model_state)
+            self.shared.discard(key)
+        return model_state
+
+    def __setitem__(self, key, model_state):
+        super().__setitem__(key, model_state)
+        self.shared.discard(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.shared.discard(key)
+
+    def __reduce__(self):
+        # Pickle and deep copy the ModelStates without sharing them.
+        return self.__class__, (dict(self.readonly_items()),)
+
+    def readonly_get(self, key, default=None):
+        """
+        Return the ModelState for key without cloning it if it's shared. It
+        must not be changed.
+        """
+        return super().get(key, default)
+
+    def readonly_items(self):
+        """
+        Return (key, ModelState) pairs without cloning shared ModelStates.
+        They must not be changed.
+        """
+        return super().items()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *args):
+        model_state = super().pop(key, *args)
+        if key in self.shared:
+            self.shared.discard(key)
+            model_state = model_state.clone()
+        return model_state
+
+    def popitem(self):
+        key, model_state = super().popitem()
+        if key in self.shared:
+            self.shared.discard(key)
+            model_state = model_state.clone()
+        return key, model_state
+
+    def update(self, *args, **kwargs):
+        for key, model_state in dict(*args, **kwargs).items():
+            self[key] = model_state
+
+    def clear(self):
+        super().clear()
+        self.shared.clear()
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def copy(self):
+        """
+        Return a copy sharing all ModelStates with this mapping. They're
+        cloned by whichever of the two retrieves them first.
+        """
+        self.shared.update(self)
+        return self.__class__(self.readonly_items(), shared=self)
+
+
 class ProjectState:
     """
     Represent the entire project's overall state. This is the item that is
@@ -85,7 +179,9 @@ class ProjectState:
     """
 
     def __init__(self, models=None, real_apps=None):
-        self.models = models or {}
+        if not isinstance(models, CopyOnWriteModelStates):
+            models = CopyOnWriteModelStates(models or {})
+        self.models = models
         # Apps to include from main registry, usually unmigrated ones
         self.real_apps = real_apps or []
         self.is_delayed = False
@@ -123,7 +219,7 @@ class ProjectState:
                 related_models = get_related_models_recursive(old_model)
 
         # Get all outgoing references from the model to be rendered
-        model_state = self.models[(app_label, model_name)]
+        model_state = self.models.readonly_get((app_label, model_name))
         # Directly related models are the models pointed to by ForeignKeys,
         # OneToOneFields, and ManyToManyFields.
         direct_related_models = set()
@@ -178,13 +274,11 @@ class ProjectState:
             if (model_state.app_label, model_state.name_lower) in related_models:
                 states_to_be_rendered.append(model_state)
 
-        # 2. All related models of migrated apps
+        # 2. All related models of migrated apps. Rendering doesn't change
+        # their states, so don't clone the ones shared with other states.
         for rel_app_label, rel_model_name in related_models:
-            try:
-                model_state = self.models[rel_app_label, rel_model_name]
-            except KeyError:
-                pass
-            else:
+            model_state = self.models.readonly_get((rel_app_label, rel_model_name))
+            if model_state is not None:
                 states_to_be_rendered.append(model_state)
 
         # Render all models
@@ -193,7 +287,7 @@ class ProjectState:
     def clone(self):
         """Return an exact copy of this ProjectState."""
         new_state = ProjectState(
-            models={k: v.clone() for k, v in self.models.items()},
+            models=self.models.copy(),
             real_apps=self.real_apps,
         )
         if 'apps' in self.__dict__:
@@ -201,6 +295,12 @@ class ProjectState:
         new_state.is_delayed = self.is_delayed
         return new_state
 
+    def __getstate__(self):
+        # Rendered models can't be pickled, they're rendered again if needed.
+        state = self.__dict__.copy()
+        state.pop('apps', None)
+        return state
+
     def clear_delayed_apps_cache(self):
         if self.is_delayed and 'apps' in self.__dict__:
             del self.__dict__['apps']
@@ -260,7 +360,13 @@ class StateApps(Apps):
             for model in app.get_models():
                 self.real_models.append(ModelState.from_model(model, exclude_rels=True))
         # Populate the app registry with a stub for each application.
-        app_labels = {model_state.app_label for model_state in models.values()}
+        # Rendering doesn't change the model states, avoid cloning the ones
+        # shared with other project states.
+        if isinstance(models, CopyOnWriteModelStates):
+            model_states = [model_state for _, model_state in models.readonly_items()]
+        else:
+            model_states = list(models.values())
+        app_labels = {model_state.app_label for model_state in model_states}
         app_configs = [AppConfigStub(label) for label in sorted(real_apps + list(app_labels))]
         super().__init__(app_configs)
 
@@ -268,7 +374,7 @@ class StateApps(Apps):
         # is called whenever Django duplicates a StateApps before updating it.
         self._lock = None
 
-        self.render_multiple(list(models.values()) + self.real_models)
+        self.render_multiple(model_states + self.real_models)
 
         # There shouldn't be any operations pending at this point.
         from django.core.checks.model_checks import _check_lazy_references
@@ -318,11 +424,16 @@ class StateApps(Apps):
     def clone(self):
         """Return a clone of this registry."""
         clone = StateApps([], {})
-        clone.all_models = copy.deepcopy(self.all_models)
-        clone.app_configs = copy.deepcopy(self.app_configs)
-        # Set the pointer to the correct app registry.
-        for app_config in clone.app_configs.values():
+        # Model classes are shared with the clone, only the registries
+        # pointing to them are copied.
+        for app_label, app_models in self.all_models.items():
+            clone.all_models[app_label] = app_models.copy()
+        for app_label, app_config in self.app_configs.items():
+            app_config = copy.copy(app_config)
+            # Set the pointer to the correct app registry.
             app_config.apps = clone
+            app_config.models = clone.all_models[app_label]
+            clone.app_configs[app_label] = app_config
         # No need to actually clone them, they'll never change
         clone.real_models = self.real_models
         return clone
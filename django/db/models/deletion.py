@@ -2,7 +2,7 @@ from collections import Counter, OrderedDict
 from operator import attrgetter
 
 from django.db import IntegrityError, connections, transaction
-from django.db.models import signals, sql
+from django.db.models import query_cache, signals, sql
 
 
 class ProtectedError(IntegrityError):
@@ -305,6 +305,7 @@ class Collector:
                         signals.post_delete.send(
                             sender=model, instance=obj, using=self.using
                         )
+            query_cache.invalidate_models(self.using, [*self.field_updates, *self.data])
 
         # update collected instances
         for instances_for_fieldvalues in self.field_updates.values():
@@ -76,6 +76,7 @@ class Options:
 
     def __init__(self, meta, app_label=None):
         self._get_fields_cache = {}
+        self._lookup_path_cache = {}
         self.local_fields = []
         self.local_many_to_many = []
         self.private_fields = []
@@ -718,6 +719,7 @@ class Options:
                 if cache_key in self.__dict__:
                     delattr(self, cache_key)
         self._get_fields_cache = {}
+        self._lookup_path_cache = {}
 
     def get_fields(self, include_parents=True, include_hidden=False):
         """
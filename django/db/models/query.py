@@ -6,16 +6,19 @@ import copy
 import operator
 import warnings
 from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from itertools import chain
 
 from django.conf import settings
 from django.core import exceptions
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.exceptions import FieldDoesNotExist
 from django.db import (
     DJANGO_VERSION_PICKLE_KEY, IntegrityError, connections, router,
     transaction,
 )
-from django.db.models import DateField, DateTimeField, sql
+from django.db.models import DateField, DateTimeField, query_cache, sql
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.deletion import Collector
 from django.db.models.expressions import F
@@ -178,6 +181,29 @@ class FlatValuesListIterable(BaseIterable):
             yield row[0]
 
 
+class AsyncIterable:
+    """
+    Async iterator over the results of a QuerySet, which are fetched without
+    blocking the event loop the first time it's advanced.
+    """
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+        self.results = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.results is None:
+            await self.queryset._run_async(self.queryset._fetch_all)
+            self.results = iter(self.queryset._result_cache)
+        try:
+            return next(self.results)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
 class QuerySet:
     """Represent a lazy database lookup for a set of objects."""
 
@@ -194,6 +220,9 @@ class QuerySet:
         self._known_related_objects = {}  # {rel_field: {pk: rel_obj}}
         self._iterable_class = ModelIterable
         self._fields = None
+        self._use_query_cache = False
+        self._query_cache_timeout = DEFAULT_TIMEOUT
+        self._across_aliases = None
 
     def as_manager(cls):
         # Address the circular dependency between `Queryset` and `Manager`.
@@ -269,6 +298,9 @@ class QuerySet:
         self._fetch_all()
         return iter(self._result_cache)
 
+    def __aiter__(self):
+        return AsyncIterable(self)
+
     def __bool__(self):
         self._fetch_all()
         return bool(self._result_cache)
@@ -339,6 +371,7 @@ class QuerySet:
         """
         if chunk_size <= 0:
             raise ValueError('Chunk size must be strictly positive.')
+        self._not_support_across('iterator')
         use_chunked_fetch = not connections[self.db].settings_dict.get('DISABLE_SERVER_SIDE_CURSORS')
         return self._iterator(use_chunked_fetch, chunk_size)
 
@@ -363,6 +396,8 @@ class QuerySet:
                 raise TypeError("Complex aggregates require an alias")
             kwargs[arg.default_alias] = arg
 
+        if self._across_aliases is not None:
+            return self._aggregate_across(kwargs)
         query = self.query.chain()
         for (alias, aggregate_expr) in kwargs.items():
             query.add_annotation(aggregate_expr, alias, is_summary=True)
@@ -381,6 +416,12 @@ class QuerySet:
         if self._result_cache is not None:
             return len(self._result_cache)
 
+        if self._across_aliases is not None:
+            low_mark, high_mark = self.query.low_mark, self.query.high_mark
+            count = sum(self._fan_out(lambda qs: qs._shard_limits().query.get_count(using=qs.db)))
+            if high_mark is not None:
+                count = min(count, high_mark)
+            return max(0, count - low_mark)
         return self.query.get_count(using=self.db)
 
     def get(self, *args, **kwargs):
@@ -473,6 +514,67 @@ class QuerySet:
 
         return objs
 
+    def copy_from(self, rows, fields=None):
+        """
+        Load model instances or rows into the database with COPY ... FROM,
+        which is much faster than bulk_create() for large numbers of objects.
+        Rows are sequences or dicts of values for `fields`, which default to
+        the concrete fields of the model without the auto-incremented primary
+        key. Like bulk_create(), don't call save(), send signals, or set the
+        primary keys of instances. Multi-table models are not supported.
+
+        Return the number of rows loaded.
+        """
+        for parent in self.model._meta.get_parent_list():
+            if parent._meta.concrete_model is not self.model._meta.concrete_model:
+                raise ValueError("Can't copy to a multi-table inherited model")
+        self._for_write = True
+        connection = connections[self.db]
+        opts = self.model._meta
+        if fields is None:
+            names = [f.name for f in opts.concrete_fields if not isinstance(f, AutoField)]
+        else:
+            names = list(fields)
+        fields = [opts.get_field(name) for name in names]
+
+        def prepare_row(row):
+            if isinstance(row, self.model):
+                values = [field.pre_save(row, True) for field in fields]
+            else:
+                if isinstance(row, dict):
+                    row = [row[name] for name in names]
+                values = [field.to_python(value) for field, value in zip(fields, row)]
+            return [field.get_db_prep_save(value, connection) for field, value in zip(fields, values)]
+
+        with connection.cursor() as cursor:
+            count = connection.ops.copy_from(
+                cursor, opts.db_table, [field.column for field in fields], map(prepare_row, rows),
+            )
+        query_cache.invalidate_models(self.db, [self.model])
+        return count
+
+    def copy_to(self, file, fields=None, format='csv', header=False):
+        """
+        Write the rows of the queryset to file with COPY ... TO, in the given
+        format. The columns are `fields`, the fields of a values() or
+        values_list() queryset, or the concrete fields of the model.
+
+        Return the number of rows written.
+        """
+        if fields is not None:
+            queryset = self.values_list(*fields)
+        elif self._fields is None:
+            queryset = self.values_list(*[f.attname for f in self.model._meta.concrete_fields])
+        else:
+            queryset = self
+        connection = connections[self.db]
+        try:
+            sql, params = queryset.query.get_compiler(self.db).as_sql()
+        except EmptyResultSet:
+            return 0
+        with connection.cursor() as cursor:
+            return connection.ops.copy_to(cursor, sql, params, file, format, header)
+
     def get_or_create(self, defaults=None, **kwargs):
         """
         Look up an object with the given kwargs, creating one if necessary.
@@ -641,6 +743,7 @@ class QuerySet:
 
         if self._fields is not None:
             raise TypeError("Cannot call delete() after .values() or .values_list()")
+        self._not_support_across('delete')
 
         del_query = self._chain()
 
@@ -670,7 +773,9 @@ class QuerySet:
         Delete objects found from the given queryset in single direct SQL
         query. No signals are sent and there is no protection for cascades.
         """
-        return sql.DeleteQuery(self.model).delete_qs(self, using)
+        deleted = sql.DeleteQuery(self.model).delete_qs(self, using)
+        query_cache.invalidate_models(using, [self.model])
+        return deleted
     _raw_delete.alters_data = True
 
     def update(self, **kwargs):
@@ -680,6 +785,7 @@ class QuerySet:
         """
         assert self.query.can_filter(), \
             "Cannot update a query once a slice has been taken."
+        self._not_support_across('update')
         self._for_write = True
         query = self.query.chain(sql.UpdateQuery)
         query.add_update_values(kwargs)
@@ -687,6 +793,7 @@ class QuerySet:
         query._annotations = None
         with transaction.atomic(using=self.db, savepoint=False):
             rows = query.get_compiler(self.db).execute_sql(CURSOR)
+            query_cache.invalidate_models(self.db, [query.get_meta().model, *query.related_updates])
         self._result_cache = None
         return rows
     update.alters_data = True
@@ -705,12 +812,18 @@ class QuerySet:
         # Clear any annotations so that they won't be present in subqueries.
         query._annotations = None
         self._result_cache = None
-        return query.get_compiler(self.db).execute_sql(CURSOR)
+        rows = query.get_compiler(self.db).execute_sql(CURSOR)
+        query_cache.invalidate_models(self.db, [query.get_meta().model, *query.related_updates])
+        return rows
     _update.alters_data = True
     _update.queryset_only = False
 
     def exists(self):
         if self._result_cache is None:
+            if self._across_aliases is not None:
+                if self.query.low_mark:
+                    return self.count() > 0
+                return any(self._fan_out(lambda qs: qs.query.has_results(using=qs.db)))
             return self.query.has_results(using=self.db)
         return bool(self._result_cache)
 
@@ -722,6 +835,37 @@ class QuerySet:
     def explain(self, *, format=None, **options):
         return self.query.explain(using=self.db, format=format, **options)
 
+    ###########################################
+    # PUBLIC METHODS THAT RETURN AN AWAITABLE #
+    ###########################################
+
+    async def aget(self, *args, **kwargs):
+        return await self._run_async(self.get, *args, **kwargs)
+
+    async def acount(self):
+        return await self._run_async(self.count)
+
+    async def aexists(self):
+        return await self._run_async(self.exists)
+
+    async def afirst(self):
+        return await self._run_async(self.first)
+
+    async def acreate(self, **kwargs):
+        self._for_write = True
+        return await self._run_async(self.create, **kwargs)
+
+    async def aupdate(self, **kwargs):
+        self._for_write = True
+        return await self._run_async(self.update, **kwargs)
+    aupdate.alters_data = True
+
+    async def adelete(self):
+        self._for_write = True
+        return await self._run_async(self.delete)
+    adelete.alters_data = True
+    adelete.queryset_only = True
+
     ##################################################
     # PUBLIC METHODS THAT RETURN A QUERYSET SUBCLASS #
     ##################################################
@@ -1089,6 +1233,31 @@ class QuerySet:
         """Select which database this QuerySet should execute against."""
         clone = self._chain()
         clone._db = alias
+        clone._across_aliases = None
+        return clone
+
+    def across(self, aliases):
+        """
+        Execute this QuerySet concurrently on each of the given databases and
+        combine the results.
+        """
+        aliases = tuple(aliases)
+        if not aliases:
+            raise ValueError('across() requires at least one database alias.')
+        clone = self._chain()
+        clone._across_aliases = aliases
+        return clone
+
+    def cache(self, timeout=DEFAULT_TIMEOUT):
+        """
+        Store the results of this QuerySet in the cache configured by
+        QUERYSET_CACHE_ALIAS for `timeout` seconds, until a write to any of
+        the tables it reads from invalidates them.
+        """
+        query_cache.get_query_cache()
+        clone = self._chain()
+        clone._use_query_cache = True
+        clone._query_cache_timeout = timeout
         return clone
 
     ###################################
@@ -1131,7 +1300,9 @@ class QuerySet:
             using = self.db
         query = sql.InsertQuery(self.model, ignore_conflicts=ignore_conflicts)
         query.insert_values(fields, objs, raw=raw)
-        return query.get_compiler(using=using).execute_sql(return_id)
+        result = query.get_compiler(using=using).execute_sql(return_id)
+        query_cache.invalidate_models(using, [self.model])
+        return result
     _insert.alters_data = True
     _insert.queryset_only = False
 
@@ -1183,14 +1354,201 @@ class QuerySet:
         c._known_related_objects = self._known_related_objects
         c._iterable_class = self._iterable_class
         c._fields = self._fields
+        c._use_query_cache = self._use_query_cache
+        c._query_cache_timeout = self._query_cache_timeout
+        c._across_aliases = self._across_aliases
         return c
 
     def _fetch_all(self):
         if self._result_cache is None:
-            self._result_cache = list(self._iterable_class(self))
+            if self._across_aliases is not None:
+                self._result_cache = self._fetch_across()
+            elif self._use_query_cache:
+                self._result_cache = self._fetch_cached()
+            else:
+                self._result_cache = list(self._iterable_class(self))
         if self._prefetch_related_lookups and not self._prefetch_done:
             self._prefetch_related_objects()
 
+    def _fetch_cached(self):
+        """
+        Return the results of this QuerySet from the query cache, evaluating
+        and storing them on a miss.
+        """
+        cache_key = query_cache.get_cache_key(self)
+        if cache_key is None:
+            return list(self._iterable_class(self))
+        cache = query_cache.get_query_cache()
+        results = cache.get(cache_key)
+        if results is None:
+            results = list(self._iterable_class(self))
+            cache.set(cache_key, results, self._query_cache_timeout)
+        return results
+
+    def _not_support_across(self, method_name):
+        if self._across_aliases is not None:
+            raise NotSupportedError(
+                'Calling QuerySet.%s() after across() is not supported.' % method_name
+            )
+
+    def _run_async(self, func, *args, **kwargs):
+        """
+        Return an awaitable for the result of func(*args, **kwargs), a method
+        of this QuerySet, run by the connection to its database.
+        """
+        return connections[self.db].run_async(func, *args, **kwargs)
+
+    def _fan_out(self, func):
+        """
+        Call func() with a copy of this QuerySet bound to each database of
+        across() and return the results in the order of the aliases.
+
+        Each database is queried from a thread of its own, except those with
+        an open transaction in the current thread, which are queried from the
+        current thread so that they see its uncommitted changes.
+        """
+        querysets = []
+        for alias in self._across_aliases:
+            qs = self._chain()
+            qs._db = alias
+            qs._across_aliases = None
+            querysets.append(qs)
+        local = [qs for qs in querysets if connections[qs.db].in_atomic_block]
+        remote = [qs for qs in querysets if qs not in local]
+        results = {}
+        if remote:
+            with ThreadPoolExecutor(max_workers=len(remote)) as executor:
+                futures = [(qs, executor.submit(_call_in_thread, func, qs)) for qs in remote]
+                for qs in local:
+                    results[qs.db] = func(qs)
+                for qs, future in futures:
+                    results[qs.db] = future.result()
+        else:
+            for qs in local:
+                results[qs.db] = func(qs)
+        return [results[alias] for alias in self._across_aliases]
+
+    def _shard_limits(self):
+        """
+        Push the limits of this QuerySet down to a single database: a shard
+        can't skip rows that may sort before the rows of the other shards, but
+        it never needs to return more than `high_mark` rows.
+        """
+        high_mark = self.query.high_mark
+        self.query.clear_limits()
+        self.query.set_limits(high=high_mark)
+        return self
+
+    def _get_across_ordering(self):
+        """
+        Return a list of (key function, descending) pairs to sort the rows
+        fetched from several databases in the order of this QuerySet.
+        """
+        query = self.query
+        if query.extra_order_by:
+            raise NotSupportedError('across() does not support extra(order_by=...).')
+        if query.order_by:
+            ordering = query.order_by
+        elif query.default_ordering:
+            ordering = query.get_meta().ordering
+        else:
+            ordering = ()
+        if self._iterable_class is not ModelIterable:
+            names = [*query.extra_select, *query.values_select, *query.annotation_select]
+            if self._iterable_class is not ValuesIterable and self._fields:
+                names = [*self._fields, *(f for f in query.annotation_select if f not in self._fields)]
+        opts = query.get_meta()
+        keys = []
+        for item in ordering:
+            if not isinstance(item, str) or item == '?' or LOOKUP_SEP in item:
+                raise NotSupportedError(
+                    'across() can only order by fields of the model, got %r.' % item
+                )
+            descending = item.startswith('-') != (not query.standard_ordering)
+            name = item.lstrip('-+')
+            if self._iterable_class is ModelIterable:
+                if name not in query.annotation_select and name not in query.extra_select:
+                    try:
+                        field = opts.pk if name == 'pk' else opts.get_field(name)
+                    except FieldDoesNotExist:
+                        field = None
+                    if field is None or (field.is_relation and name != field.attname):
+                        raise NotSupportedError(
+                            'across() can only order by fields of the model, got %r.' % item
+                        )
+                    name = field.attname
+                getter = operator.attrgetter(name)
+            else:
+                if name == 'pk' and name not in names:
+                    name = opts.pk.attname if opts.pk.attname in names else opts.pk.name
+                if name not in names:
+                    raise NotSupportedError(
+                        'across() can only order by selected fields, got %r.' % item
+                    )
+                if self._iterable_class is ValuesIterable:
+                    getter = operator.itemgetter(name)
+                elif self._iterable_class is FlatValuesListIterable:
+                    getter = _identity
+                else:
+                    getter = operator.itemgetter(names.index(name))
+            keys.append((getter, descending))
+        return keys
+
+    def _fetch_across(self):
+        ordering = self._get_across_ordering()
+        low_mark, high_mark = self.query.low_mark, self.query.high_mark
+        results = list(chain.from_iterable(self._fan_out(
+            lambda qs: list(qs._shard_limits()._iterable_class(qs))
+        )))
+        # Sort by each key in turn, starting from the least significant one.
+        # NULLs sort last in ascending order, as on PostgreSQL and Oracle.
+        for getter, descending in reversed(ordering):
+            results.sort(key=lambda row: _null_last_key(getter(row)), reverse=descending)
+        if low_mark or high_mark is not None:
+            results = results[low_mark:high_mark]
+        return results
+
+    def _aggregate_across(self, kwargs):
+        from django.db.models import Count, Sum
+        shard_kwargs = {}
+        combiners = []
+        for alias, aggregate_expr in kwargs.items():
+            name = getattr(aggregate_expr, 'name', None)
+            if aggregate_expr.extra.get('distinct') or name not in ('Avg', 'Count', 'Max', 'Min', 'Sum'):
+                raise NotSupportedError(
+                    'across() only supports non-distinct Avg, Count, Max, Min, '
+                    'and Sum aggregates.'
+                )
+            if name == 'Avg':
+                sum_alias, count_alias = '%s_fanout_sum' % alias, '%s_fanout_count' % alias
+                source = aggregate_expr.get_source_expressions()
+                if aggregate_expr.filter:
+                    source = source[:-1]
+                shard_kwargs[sum_alias] = Sum(*source, filter=aggregate_expr.filter)
+                shard_kwargs[count_alias] = Count(*source, filter=aggregate_expr.filter)
+                combiners.append((alias, name, (sum_alias, count_alias)))
+            else:
+                shard_kwargs[alias] = aggregate_expr
+                combiners.append((alias, name, (alias,)))
+        shard_results = self._fan_out(lambda qs: qs.aggregate(**shard_kwargs))
+        result = {}
+        for alias, name, shard_aliases in combiners:
+            values = [
+                [r[shard_alias] for r in shard_results if r[shard_alias] is not None]
+                for shard_alias in shard_aliases
+            ]
+            if name == 'Avg':
+                sums, counts = values
+                count = sum(counts)
+                result[alias] = (sum(sums[1:], sums[0]) / count) if count else None
+            elif not values[0]:
+                result[alias] = 0 if name == 'Count' else None
+            elif name in ('Count', 'Sum'):
+                result[alias] = sum(values[0][1:], values[0][0])
+            else:
+                result[alias] = (max if name == 'Max' else min)(values[0])
+        return result
+
     def _next_is_sticky(self):
         """
         Indicate that the next filter call and the one following that should
@@ -1260,6 +1618,25 @@ class QuerySet:
             )
 
 
+def _call_in_thread(func, queryset):
+    """
+    Call func(queryset) and close the connection of the current thread
+    afterwards, since the thread isn't reused.
+    """
+    try:
+        return func(queryset)
+    finally:
+        connections[queryset.db].close()
+
+
+def _identity(value):
+    return value
+
+
+def _null_last_key(value):
+    return (True,) if value is None else (False, value)
+
+
 class InstanceCheckMeta(type):
     def __instancecheck__(self, instance):
         return isinstance(instance, QuerySet) and instance.query.is_empty()
@@ -0,0 +1,200 @@
+"""
+Cache the results of evaluated QuerySets in a django.core.cache backend.
+
+Cached results are keyed on the compiled SQL, its parameters, and a
+generation counter for every table the query reads from. Writing to a table
+bumps its generation, so every cached result that depends on the table is
+orphaned and expires on its own from the cache backend.
+"""
+import hashlib
+import re
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections, transaction
+
+KEY_PREFIX = 'queryset_cache'
+
+# Match the table written to by INSERT, UPDATE, DELETE, REPLACE and TRUNCATE
+# statements, with or without quoting.
+write_statement_re = re.compile(
+    r'^\s*(?:INSERT\s+(?:OR\s+\w+\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?)'
+    r'\s+["`\[]?([\w$.]+)["`\]]?',
+    re.IGNORECASE,
+)
+
+
+def is_enabled():
+    return settings.QUERYSET_CACHE_ALIAS is not None
+
+
+def get_query_cache():
+    """Return the cache backend configured by QUERYSET_CACHE_ALIAS."""
+    if not is_enabled():
+        raise ImproperlyConfigured(
+            'QuerySet.cache() requires the QUERYSET_CACHE_ALIAS setting to '
+            'name one of the CACHES.'
+        )
+    return caches[settings.QUERYSET_CACHE_ALIAS]
+
+
+def _generation_key(using, table):
+    return '%s.generation.%s.%s' % (KEY_PREFIX, using, table)
+
+
+def _new_generation():
+    # Start new counters from a clock value rather than zero so that results
+    # cached against an evicted counter can't be served again.
+    return int(time.time() * 1000000)
+
+
+def get_table_generations(using, tables):
+    """
+    Return a sorted list of (table, generation) pairs for the given tables,
+    initializing any counter that's missing from the cache.
+    """
+    cache = get_query_cache()
+    keys = {_generation_key(using, table): table for table in tables}
+    generations = cache.get_many(keys)
+    for key in keys.keys() - generations.keys():
+        cache.add(key, _new_generation(), None)
+        generations[key] = cache.get(key)
+    return sorted((keys[key], generation) for key, generation in generations.items())
+
+
+def _bump_generations(using, tables):
+    cache = get_query_cache()
+    for table in tables:
+        key = _generation_key(using, table)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, _new_generation(), None)
+
+
+class _UncommittedWrite:
+    """
+    on_commit() callback bumping the counters of tables written in a
+    transaction. Until then, its token is part of the cache key of results
+    read from these tables in the transaction, so that they can't be served
+    once the write is rolled back, which discards the callback.
+    """
+    def __init__(self, using, tables):
+        self.using = using
+        self.tables = tables
+        self.token = uuid.uuid4().hex
+
+    def __call__(self):
+        _bump_generations(self.using, self.tables)
+
+
+def get_uncommitted_writes(using, tables):
+    """
+    Return the tokens of the writes to any of the given tables made in the
+    current transaction of the `using` database.
+    """
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        return []
+    return [
+        func.token for sids, func in connection.run_on_commit
+        if isinstance(func, _UncommittedWrite) and not func.tables.isdisjoint(tables)
+    ]
+
+
+def invalidate_tables(using, tables):
+    """
+    Invalidate all cached results which read from any of the given tables of
+    the `using` database.
+
+    Inside a transaction, the counters are bumped again on commit so that
+    results cached from uncommitted data by another connection don't survive.
+    """
+    if not is_enabled():
+        return
+    tables = set(tables)
+    if not tables:
+        return
+    _bump_generations(using, tables)
+    if connections[using].in_atomic_block:
+        transaction.on_commit(_UncommittedWrite(using, tables), using=using)
+
+
+def invalidate_models(using, models):
+    """Invalidate the tables backing the given models, including parents."""
+    if not is_enabled():
+        return
+    tables = set()
+    for model in models:
+        opts = model._meta
+        tables.add(opts.db_table)
+        tables.update(parent._meta.db_table for parent in opts.get_parent_list())
+    invalidate_tables(using, tables)
+
+
+def get_query_tables(query):
+    """Return the names of all tables read by a sql.Query and its subqueries."""
+    from django.db.models.sql.query import Query  # Avoid circular import.
+    tables = set()
+    queries = [query]
+    while queries:
+        query = queries.pop()
+        tables.update(table.table_name for table in query.alias_map.values())
+        tables.update(query.extra_tables)
+        queries.extend(query.combined_queries)
+        nodes = [query.where, *query.annotations.values()]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, Query):
+                queries.append(node)
+            elif hasattr(node, 'queryset'):
+                # Subquery and Exists.
+                queries.append(node.queryset.query)
+            elif hasattr(node, 'children'):
+                nodes.extend(node.children)
+            elif hasattr(node, 'rhs') and hasattr(node, 'lhs'):
+                nodes.extend((node.lhs, node.rhs))
+            elif hasattr(node, 'get_source_expressions'):
+                nodes.extend(node.get_source_expressions())
+    return tables
+
+
+def get_cache_key(queryset):
+    """
+    Return the cache key for the results of the given QuerySet, or None if
+    they can't be cached.
+    """
+    from django.db.models.query import EmptyResultSet, NamedValuesListIterable
+    query = queryset.query
+    # Rows of values_list(named=True) are instances of a dynamically created
+    # class which can't be pickled.
+    if query.select_for_update or queryset._iterable_class is NamedValuesListIterable:
+        return None
+    using = queryset.db
+    try:
+        sql, params = query.get_compiler(using=using).as_sql()
+    except EmptyResultSet:
+        return None
+    tables = get_query_tables(query)
+    generations = get_table_generations(using, tables)
+    key = hashlib.md5(repr((
+        using, queryset.model._meta.label, queryset._iterable_class.__name__,
+        sql, params, generations, get_uncommitted_writes(using, tables),
+    )).encode()).hexdigest()
+    return '%s.results.%s' % (KEY_PREFIX, key)
+
+
+def invalidate_raw_writes(execute, sql, params, many, context):
+    """
+    Execution wrapper which invalidates cached results for tables written by
+    raw SQL. Install it with connection.execute_wrapper(invalidate_raw_writes).
+    """
+    result = execute(sql, params, many, context)
+    match = write_statement_re.match(sql)
+    if match:
+        table = match.group(1).split('.')[-1]
+        invalidate_tables(context['connection'].alias, [table])
+    return result
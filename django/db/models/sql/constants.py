@@ -8,6 +8,9 @@ import re
 # Larger values are slightly faster at the expense of more storage space.
 GET_ITERATOR_CHUNK_SIZE = 100
 
+# Maximum number of lookup paths memoized per model by Query.names_to_path().
+LOOKUP_PATH_CACHE_SIZE = 1000
+
 # Namedtuples for sql.* internal use.
 
 # How many results to expect from a cursor.execute call
@@ -26,7 +26,7 @@ from django.db.models.query_utils import (
     Q, check_rel_lookup_compatibility, refs_expression,
 )
 from django.db.models.sql.constants import (
-    INNER, LOUTER, ORDER_DIR, ORDER_PATTERN, SINGLE,
+    INNER, LOOKUP_PATH_CACHE_SIZE, LOUTER, ORDER_DIR, ORDER_PATTERN, SINGLE,
 )
 from django.db.models.sql.datastructures import (
     BaseTable, Empty, Join, MultiJoin,
@@ -335,11 +335,8 @@ class Query:
             obj.subq_aliases = self.subq_aliases.copy()
         obj.used_aliases = self.used_aliases.copy()
         obj._filtered_relations = self._filtered_relations.copy()
-        # Clear the cached_property
-        try:
-            del obj.base_table
-        except AttributeError:
-            pass
+        # Clear the cached_property.
+        obj.__dict__.pop('base_table', None)
         return obj
 
     def chain(self, klass=None):
@@ -1367,7 +1364,34 @@ class Query:
         (the last used join field) and target (which is a field guaranteed to
         contain the same value as the final field). Finally, return those names
         that weren't found (which are likely transforms and the final lookup).
+
+        Paths resolved purely from model fields are memoized on the starting
+        model's Options. Since a name that isn't a field may refer to an
+        annotation or a filtered relation of this query, a memoized path
+        ending on such a name is only reused if this query doesn't define it.
+        """
+        cache_key = (tuple(names), allow_many, fail_on_missing)
+        try:
+            path, final_field, targets, rest = opts._lookup_path_cache[cache_key]
+        except KeyError:
+            pass
+        else:
+            if not rest or (rest[0] not in self.annotation_select and rest[0] not in self._filtered_relations):
+                return path[:], final_field, targets, rest[:]
+        path, final_field, targets, rest, cacheable = self._names_to_path(
+            names, opts, allow_many, fail_on_missing,
+        )
+        if cacheable and len(opts._lookup_path_cache) < LOOKUP_PATH_CACHE_SIZE:
+            opts._lookup_path_cache[cache_key] = (path[:], final_field, targets, rest[:])
+        return path, final_field, targets, rest
+
+    def _names_to_path(self, names, opts, allow_many, fail_on_missing):
+        """
+        Implement names_to_path(). Also return whether the result can be
+        memoized, i.e. whether it was found without looking at the
+        annotations and filtered relations of this query.
         """
+        cacheable = True
         path, names_with_path = [], []
         for pos, name in enumerate(names):
             cur_names_with_path = (name, [])
@@ -1381,9 +1405,11 @@ class Query:
             except FieldDoesNotExist:
                 if name in self.annotation_select:
                     field = self.annotation_select[name].output_field
+                    cacheable = False
                 elif name in self._filtered_relations and pos == 0:
                     filtered_relation = self._filtered_relations[name]
                     field = opts.get_field(filtered_relation.relation_name)
+                    cacheable = False
             if field is not None:
                 # Fields that contain one-to-many relations with a generic
                 # model (like a GenericForeignKey) cannot generate reverse
@@ -1447,7 +1473,7 @@ class Query:
                         "Cannot resolve keyword %r into field. Join on '%s'"
                         " not permitted." % (names[pos + 1], name))
                 break
-        return path, final_field, targets, names[pos + 1:]
+        return path, final_field, targets, names[pos + 1:], cacheable
 
     def setup_joins(self, names, opts, alias, can_reuse=None, allow_many=True,
                     reuse_with_filtered_relation=False):
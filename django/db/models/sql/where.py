@@ -133,26 +133,23 @@ class WhereNode(tree.Node):
         mapping old (current) alias values to the new values.
         """
         for pos, child in enumerate(self.children):
-            if hasattr(child, 'relabel_aliases'):
-                # For example another WhereNode
-                child.relabel_aliases(change_map)
-            elif hasattr(child, 'relabeled_clone'):
+            if hasattr(child, 'relabeled_clone'):
+                # Child nodes may be shared with clones of this tree, so they
+                # are replaced by relabeled copies rather than changed in place.
                 self.children[pos] = child.relabeled_clone(change_map)
 
     def clone(self):
         """
         Create a clone of the tree. Must only be called on root nodes (nodes
-        with empty subtree_parents). Childs must be either (Constraint, lookup,
-        value) tuples, or objects supporting .clone().
+        with empty subtree_parents).
+
+        Only the root node is copied. Child nodes are shared between the
+        clones since they are never modified in place once they are part of a
+        tree: add() only changes the root and relabel_aliases() replaces the
+        children it relabels.
         """
-        clone = self.__class__._new_instance(
-            children=[], connector=self.connector, negated=self.negated)
-        for child in self.children:
-            if hasattr(child, 'clone'):
-                clone.children.append(child.clone())
-            else:
-                clone.children.append(child)
-        return clone
+        return self.__class__._new_instance(
+            children=self.children, connector=self.connector, negated=self.negated)
 
     def relabeled_clone(self, change_map):
         clone = self.clone()
@@ -0,0 +1,140 @@
+"""
+Database routers shipped with Django.
+"""
+import threading
+import time
+from contextlib import ContextDecorator
+from itertools import count
+
+from django.core import signals
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+_pinning = threading.local()
+
+
+def is_pinned_to_primary():
+    """
+    Return True if reads in the current thread must go to the primary
+    database because of an earlier write or an enclosing use_primary().
+    """
+    return getattr(_pinning, 'written', False) or getattr(_pinning, 'depth', 0) > 0
+
+
+def pin_to_primary():
+    """Send all further reads of the current thread to the primary."""
+    _pinning.written = True
+
+
+def unpin_from_primary(**kwargs):
+    """Allow reads of the current thread to go to replicas again."""
+    _pinning.written = False
+
+
+class use_primary(ContextDecorator):
+    """
+    Context manager and decorator that routes all reads to the primary
+    database within its scope.
+    """
+    def __enter__(self):
+        _pinning.depth = getattr(_pinning, 'depth', 0) + 1
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _pinning.depth -= 1
+
+
+# Requests start unpinned, whatever the previous request using the thread did.
+signals.request_started.connect(unpin_from_primary)
+signals.request_finished.connect(unpin_from_primary)
+
+
+class PrimaryReplicaRouter:
+    """
+    Send writes to a primary database and balance reads across its replicas.
+
+    Once a thread writes to the primary, its reads go to the primary until
+    the end of the current request, so that they see what was written. Reads
+    inside a transaction on the primary also stay on the primary.
+
+    Replicas are checked at most every `health_check_interval` seconds. A
+    replica is skipped while it can't be connected to or, when
+    `max_replication_lag` is set, while it lags further behind the primary.
+    When no replica is available, reads go to the primary.
+
+    Attributes may be set on a subclass or passed as keyword arguments to
+    the constructor.
+    """
+    primary = DEFAULT_DB_ALIAS
+    replicas = ()
+    max_replication_lag = None
+    health_check_interval = 5
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            if not hasattr(type(self), key):
+                raise TypeError(
+                    "%s() received an invalid keyword %r." % (type(self).__name__, key)
+                )
+            setattr(self, key, value)
+        self.replicas = tuple(self.replicas)
+        self._counter = count()
+        self._health = {}
+
+    def db_for_read(self, model, **hints):
+        if 'instance' in hints:
+            # Let the instance's database be used.
+            return None
+        if is_pinned_to_primary() or connections[self.primary].in_atomic_block:
+            return self.primary
+        return self.get_replica() or self.primary
+
+    def db_for_write(self, model, **hints):
+        pin_to_primary()
+        return self.primary
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {self.primary, *self.replicas}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        if db in self.replicas:
+            return False
+        return None
+
+    def get_replica(self):
+        """
+        Return the next available replica in round-robin order, or None if
+        none is available.
+        """
+        if not self.replicas:
+            return None
+        start = next(self._counter)
+        for offset in range(len(self.replicas)):
+            alias = self.replicas[(start + offset) % len(self.replicas)]
+            if self.is_available(alias):
+                return alias
+        return None
+
+    def is_available(self, alias):
+        now = time.monotonic()
+        checked_at, available = self._health.get(alias, (None, None))
+        if checked_at is None or now - checked_at >= self.health_check_interval:
+            available = self.check_replica(alias)
+            self._health[alias] = (now, available)
+        return available
+
+    def check_replica(self, alias):
+        """
+        Return True if the replica can be connected to and is recent enough.
+        """
+        connection = connections[alias]
+        try:
+            connection.ensure_connection()
+            if self.max_replication_lag is None:
+                return connection.is_usable()
+            with connection.cursor() as cursor:
+                lag = connection.ops.replication_lag(cursor)
+        except DatabaseError:
+            return False
+        return lag is None or lag <= self.max_replication_lag
@@ -1,7 +1,8 @@
 import pkgutil
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from pathlib import Path
-from threading import local
+from threading import Lock, local
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
@@ -140,6 +141,8 @@ class ConnectionHandler:
         """
         self._databases = databases
         self._connections = local()
+        self._async_executors = {}
+        self._async_executors_lock = Lock()
 
     @cached_property
     def databases(self):
@@ -224,6 +227,19 @@ class ConnectionHandler:
                 continue
             connection.close()
 
+    def async_executor(self, alias):
+        """
+        Return the executor whose thread runs the queries of async code on the
+        given database. Each alias has a single dedicated thread, so that its
+        connection is always used from the thread which opened it.
+        """
+        with self._async_executors_lock:
+            try:
+                return self._async_executors[alias]
+            except KeyError:
+                executor = self._async_executors[alias] = ThreadPoolExecutor(max_workers=1)
+                return executor
+
 
 class ConnectionRouter:
     def __init__(self, routers=None):
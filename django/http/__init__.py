@@ -3,11 +3,12 @@ from django.http.request import (
     HttpRequest, QueryDict, RawPostDataException, UnreadablePostError,
 )
 from django.http.response import (
-    BadHeaderError, FileResponse, Http404, HttpResponse,
+    BadHeaderError, EventStreamResponse, FileResponse, Http404, HttpResponse,
     HttpResponseBadRequest, HttpResponseForbidden, HttpResponseGone,
     HttpResponseNotAllowed, HttpResponseNotFound, HttpResponseNotModified,
     HttpResponsePermanentRedirect, HttpResponseRedirect,
-    HttpResponseServerError, JsonResponse, StreamingHttpResponse,
+    HttpResponseServerError, JsonResponse, ServerSentEvent,
+    StreamingHttpResponse, StreamingJsonResponse,
 )
 
 __all__ = [
@@ -17,5 +18,6 @@ __all__ = [
     'HttpResponsePermanentRedirect', 'HttpResponseNotModified',
     'HttpResponseBadRequest', 'HttpResponseForbidden', 'HttpResponseNotFound',
     'HttpResponseNotAllowed', 'HttpResponseGone', 'HttpResponseServerError',
-    'Http404', 'BadHeaderError', 'JsonResponse', 'FileResponse',
+    'Http404', 'BadHeaderError', 'JsonResponse', 'StreamingJsonResponse',
+    'FileResponse', 'EventStreamResponse', 'ServerSentEvent',
 ]
@@ -272,6 +272,9 @@ class MultiPartParser:
             self._close_files()
             if not e.connection_reset:
                 exhaust(self._input_data)
+        except Exception:
+            self._close_files()
+            raise
         else:
             # Make sure that the request data is all fed
             exhaust(self._input_data)
@@ -304,6 +307,7 @@ class MultiPartParser:
         for handler in self._upload_handlers:
             if hasattr(handler, 'file'):
                 handler.file.close()
+            handler.upload_interrupted()
 
 
 class LazyStream:
@@ -323,7 +327,11 @@ class LazyStream:
         """
         self._producer = producer
         self._empty = False
+        # Bytes put back onto the stream are the slice of _leftover starting
+        # at _leftover_start. Keeping the offset avoids copying the tail of a
+        # chunk each time its beginning is consumed.
         self._leftover = b''
+        self._leftover_start = 0
         self.length = length
         self.position = 0
         self._remaining = length
@@ -347,12 +355,13 @@ class LazyStream:
                 assert remaining > 0, 'remaining bytes to read should never go negative'
 
                 try:
-                    chunk = next(self)
+                    chunk, start = self.next_buffer()
                 except StopIteration:
                     return
                 else:
-                    emitting = chunk[:remaining]
-                    self.unget(chunk[remaining:])
+                    end = start + remaining
+                    emitting = chunk[start:end]
+                    self.unget_buffer(chunk, end)
                     remaining -= len(emitting)
                     yield emitting
 
@@ -366,14 +375,23 @@ class LazyStream:
         Return whatever chunk is conveniently returned from the iterator.
         Useful to avoid unnecessary bookkeeping if performance is an issue.
         """
+        chunk, start = self.next_buffer()
+        return chunk[start:]
+
+    def next_buffer(self):
+        """
+        Like next(), but return a (chunk, start) tuple where the data begins
+        at index start of chunk, which avoids copying the part of a chunk that
+        was put back onto the stream with unget_buffer().
+        """
         if self._leftover:
-            output = self._leftover
-            self._leftover = b''
+            output, start = self._leftover, self._leftover_start
+            self._leftover, self._leftover_start = b'', 0
         else:
-            output = next(self._producer)
+            output, start = next(self._producer), 0
             self._unget_history = []
-        self.position += len(output)
-        return output
+        self.position += len(output) - start
+        return output, start
 
     def close(self):
         """
@@ -394,11 +412,22 @@ class LazyStream:
         Future calls to read() will return those bytes first. The
         stream position and thus tell() will be rewound.
         """
-        if not bytes:
+        self.unget_buffer(bytes, 0)
+
+    def unget_buffer(self, chunk, start):
+        """
+        Place chunk[start:] back onto the front of the lazy stream, without
+        copying it unless other bytes are already waiting there.
+        """
+        size = len(chunk) - start
+        if size <= 0:
             return
-        self._update_unget_history(len(bytes))
-        self.position -= len(bytes)
-        self._leftover = bytes + self._leftover
+        self._update_unget_history(size)
+        self.position -= size
+        if self._leftover:
+            chunk = chunk[start:] + self._leftover[self._leftover_start:]
+            start = 0
+        self._leftover, self._leftover_start = chunk, start
 
     def _update_unget_history(self, num_bytes):
         """
@@ -482,9 +511,10 @@ class BoundaryIter:
         # rollback an additional six bytes because the format is like
         # this: CRLF<boundary>[--CRLF]
         self._rollback = len(boundary) + 6
+        # The data at the end of a chunk which may be the beginning of a
+        # boundary split across chunks.
+        self._boundary_prefixes = (b'\r\n' + boundary, b'\n' + boundary, boundary)
 
-        # Try to use mx fast string search if available. Otherwise
-        # use Python find. Wrap the latter for consistency.
         unused_char = self._stream.read(1)
         if not unused_char:
             raise InputStreamExhausted()
@@ -502,62 +532,79 @@ class BoundaryIter:
 
         bytes_read = 0
         chunks = []
-        for bytes in stream:
-            bytes_read += len(bytes)
-            chunks.append(bytes)
-            if bytes_read > rollback:
-                break
-            if not bytes:
+        while bytes_read <= rollback:
+            try:
+                chunk, start = stream.next_buffer()
+            except StopIteration:
+                self._done = True
                 break
-        else:
-            self._done = True
+            bytes_read += len(chunk) - start
+            chunks.append((chunk, start))
 
         if not chunks:
             raise StopIteration()
 
-        chunk = b''.join(chunks)
-        boundary = self._find_boundary(chunk)
+        # Search the chunks in place rather than copying them, unless a short
+        # chunk must be joined to the next one.
+        if len(chunks) == 1:
+            chunk, start = chunks[0]
+        else:
+            chunk, start = b''.join(chunk[start:] for chunk, start in chunks), 0
+        boundary = self._find_boundary(chunk, start)
 
         if boundary:
             end, next = boundary
-            stream.unget(chunk[next:])
+            stream.unget_buffer(chunk, next)
             self._done = True
-            return chunk[:end]
+            return chunk[start:end]
+        elif self._done:
+            # There's nothing left, we should just return.
+            return chunk[start:]
         else:
             # make sure we don't treat a partial boundary (and
             # its separators) as data
-            if not chunk[:-rollback]:  # and len(chunk) >= (len(self._boundary) + 6):
-                # There's nothing left, we should just return and mark as done.
-                self._done = True
-                return chunk
-            else:
-                stream.unget(chunk[-rollback:])
-                return chunk[:-rollback]
+            end = self._find_partial_boundary(chunk, start)
+            stream.unget_buffer(chunk, end)
+            return chunk[start:end]
 
-    def _find_boundary(self, data):
+    def _find_boundary(self, data, start=0):
         """
-        Find a multipart boundary in data.
+        Find a multipart boundary in data[start:].
 
         Should no boundary exist in the data, return None. Otherwise, return
         a tuple containing the indices of the following:
          * the end of current encapsulation
          * the start of the next encapsulation
         """
-        index = data.find(self._boundary)
+        index = data.find(self._boundary, start)
         if index < 0:
             return None
         else:
             end = index
             next = index + len(self._boundary)
             # backup over CRLF
-            last = max(0, end - 1)
+            last = max(start, end - 1)
             if data[last:last + 1] == b'\n':
                 end -= 1
-            last = max(0, end - 1)
+            last = max(start, end - 1)
             if data[last:last + 1] == b'\r':
                 end -= 1
             return end, next
 
+    def _find_partial_boundary(self, data, start=0):
+        """
+        Return the index of the first byte at the end of data[start:] which
+        may be the beginning of a boundary and its preceding CRLF, or
+        len(data) if there isn't any.
+        """
+        for index in range(max(start, len(data) - len(self._boundary) - 1), len(data)):
+            # Only CR, LF, and "-" can begin a boundary.
+            if data[index] in (13, 10, 45):
+                tail = data[index:]
+                if any(prefix.startswith(tail) for prefix in self._boundary_prefixes):
+                    return index
+        return len(data)
+
 
 def exhaust(stream_or_iterable):
     """Exhaust an iterator or stream."""
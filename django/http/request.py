@@ -1,6 +1,7 @@
 import copy
 import re
 import warnings
+from collections.abc import Mapping
 from io import BytesIO
 from itertools import chain
 from urllib.parse import quote, urlencode, urljoin, urlsplit
@@ -65,6 +66,10 @@ class HttpRequest:
             return '<%s>' % self.__class__.__name__
         return '<%s: %s %r>' % (self.__class__.__name__, self.method, self.get_full_path())
 
+    @cached_property
+    def headers(self):
+        return HttpHeaders(self.META)
+
     def _get_raw_host(self):
         """
         Return the HTTP host using the environment or request headers. Skip
@@ -359,6 +364,57 @@ class HttpRequest:
         return list(self)
 
 
+class HttpHeaders(Mapping):
+    """
+    A read-only, case-insensitive view of the HTTP headers of a request's
+    META, e.g. headers['User-Agent'] is META['HTTP_USER_AGENT']. Lookups are
+    translated to META keys rather than copying the headers.
+    """
+    HTTP_PREFIX = 'HTTP_'
+    # PEP 333 gives two headers which aren't prepended with HTTP_.
+    UNPREFIXED_HEADERS = {'CONTENT_TYPE', 'CONTENT_LENGTH'}
+
+    def __init__(self, environ):
+        self._environ = environ
+
+    @classmethod
+    def to_meta_key(cls, name):
+        """Return the META key of a header name, or None if it's invalid."""
+        if '_' in name:
+            return None
+        key = name.upper().replace('-', '_')
+        if key in cls.UNPREFIXED_HEADERS:
+            return key
+        return cls.HTTP_PREFIX + key
+
+    @classmethod
+    def parse_header_name(cls, key):
+        """Return the header name of a META key, or None if it isn't one."""
+        if key.startswith(cls.HTTP_PREFIX):
+            key = key[len(cls.HTTP_PREFIX):]
+        elif key not in cls.UNPREFIXED_HEADERS:
+            return None
+        return key.replace('_', '-').title()
+
+    def __getitem__(self, name):
+        key = self.to_meta_key(name)
+        if key is None or key not in self._environ:
+            raise KeyError(name)
+        return self._environ[key]
+
+    def __iter__(self):
+        for key in self._environ:
+            name = self.parse_header_name(key)
+            if name is not None:
+                yield name
+
+    def __len__(self):
+        return sum(1 for name in self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
 class QueryDict(MultiValueDict):
     """
     A specialized MultiValueDict which represents a query string.
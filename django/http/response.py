@@ -1,25 +1,30 @@
 import datetime
-import json
 import mimetypes
 import os
 import re
 import sys
+import threading
 import time
+import uuid
 from email.header import Header
 from http.client import responses
+from queue import Empty, Full, Queue
 from urllib.parse import quote, urlparse
 
 from django.conf import settings
 from django.core import signals, signing
 from django.core.exceptions import DisallowedRedirect
-from django.core.serializers.json import DjangoJSONEncoder
+from django.core.serializers.json import DjangoJSONEncoder, get_json_backend
+from django.db import connections
 from django.http.cookie import SimpleCookie
-from django.utils import timezone
+from django.utils import timezone, translation
 from django.utils.encoding import iri_to_uri
-from django.utils.http import http_date
+from django.utils.http import etag_from_stat, http_date
 
 _charset_from_content_type_re = re.compile(r';\s*charset=(?P<charset>[^\s;]+)', re.I)
 
+_event_line_break_re = re.compile(r'\r\n|\r|\n')
+
 
 class BadHeaderError(ValueError):
     pass
@@ -423,7 +428,9 @@ class FileResponse(StreamingHttpResponse):
         filename = getattr(filelike, 'name', None)
         filename = filename if (isinstance(filename, str) and filename) else self.filename
         if os.path.isabs(filename):
-            self['Content-Length'] = os.path.getsize(filelike.name)
+            stat_result = os.stat(filelike.name)
+            self['Content-Length'] = stat_result.st_size
+            self['ETag'] = etag_from_stat(stat_result)
         elif hasattr(filelike, 'getbuffer'):
             self['Content-Length'] = filelike.getbuffer().nbytes
 
@@ -447,6 +454,117 @@ class FileResponse(StreamingHttpResponse):
                     file_expr = "filename*=utf-8''{}".format(quote(filename))
                 self['Content-Disposition'] = 'attachment; {}'.format(file_expr)
 
+    def supports_ranges(self):
+        """
+        Return whether the response can be restricted to byte ranges of the
+        file with set_ranges().
+        """
+        filelike = self.file_to_stream
+        if self.status_code != 200 or filelike is None or not self.has_header('Content-Length'):
+            return False
+        # Let the front-end web server handle the Range header.
+        if settings.FILE_RESPONSE_OFFLOAD_HEADER and self.get_offload_location() is not None:
+            return False
+        try:
+            return filelike.seekable()
+        except (AttributeError, OSError, ValueError):
+            return False
+
+    def set_ranges(self, ranges):
+        """
+        Restrict the response to the given byte ranges, a list of (first byte,
+        last byte) tuples sorted and not overlapping: a 206 Partial Content
+        response with a single range or a multipart/byteranges body, or a 416
+        Range Not Satisfiable response if the list is empty.
+        """
+        filelike = self.file_to_stream
+        size = int(self['Content-Length'])
+        offset = filelike.tell()
+        if not ranges:
+            self.status_code = 416
+            self['Content-Range'] = 'bytes */%d' % size
+            self['Content-Length'] = 0
+            self.streaming_content = []
+            return
+        self.status_code = 206
+        if len(ranges) == 1:
+            first, last = ranges[0]
+            self['Content-Range'] = 'bytes %d-%d/%d' % (first, last, size)
+            self['Content-Length'] = last - first + 1
+            self.streaming_content = self._read_range(filelike, offset + first, last - first + 1)
+            return
+        boundary = uuid.uuid4().hex
+        content_type = self.get('Content-Type', 'application/octet-stream')
+        parts = []
+        for first, last in ranges:
+            headers = '--%s\r\nContent-Type: %s\r\nContent-Range: bytes %d-%d/%d\r\n\r\n' % (
+                boundary, content_type, first, last, size,
+            )
+            parts.append((headers.encode('latin-1'), first, last))
+        end = ('--%s--\r\n' % boundary).encode()
+        self['Content-Type'] = 'multipart/byteranges; boundary=%s' % boundary
+        self['Content-Length'] = sum(len(headers) + last - first + 3 for headers, first, last in parts) + len(end)
+        self.streaming_content = self._read_ranges(filelike, offset, parts, end)
+
+    def _read_range(self, filelike, start, length):
+        filelike.seek(start)
+        while length > 0:
+            data = filelike.read(min(self.block_size, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+
+    def _read_ranges(self, filelike, offset, parts, end):
+        for headers, first, last in parts:
+            yield headers
+            yield from self._read_range(filelike, offset + first, last - first + 1)
+            yield b'\r\n'
+        yield end
+
+    def get_offload_location(self):
+        """
+        Return the value of the FILE_RESPONSE_OFFLOAD_HEADER header with which
+        the front-end web server sends the file, or None if Django must send it.
+        """
+        filelike = self.file_to_stream
+        filename = getattr(filelike, 'name', None)
+        if not isinstance(filename, str) or not os.path.isabs(filename):
+            return None
+        # The front-end web server sends the whole file.
+        try:
+            if filelike.tell() != 0:
+                return None
+        except (AttributeError, OSError):
+            return None
+        if not settings.FILE_RESPONSE_OFFLOAD_PATHS:
+            return filename
+        filename = os.path.normpath(filename)
+        for directory, location in settings.FILE_RESPONSE_OFFLOAD_PATHS.items():
+            directory = os.path.join(os.path.normpath(directory), '')
+            if filename.startswith(directory):
+                path = filename[len(directory):].replace(os.sep, '/')
+                if settings.FILE_RESPONSE_OFFLOAD_HEADER == 'X-Accel-Redirect':
+                    path = quote(path)
+                return location.rstrip('/') + '/' + path
+        return None
+
+    def offload(self):
+        """
+        Let the front-end web server send the file with the header set in
+        FILE_RESPONSE_OFFLOAD_HEADER, if any. Return whether it was offloaded.
+        """
+        if self.file_to_stream is None or not settings.FILE_RESPONSE_OFFLOAD_HEADER:
+            return False
+        location = self.get_offload_location()
+        if location is None:
+            return False
+        self[settings.FILE_RESPONSE_OFFLOAD_HEADER] = location
+        # The front-end web server sets the length of the file.
+        del self['Content-Length']
+        self._set_streaming_content([])
+        return True
+
 
 class HttpResponseRedirectBase(HttpResponse):
     allowed_schemes = ['http', 'https', 'ftp']
@@ -555,5 +673,190 @@ class JsonResponse(HttpResponse):
         if json_dumps_params is None:
             json_dumps_params = {}
         kwargs.setdefault('content_type', 'application/json')
-        data = json.dumps(data, cls=encoder, **json_dumps_params)
+        data = get_json_backend().dumps_bytes(data, cls=encoder, **json_dumps_params)
         super().__init__(content=data, **kwargs)
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """
+    A streaming HTTP response class that serializes the items of an iterable
+    to a JSON array as they're consumed, so that large results don't have to
+    be held in memory.
+
+    :param items: An iterable of the items of the array, e.g. a
+      ``QuerySet.iterator()``.
+    :param encoder: Should be a json encoder class. Defaults to
+      ``django.core.serializers.json.DjangoJSONEncoder``.
+    :param json_dumps_params: A dictionary of kwargs passed to json.dumps()
+      for each item.
+    """
+    # The minimum number of bytes of encoded items sent at once.
+    chunk_size = 16 * 1024
+
+    def __init__(self, items, encoder=DjangoJSONEncoder, json_dumps_params=None, **kwargs):
+        if json_dumps_params is None:
+            json_dumps_params = {}
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(self._encode_items(items, encoder, json_dumps_params), **kwargs)
+
+    def _encode_items(self, items, encoder, json_dumps_params):
+        dumps = get_json_backend().dumps_bytes
+        chunk = bytearray(b'[')
+        separator = b''
+        for item in items:
+            chunk += separator
+            chunk += dumps(item, cls=encoder, **json_dumps_params)
+            separator = b','
+            if len(chunk) >= self.chunk_size:
+                yield bytes(chunk)
+                chunk = bytearray()
+        chunk += b']'
+        yield bytes(chunk)
+
+
+class ServerSentEvent:
+    """
+    An event sent by an EventStreamResponse. The data is sent as one line per
+    line of data; the event type and the id mustn't contain line breaks.
+    """
+    def __init__(self, data=None, event=None, id=None, retry=None):
+        for name, value in (('event', event), ('id', id)):
+            if value is not None and _event_line_break_re.search(str(value)):
+                raise ValueError("The %s of a server-sent event can't contain line breaks." % name)
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def __repr__(self):
+        return '<%s: event=%r, id=%r>' % (self.__class__.__name__, self.event, self.id)
+
+    def encode(self):
+        """Return the event in the text/event-stream format."""
+        lines = []
+        if self.event is not None:
+            lines.append('event: %s' % self.event)
+        if self.id is not None:
+            lines.append('id: %s' % self.id)
+        if self.retry is not None:
+            lines.append('retry: %d' % self.retry)
+        if self.data is not None:
+            data = self.data.decode() if isinstance(self.data, bytes) else str(self.data)
+            lines.extend('data: %s' % line for line in _event_line_break_re.split(data))
+        return ('\n'.join(lines) + '\n\n').encode()
+
+
+class EventStreamResponse(StreamingHttpResponse):
+    """
+    A streaming HTTP response class that sends server-sent events.
+
+    :param events: An iterable of ServerSentEvent instances, or of strings
+      sent as the data of an event.
+    :param heartbeat_interval: Send a comment line whenever no event was sent
+      for this many seconds, so that a disconnected client is noticed. None
+      disables heartbeats.
+    :param max_duration: End the stream after this many seconds, to let the
+      client reconnect. None means no limit.
+    :param retry: The reconnection time sent to the client, in milliseconds.
+    """
+    heartbeat = b':\n\n'
+    # The maximum number of events encoded ahead of sending them.
+    queue_size = 16
+
+    def __init__(self, events=(), *args, heartbeat_interval=15, max_duration=None, retry=None, **kwargs):
+        kwargs.setdefault('content_type', 'text/event-stream')
+        super().__init__((), *args, **kwargs)
+        self.heartbeat_interval = heartbeat_interval
+        self.max_duration = max_duration
+        self.retry = retry
+        self['Cache-Control'] = 'no-cache'
+        # Disable the response buffering of nginx.
+        self['X-Accel-Buffering'] = 'no'
+        self._stopped = threading.Event()
+        self.streaming_content = self._stream_events(events)
+
+    def encode_event(self, event):
+        if not isinstance(event, ServerSentEvent):
+            event = ServerSentEvent(event)
+        return event.encode()
+
+    def _stream_events(self, events):
+        if self.retry is not None:
+            yield ServerSentEvent(retry=self.retry).encode()
+        deadline = None if self.max_duration is None else time.monotonic() + self.max_duration
+        if self.heartbeat_interval is None:
+            try:
+                for event in events:
+                    yield self.encode_event(event)
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+            finally:
+                if hasattr(events, 'close'):
+                    events.close()
+            return
+        # The events are produced in a thread so that heartbeats can be sent
+        # while waiting for the next event. Writing a heartbeat to a
+        # disconnected client fails and closes the response, which stops the
+        # thread after its current event. The thread uses the language, time
+        # zone, and URL configuration active while iterating the response.
+        from django.urls import get_script_prefix, get_urlconf  # Avoid circular import.
+        queue = Queue(self.queue_size)
+        state = (translation.get_language(), timezone.get_current_timezone(), get_script_prefix(), get_urlconf())
+        threading.Thread(target=self._produce_events, args=(events, queue, state), daemon=True).start()
+        try:
+            while True:
+                timeout = self.heartbeat_interval
+                if deadline is not None:
+                    timeout = min(timeout, deadline - time.monotonic())
+                    if timeout <= 0:
+                        break
+                try:
+                    item = queue.get(timeout=timeout)
+                except Empty:
+                    if deadline is None or time.monotonic() < deadline:
+                        yield self.heartbeat
+                    continue
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self._stopped.set()
+
+    def _produce_events(self, events, queue, state):
+        from django.urls import set_script_prefix, set_urlconf  # Avoid circular import.
+        language, tzinfo, script_prefix, urlconf = state
+        if language is None:
+            translation.deactivate_all()
+        else:
+            translation.activate(language)
+        timezone.activate(tzinfo)
+        set_script_prefix(script_prefix)
+        set_urlconf(urlconf)
+        error = None
+        try:
+            for event in events:
+                if not self._put(queue, self.encode_event(event)):
+                    return
+        except Exception as exc:
+            error = exc
+        finally:
+            if hasattr(events, 'close'):
+                events.close()
+            # The database connections of this thread won't be reused.
+            connections.close_all()
+        self._put(queue, error)
+
+    def _put(self, queue, item):
+        """
+        Put item in queue. Return False if the response is closed before
+        there's room for it.
+        """
+        while not self._stopped.is_set():
+            try:
+                queue.put(item, timeout=1)
+            except Full:
+                continue
+            return True
+        return False
@@ -0,0 +1,108 @@
+import copy
+import html
+import logging
+import re
+from urllib.parse import urlsplit
+
+from django.http import Http404, QueryDict
+from django.urls import get_resolver, get_script_prefix
+from django.utils.cache import (
+    cc_delim_re, patch_cache_control, patch_vary_headers,
+)
+from django.utils.deprecation import MiddlewareMixin
+
+logger = logging.getLogger('django.request')
+
+esi_include_re = re.compile(rb'<esi:include\s[^>]*?/>')
+esi_src_re = re.compile(rb'\ssrc="([^"]*)"')
+
+
+class ESIMiddleware(MiddlewareMixin):
+    """
+    Replace the Edge Side Includes tags of HTML responses, e.g. output by the
+    {% esi_include %} template tag, with the content of the fragments they
+    include. If the request comes through an ESI-capable proxy, which
+    announces it with the Surrogate-Capability header, leave them to it.
+
+    This middleware should be above UpdateCacheMiddleware, so that the cached
+    responses contain the tags rather than the personalized fragments, and
+    below GZipMiddleware.
+    """
+    def process_response(self, request, response):
+        if (response.streaming or response.has_header('Content-Encoding') or
+                not response.get('Content-Type', '').startswith('text/html') or
+                b'<esi:include' not in response.content):
+            return response
+
+        if 'ESI/1.0' in request.META.get('HTTP_SURROGATE_CAPABILITY', ''):
+            response['Surrogate-Control'] = 'content="ESI/1.0"'
+            return response
+
+        fragments = []
+
+        def include(match):
+            src = esi_src_re.search(match.group())
+            if src is None:
+                return b''
+            src = html.unescape(src.group(1).decode())
+            # As with onerror="continue", failed fragments are left out.
+            try:
+                fragment = self.get_fragment_response(request, src)
+                fragments.append(fragment)
+                if fragment.status_code != 200:
+                    return b''
+                return b''.join(fragment.streaming_content) if fragment.streaming else fragment.content
+            except Http404:
+                logger.warning(
+                    'ESI fragment not found: %s', src,
+                    extra={'status_code': 404, 'request': request},
+                )
+                return b''
+            except Exception:
+                logger.exception(
+                    'Error in ESI fragment: %s', src,
+                    extra={'status_code': 500, 'request': request},
+                )
+                return b''
+
+        response.content = esi_include_re.sub(include, response.content)
+        for fragment in fragments:
+            if fragment.has_header('Vary'):
+                patch_vary_headers(response, cc_delim_re.split(fragment['Vary']))
+        # The fragments may be personalized, so the validators of the page
+        # don't apply to the assembled response.
+        patch_cache_control(response, private=True)
+        for header in ('ETag', 'Last-Modified'):
+            if response.has_header(header):
+                del response[header]
+        if response.has_header('Content-Length'):
+            response['Content-Length'] = str(len(response.content))
+        return response
+
+    def get_fragment_response(self, request, src):
+        """
+        Return the response of the view of the fragment at src to a GET
+        request which is otherwise a copy of request, e.g. with the same user
+        and session.
+        """
+        url = urlsplit(src)
+        script_prefix = get_script_prefix()
+        path_info = url.path
+        if path_info.startswith(script_prefix):
+            path_info = '/' + path_info[len(script_prefix):]
+        fragment_request = copy.copy(request)
+        # Don't share the headers view of the original META.
+        fragment_request.__dict__.pop('headers', None)
+        fragment_request.method = 'GET'
+        fragment_request.path = url.path
+        fragment_request.path_info = path_info
+        fragment_request.GET = QueryDict(url.query)
+        fragment_request.META = dict(
+            request.META, REQUEST_METHOD='GET', PATH_INFO=path_info, QUERY_STRING=url.query,
+        )
+        resolver_match = get_resolver(getattr(request, 'urlconf', None)).resolve(path_info)
+        fragment_request.resolver_match = resolver_match
+        response = resolver_match.func(fragment_request, *resolver_match.args, **resolver_match.kwargs)
+        if hasattr(response, 'render') and callable(response.render):
+            response = response.render()
+        return response
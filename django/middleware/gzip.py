@@ -1,41 +1,194 @@
-import re
+import hashlib
+import threading
+from collections import OrderedDict
 
 from django.utils.cache import patch_vary_headers
 from django.utils.deprecation import MiddlewareMixin
 from django.utils.text import compress_sequence, compress_string
 
-re_accepts_gzip = re.compile(r'\bgzip\b')
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def parse_accept_encoding(header):
+    """
+    Return a dictionary mapping the content codings of an Accept-Encoding
+    header to their quality value.
+    """
+    codings = {}
+    for item in header.split(','):
+        coding, *params = item.split(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def brotli_compress_string(s, level):
+    return brotli.compress(s, quality=level)
+
+
+def brotli_compress_sequence(sequence, level, flush_size=16 * 1024):
+    compressor = brotli.Compressor(quality=level)
+    pending = 0
+    for item in sequence:
+        data = compressor.process(item)
+        pending += len(item)
+        if pending >= flush_size:
+            data += compressor.flush()
+            pending = 0
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def zstd_compress_string(s, level):
+    return zstandard.ZstdCompressor(level=level).compress(s)
+
+
+def zstd_compress_sequence(sequence, level, flush_size=16 * 1024):
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    pending = 0
+    for item in sequence:
+        data = compressor.compress(item)
+        pending += len(item)
+        if pending >= flush_size:
+            data += compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            pending = 0
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# Functions compressing a string and an iterator of strings for each available
+# content coding. They take the compression level as their second argument and
+# the latter takes the number of bytes written between flushes as its third.
+COMPRESSORS = {'gzip': (compress_string, compress_sequence)}
+if brotli is not None:
+    COMPRESSORS['br'] = (brotli_compress_string, brotli_compress_sequence)
+if zstandard is not None:
+    COMPRESSORS['zstd'] = (zstd_compress_string, zstd_compress_sequence)
 
 
 class GZipMiddleware(MiddlewareMixin):
     """
-    Compress content if the browser allows gzip compression.
-    Set the Vary header accordingly, so that caches will base their storage
-    on the Accept-Encoding header.
+    Compress content with the best content coding the browser allows: Brotli
+    and Zstandard, if the brotli and zstandard libraries are installed, or
+    gzip. Set the Vary header accordingly, so that caches will base their
+    storage on the Accept-Encoding header.
+
+    The compressed content of responses with a strong ETag is cached, so that
+    the same response isn't compressed again.
     """
+    # Supported content codings, in order of preference.
+    encodings = ('br', 'zstd', 'gzip')
+    # The compression level of each content coding.
+    compression_levels = {'br': 4, 'gzip': 6, 'zstd': 3}
+    # The maximum number of compressed responses cached, and the maximum size
+    # of a cached response.
+    cache_size = 100
+    max_cached_content_length = 1024 * 1024
+    # The compressed data of streaming responses is flushed whenever this many
+    # bytes of content have been compressed since the last flush.
+    streaming_flush_size = 16 * 1024
+
+    def __init__(self, get_response=None):
+        super().__init__(get_response)
+        self.cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+
+    def get_encoding(self, request):
+        """
+        Return the content coding to use for the response to request, or None
+        if the response shouldn't be compressed.
+        """
+        accepted = parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        best_encoding, best_quality = None, 0
+        for encoding in self.encodings:
+            if encoding not in COMPRESSORS:
+                continue
+            quality = accepted.get(encoding, accepted.get('*', 0))
+            if quality > best_quality:
+                best_encoding, best_quality = encoding, quality
+        return best_encoding
+
+    def compress_content(self, request, response, encoding):
+        """
+        Return the compressed content of response, cached by its ETag. ETags
+        are only unique per URL and a view may produce them carelessly, so the
+        path and a digest of the content are part of the cache key as well.
+        """
+        compress = COMPRESSORS[encoding][0]
+        level = self.compression_levels[encoding]
+        etag = response.get('ETag')
+        content = response.content
+        if not etag or not etag.startswith('"') or len(content) > self.max_cached_content_length:
+            return compress(content, level)
+        key = (etag, encoding, request.path, hashlib.sha1(content).digest())
+        with self.cache_lock:
+            compressed_content = self.cache.get(key)
+            if compressed_content is not None:
+                self.cache.move_to_end(key)
+                return compressed_content
+        compressed_content = compress(content, level)
+        with self.cache_lock:
+            self.cache[key] = compressed_content
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return compressed_content
+
     def process_response(self, request, response):
         # It's not worth attempting to compress really short responses.
         if not response.streaming and len(response.content) < 200:
             return response
 
-        # Avoid gzipping if we've already got a content-encoding.
+        # Avoid compressing if we've already got a content-encoding.
         if response.has_header('Content-Encoding'):
             return response
 
+        # The byte ranges of a partial response refer to the uncompressed
+        # representation.
+        if response.status_code == 206 or response.has_header('Content-Range'):
+            return response
+
+        # Compression would delay server-sent events until the compressor
+        # flushes.
+        if response.get('Content-Type', '').startswith('text/event-stream'):
+            return response
+
         patch_vary_headers(response, ('Accept-Encoding',))
 
-        ae = request.META.get('HTTP_ACCEPT_ENCODING', '')
-        if not re_accepts_gzip.search(ae):
+        encoding = self.get_encoding(request)
+        if encoding is None:
             return response
 
         if response.streaming:
             # Delete the `Content-Length` header for streaming content, because
             # we won't know the compressed size until we stream it.
-            response.streaming_content = compress_sequence(response.streaming_content)
+            compress = COMPRESSORS[encoding][1]
+            response.streaming_content = compress(
+                response.streaming_content, self.compression_levels[encoding], self.streaming_flush_size,
+            )
             del response['Content-Length']
         else:
             # Return the compressed content only if it's actually shorter.
-            compressed_content = compress_string(response.content)
+            compressed_content = self.compress_content(request, response, encoding)
             if len(compressed_content) >= len(response.content):
                 return response
             response.content = compressed_content
@@ -47,6 +200,6 @@ class GZipMiddleware(MiddlewareMixin):
         etag = response.get('ETag')
         if etag and etag.startswith('"'):
             response['ETag'] = 'W/' + etag
-        response['Content-Encoding'] = 'gzip'
+        response['Content-Encoding'] = encoding
 
         return response
@@ -18,6 +18,10 @@ class ConditionalGetMiddleware(MiddlewareMixin):
         if request.method != 'GET':
             return response
 
+        # An event stream is never the same twice.
+        if response.get('Content-Type', '').startswith('text/event-stream'):
+            return response
+
         if self.needs_etag(response) and not response.has_header('ETag'):
             set_response_etag(response)
 
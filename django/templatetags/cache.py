@@ -3,6 +3,7 @@ from django.core.cache.utils import make_template_fragment_key
 from django.template import (
     Library, Node, TemplateSyntaxError, VariableDoesNotExist,
 )
+from django.utils.html import format_html
 
 register = Library()
 
@@ -91,3 +92,19 @@ def do_cache(parser, token):
         [parser.compile_filter(t) for t in tokens[3:]],
         cache_name,
     )
+
+
+@register.simple_tag
+def esi_include(src):
+    """
+    Output an Edge Side Includes tag which is replaced by the content of the
+    URL src, either by ESIMiddleware or by an ESI-capable proxy.
+
+    Usage::
+
+        {% esi_include '/fragments/user-menu/' %}
+
+    Personalized regions of a page can be punched out of it this way, so that
+    the rest of the page can be cached for all users.
+    """
+    return format_html('<esi:include src="{}" />', src)
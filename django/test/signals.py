@@ -108,6 +108,13 @@ def clear_serializers_cache(**kwargs):
         serializers._serializers = {}
 
 
+@receiver(setting_changed)
+def clear_json_backend_cache(**kwargs):
+    if kwargs['setting'] == 'JSON_BACKEND':
+        from django.core.serializers.json import get_json_backend
+        get_json_backend.cache_clear()
+
+
 @receiver(setting_changed)
 def language_changed(**kwargs):
     if kwargs['setting'] in {'LANGUAGES', 'LANGUAGE_CODE', 'LOCALE_PATHS'}:
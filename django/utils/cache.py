@@ -25,7 +25,8 @@ from django.core.cache import caches
 from django.http import HttpResponse, HttpResponseNotModified
 from django.utils.encoding import force_bytes, iri_to_uri
 from django.utils.http import (
-    http_date, parse_etags, parse_http_date_safe, quote_etag,
+    http_date, parse_etags, parse_http_date_safe, parse_range_header,
+    quote_etag,
 )
 from django.utils.log import log_response
 from django.utils.timezone import get_current_timezone_name
@@ -166,11 +167,35 @@ def get_conditional_response(request, etag=None, last_modified=None, response=No
         if request.method in ('GET', 'HEAD'):
             return _not_modified(request, response)
 
-    # Step 5: Test the If-Range precondition (not supported).
+    # Step 5: Test the If-Range precondition and restrict the response to the
+    # ranges of the Range header, as defined in section 3 of RFC 7233.
+    if response is not None and getattr(response, 'supports_ranges', None) and response.supports_ranges():
+        response['Accept-Ranges'] = 'bytes'
+        range_header = request.META.get('HTTP_RANGE')
+        if_range = request.META.get('HTTP_IF_RANGE')
+        if (request.method == 'GET' and range_header and
+                (not if_range or _if_range_passes(etag, last_modified, if_range))):
+            ranges = parse_range_header(range_header, int(response['Content-Length']))
+            if ranges is not None:
+                response.set_ranges(ranges)
+
     # Step 6: Return original response since there isn't a conditional response.
     return response
 
 
+def _if_range_passes(target_etag, last_modified, if_range):
+    """
+    Test the If-Range condition as defined in section 3.2 of RFC 7233: the
+    entity tag must strongly match the current one or the date must be the
+    modification date.
+    """
+    if_range_etags = parse_etags(if_range)
+    if if_range_etags and if_range_etags != ['*']:
+        return bool(target_etag) and not target_etag.startswith('W/') and if_range_etags == [target_etag]
+    if_range_date = parse_http_date_safe(if_range)
+    return if_range_date is not None and last_modified is not None and int(last_modified) == if_range_date
+
+
 def _if_match_passes(target_etag, etags):
     """
     Test the If-Match comparison as defined in section 3.1 of RFC 7232.
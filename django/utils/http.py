@@ -263,6 +263,56 @@ def quote_etag(etag_str):
         return '"%s"' % etag_str
 
 
+def etag_from_stat(stat_result):
+    """
+    Return a strong ETag for a file from the result of os.stat(), based on
+    its modification time and size.
+    """
+    return '"%x-%x"' % (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def parse_range_header(header, size):
+    """
+    Parse a Range header as defined by RFC 7233 for a representation of size
+    bytes. Return a list of (first byte, last byte) tuples, sorted and with
+    overlapping or adjacent ranges merged, which is empty if none of the
+    ranges is satisfiable, or None if the header must be ignored.
+    """
+    unit, _, byte_ranges = header.partition('=')
+    if unit.strip().lower() != 'bytes':
+        return None
+    byte_ranges = [byte_range.strip() for byte_range in byte_ranges.split(',')]
+    byte_ranges = [byte_range for byte_range in byte_ranges if byte_range]
+    if not byte_ranges:
+        return None
+    ranges = []
+    for byte_range in byte_ranges:
+        first, sep, last = byte_range.partition('-')
+        first, last = first.strip(), last.strip()
+        if not sep or not (first.isdigit() or first == '') or not (last.isdigit() or last == ''):
+            return None
+        if not first:
+            # A suffix range of the last bytes.
+            if not last:
+                return None
+            if int(last) > 0 and size > 0:
+                ranges.append((max(0, size - int(last)), size - 1))
+            continue
+        first, last = int(first), int(last) if last else None
+        if last is not None and last < first:
+            return None
+        if first < size:
+            ranges.append((first, size - 1 if last is None else min(last, size - 1)))
+    ranges.sort()
+    merged = []
+    for first, last in ranges:
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    return merged
+
+
 def is_same_domain(host, pattern):
     """
     Return ``True`` if the host is either an exact match or a match
@@ -274,9 +274,9 @@ def phone2numeric(phone):
 
 # From http://www.xhaus.com/alan/python/httpcomp.html#gzip
 # Used with permission.
-def compress_string(s):
+def compress_string(s, level=6):
     zbuf = BytesIO()
-    with GzipFile(mode='wb', compresslevel=6, fileobj=zbuf, mtime=0) as zfile:
+    with GzipFile(mode='wb', compresslevel=level, fileobj=zbuf, mtime=0) as zfile:
         zfile.write(s)
     return zbuf.getvalue()
 
@@ -302,14 +302,22 @@ class StreamingBuffer:
         return
 
 
-# Like compress_string, but for iterators of strings.
-def compress_sequence(sequence):
+# Like compress_string, but for iterators of strings. The compressed data is
+# flushed whenever flush_size bytes have been written since the last flush, so
+# that it's sent before the end of the sequence without compressing too small
+# blocks.
+def compress_sequence(sequence, level=6, flush_size=16 * 1024):
     buf = StreamingBuffer()
-    with GzipFile(mode='wb', compresslevel=6, fileobj=buf, mtime=0) as zfile:
+    with GzipFile(mode='wb', compresslevel=level, fileobj=buf, mtime=0) as zfile:
         # Output headers...
         yield buf.read()
+        pending = 0
         for item in sequence:
             zfile.write(item)
+            pending += len(item)
+            if pending >= flush_size:
+                zfile.flush()
+                pending = 0
             data = buf.read()
             if data:
                 yield data
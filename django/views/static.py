@@ -12,7 +12,8 @@ from django.http import (
 )
 from django.template import Context, Engine, TemplateDoesNotExist, loader
 from django.utils._os import safe_join
-from django.utils.http import http_date, parse_http_date
+from django.utils.cache import get_conditional_response
+from django.utils.http import etag_from_stat, http_date, parse_http_date
 from django.utils.translation import gettext as _, gettext_lazy
 
 
@@ -45,13 +46,20 @@ def serve(request, path, document_root=None, show_indexes=False):
     if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'),
                               statobj.st_mtime, statobj.st_size):
         return HttpResponseNotModified()
+    # Respect the other conditional request headers before opening the file.
+    etag = etag_from_stat(statobj)
+    last_modified = int(statobj.st_mtime)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        return response
     content_type, encoding = mimetypes.guess_type(str(fullpath))
     content_type = content_type or 'application/octet-stream'
     response = FileResponse(fullpath.open('rb'), content_type=content_type)
     response["Last-Modified"] = http_date(statobj.st_mtime)
     if encoding:
         response["Content-Encoding"] = encoding
-    return response
+    # Respect the Range and If-Range headers.
+    return get_conditional_response(request, etag=etag, last_modified=last_modified, response=response)
 
 
 DEFAULT_DIRECTORY_INDEX_TEMPLATE = """
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+#
+# Benchmark MigrationAutodetector on a large synthetic project, comparing two
+# equal project states (as `makemigrations --check` does on an up to date
+# project) and two states that differ by one field.
+#
+#  $ python scripts/benchmarks/autodetector.py --apps=30 --models=30
+
+import time
+from argparse import ArgumentParser
+
+import django
+from django.conf import settings
+
+settings.configure(
+    DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3'}},
+    INSTALLED_APPS=[],
+)
+django.setup()
+
+from django.db import models  # NOQA isort:skip
+from django.db.migrations.autodetector import MigrationAutodetector  # NOQA isort:skip
+from django.db.migrations.graph import MigrationGraph  # NOQA isort:skip
+from django.db.migrations.questioner import MigrationQuestioner  # NOQA isort:skip
+from django.db.migrations.state import ModelState, ProjectState  # NOQA isort:skip
+
+
+def build_state(app_count, model_count, changed=False):
+    """
+    Return a state of `app_count` apps with `model_count` models each. Models
+    have a foreign key to a model of the previous app. If `changed` is True,
+    the first model has an extra field.
+    """
+    state = ProjectState()
+    for app in range(app_count):
+        app_label = 'app%d' % app
+        for index in range(model_count):
+            fields = [
+                ('id', models.AutoField(primary_key=True)),
+                ('name', models.CharField(max_length=100, db_index=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('amount', models.DecimalField(max_digits=10, decimal_places=2, default=0)),
+                ('active', models.BooleanField(default=True)),
+            ]
+            if app:
+                fields.append(('parent', models.ForeignKey('app%d.Model%d' % (app - 1, index), models.CASCADE)))
+            if changed and app == 0 and index == 0:
+                fields.append(('extra', models.IntegerField(null=True)))
+            state.add_model(ModelState(app_label, 'Model%d' % index, fields, options={
+                'ordering': ['name'],
+                'indexes': [models.Index(fields=['name', 'created'], name='%s_%d_idx' % (app_label, index))],
+            }))
+    return state
+
+
+def detect(app_count, model_count, changed):
+    from_state = build_state(app_count, model_count)
+    to_state = build_state(app_count, model_count, changed=changed)
+    start = time.perf_counter()
+    autodetector = MigrationAutodetector(from_state, to_state, MigrationQuestioner({'ask_initial': True}))
+    changes = autodetector.changes(graph=MigrationGraph())
+    elapsed = time.perf_counter() - start
+    assert bool(changes) == changed
+    return elapsed
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--apps', type=int, default=30)
+    parser.add_argument('--models', type=int, default=30, help='Models per app.')
+    parser.add_argument('--repeat', type=int, default=3)
+    options = parser.parse_args()
+    print('%d apps, %d models:' % (options.apps, options.apps * options.models))
+    for changed in (False, True):
+        timings = [detect(options.apps, options.models, changed) for _ in range(options.repeat)]
+        print('  %s: %.2f sec (best of %d)' % (
+            'one change' if changed else 'no change ', min(timings), options.repeat,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+#
+# Benchmark walking the project states of a large synthetic migration graph
+# the way MigrationExecutor does when applying it. It doesn't need a database
+# since only the state changes of the operations are run.
+#
+#  $ python scripts/benchmarks/migration_state.py --apps=50 --migrations=8
+
+import time
+from argparse import ArgumentParser
+
+import django
+from django.conf import settings
+
+settings.configure(
+    DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3'}},
+    INSTALLED_APPS=[],
+)
+django.setup()
+
+from django.db import migrations, models  # NOQA isort:skip
+from django.db.migrations.graph import MigrationGraph  # NOQA isort:skip
+from django.db.migrations.state import ProjectState  # NOQA isort:skip
+
+MODELS_PER_APP = 3
+
+
+def make_migration(app_label, index, operations, dependencies):
+    migration = migrations.Migration('%04d_auto' % index, app_label)
+    migration.operations = operations
+    migration.dependencies = dependencies
+    return migration
+
+
+def build_graph(app_count, migration_count):
+    """
+    Return a graph of `app_count` apps with `migration_count` migrations each.
+    Models of each app have foreign keys to the models of the previous app.
+    """
+    graph = MigrationGraph()
+    for app in range(app_count):
+        app_label = 'app%d' % app
+        previous = 'app%d' % (app - 1) if app else None
+        operations = [
+            migrations.CreateModel('Model%d' % i, [
+                ('id', models.AutoField(primary_key=True)),
+                ('name', models.CharField(max_length=50)),
+            ])
+            for i in range(MODELS_PER_APP)
+        ]
+        dependencies = [(previous, '0001_auto')] if previous else []
+        nodes = [make_migration(app_label, 1, operations, dependencies)]
+        for index in range(2, migration_count + 1):
+            model_name = 'model%d' % (index % MODELS_PER_APP)
+            operations = [
+                migrations.AddField(model_name, 'field%d' % index, models.IntegerField(default=0)),
+                migrations.AlterField(model_name, 'name', models.CharField(max_length=50 + index)),
+            ]
+            if previous:
+                operations.append(migrations.AddField(
+                    model_name, 'rel%d' % index,
+                    models.ForeignKey('%s.Model%d' % (previous, index % MODELS_PER_APP), models.CASCADE),
+                ))
+            nodes.append(make_migration(app_label, index, operations, [(app_label, '%04d_auto' % (index - 1))]))
+        for migration in nodes:
+            graph.add_node((app_label, migration.name), migration)
+            for dependency in migration.dependencies:
+                graph.add_dependency(migration, (app_label, migration.name), dependency)
+    return graph
+
+
+def apply_plan(graph):
+    """
+    Walk the plan like MigrationExecutor.migrate() on an empty database:
+    keep the state before each operation and look up the models the schema
+    editor would need.
+    """
+    state = ProjectState()
+    state.apps
+    for key in graph._generate_plan(graph.leaf_nodes(), at_end=True):
+        migration = graph.nodes[key]
+        for operation in migration.operations:
+            old_state = state.clone()
+            operation.state_forwards(migration.app_label, state)
+            model_name = getattr(operation, 'model_name', getattr(operation, 'name', None))
+            state.apps.get_model(migration.app_label, model_name)
+            if not isinstance(operation, migrations.CreateModel):
+                old_state.apps.get_model(migration.app_label, model_name)
+    return state
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--apps', type=int, default=50)
+    parser.add_argument('--migrations', type=int, default=8, help='Migrations per app.')
+    parser.add_argument('--repeat', type=int, default=3)
+    options = parser.parse_args()
+    graph = build_graph(options.apps, options.migrations)
+    apply_timings = []
+    state_timings = []
+    for _ in range(options.repeat):
+        apply_timings.append(timed(apply_plan, graph))
+        # Request the rendered state of the whole graph several times, as the
+        # migrate command, its autodetector check, and the executor do.
+        state_timings.append(timed(lambda: [graph.make_state().apps for _ in range(3)]))
+        graph = build_graph(options.apps, options.migrations)
+    print('%d apps, %d migrations:' % (options.apps, len(graph.nodes)))
+    print('  apply plan:   %.2f sec (best of %d)' % (min(apply_timings), options.repeat))
+    print('  render state: %.2f sec (best of %d)' % (min(state_timings), options.repeat))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+#
+# Benchmark building a QuerySet by chaining filters across many relations.
+# It doesn't need a database since the queries are never executed.
+#
+#  $ python scripts/benchmarks/queryset_chaining.py --number=2000
+
+import timeit
+from argparse import ArgumentParser
+
+import django
+from django.conf import settings
+
+settings.configure(
+    DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3'}},
+    INSTALLED_APPS=[],
+)
+django.setup()
+
+from django.db import models  # NOQA isort:skip
+
+RELATIONS = 10
+
+
+class Target(models.Model):
+    name = models.CharField(max_length=50)
+    value = models.IntegerField()
+
+    class Meta:
+        app_label = 'benchmarks'
+
+
+class Hub(models.Model):
+    name = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = 'benchmarks'
+
+
+for i in range(RELATIONS):
+    Hub.add_to_class('rel%d' % i, models.ForeignKey(Target, models.CASCADE, related_name='+'))
+
+
+def chain_filters():
+    qs = Hub.objects.all()
+    for i in range(RELATIONS):
+        qs = qs.filter(**{'rel%d__value__gt' % i: i, 'rel%d__name' % i: 'x'})
+    return qs
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--number', type=int, default=1000, help='Querysets to build per repeat.')
+    parser.add_argument('--repeat', type=int, default=5)
+    options = parser.parse_args()
+    timings = timeit.repeat(chain_filters, number=options.number, repeat=options.repeat)
+    best = min(timings) / options.number
+    print('Chaining %d filters: %.1f usec per queryset (best of %d)' % (
+        RELATIONS, best * 1e6, options.repeat,
+    ))
+
+
+if __name__ == '__main__':
+    main()
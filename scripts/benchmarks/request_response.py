@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+#
+# Benchmark the overhead of the request and response objects, and of a
+# request/response cycle through WSGIHandler with a trivial view.
+#
+#  $ python scripts/benchmarks/request_response.py --number=20000
+
+import sys
+import timeit
+from argparse import ArgumentParser
+from io import BytesIO
+
+import django
+from django.conf import settings
+
+settings.configure(
+    ALLOWED_HOSTS=['testserver'],
+    MIDDLEWARE=[
+        'django.middleware.security.SecurityMiddleware',
+        'django.middleware.common.CommonMiddleware',
+        'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    ],
+    ROOT_URLCONF=__name__,
+    INSTALLED_APPS=[],
+)
+django.setup()
+
+from django.conf.urls import url  # NOQA isort:skip
+from django.core.handlers.wsgi import WSGIHandler, WSGIRequest  # NOQA isort:skip
+from django.http import HttpResponse, JsonResponse  # NOQA isort:skip
+
+
+def view(request):
+    return HttpResponse('Hello')
+
+
+urlpatterns = [url(r'^hello/$', view)]
+
+ENVIRON = {
+    'REQUEST_METHOD': 'GET',
+    'PATH_INFO': '/hello/',
+    'SCRIPT_NAME': '',
+    'QUERY_STRING': 'a=1&b=2',
+    'SERVER_NAME': 'testserver',
+    'SERVER_PORT': '80',
+    'SERVER_PROTOCOL': 'HTTP/1.1',
+    'HTTP_HOST': 'testserver',
+    'HTTP_USER_AGENT': 'benchmark',
+    'HTTP_ACCEPT': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'HTTP_ACCEPT_LANGUAGE': 'en-US,en;q=0.5',
+    'HTTP_ACCEPT_ENCODING': 'gzip, deflate',
+    'HTTP_COOKIE': 'sessionid=abc; csrftoken=def',
+    'wsgi.version': (1, 0),
+    'wsgi.url_scheme': 'http',
+    'wsgi.input': BytesIO(),
+    'wsgi.errors': sys.stderr,
+    'wsgi.multithread': False,
+    'wsgi.multiprocess': False,
+    'wsgi.run_once': False,
+}
+
+handler = WSGIHandler()
+
+
+def start_response(status, headers):
+    pass
+
+
+def request_init():
+    WSGIRequest(ENVIRON.copy())
+
+
+def request_headers():
+    request = WSGIRequest(ENVIRON.copy())
+    request.headers['User-Agent']
+    request.headers.get('Accept-Language')
+
+
+def response_init():
+    HttpResponse('Hello')
+
+
+def json_response_init():
+    JsonResponse({'hello': 'world', 'numbers': [1, 2, 3]})
+
+
+def handler_cycle():
+    for chunk in handler(ENVIRON.copy(), start_response):
+        pass
+
+
+BENCHMARKS = [
+    ('WSGIRequest()', request_init),
+    ('WSGIRequest() and request.headers lookups', request_headers),
+    ('HttpResponse()', response_init),
+    ('JsonResponse()', json_response_init),
+    ('WSGIHandler() request/response cycle', handler_cycle),
+]
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--number', type=int, default=10000, help='Calls per repeat.')
+    parser.add_argument('--repeat', type=int, default=5)
+    options = parser.parse_args()
+    for name, func in BENCHMARKS:
+        timings = timeit.repeat(func, number=options.number, repeat=options.repeat)
+        best = min(timings) / options.number
+        print('%s: %.2f usec per call (best of %d)' % (name, best * 1e6, options.repeat))
+
+
+if __name__ == '__main__':
+    main()
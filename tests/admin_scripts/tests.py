@@ -1331,6 +1331,25 @@ class ManageRunserver(AdminScriptTestCase):
         call_command(self.cmd, addrport="deadbeef:7654")
         self.assertServerSettings('deadbeef', '7654')
 
+    def test_runner_threads_and_processes(self):
+        with self.assertRaises(CommandError) as cm:
+            call_command(self.cmd, threads=0)
+        self.assertEqual(str(cm.exception), '--threads must be a positive integer.')
+        with self.assertRaises(CommandError) as cm:
+            call_command(self.cmd, processes=0)
+        self.assertEqual(str(cm.exception), '--processes must be a positive integer.')
+
+    @mock.patch('django.core.management.commands.runserver.os')
+    def test_runner_processes_without_fork(self, mocked_os):
+        del mocked_os.fork
+        with self.assertRaises(CommandError) as cm:
+            call_command(self.cmd, processes=2)
+        self.assertEqual(
+            str(cm.exception),
+            '--processes requires os.fork(), which is unavailable on this platform.',
+        )
+        call_command(self.cmd, processes=1)
+
     def test_no_database(self):
         """
         Ensure runserver.check_migrations doesn't choke on empty DATABASES.
@@ -1417,6 +1436,7 @@ class ManageTestserver(AdminScriptTestCase):
             addrport='',
             insecure_serving=False,
             no_color=False,
+            processes=1,
             pythonpath=None,
             settings=None,
             shutdown_message=(
@@ -1424,6 +1444,7 @@ class ManageTestserver(AdminScriptTestCase):
                 "has not been deleted. You can explore it on your own."
             ),
             skip_checks=True,
+            threads=None,
             traceback=False,
             use_ipv6=False,
             use_reloader=False,
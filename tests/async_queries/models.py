@@ -0,0 +1,9 @@
+from django.db import models
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=50)
+    age = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ('name',)
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+from django.db import connection, connections, transaction
+from django.test import TestCase, TransactionTestCase
+
+from .models import Author
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncQuerySetTests(TransactionTestCase):
+    available_apps = ['async_queries']
+
+    def setUp(self):
+        self.alice = Author.objects.create(name='Alice', age=30)
+        self.bob = Author.objects.create(name='Bob', age=40)
+
+    def test_aget(self):
+        self.assertEqual(run(Author.objects.aget(name='Bob')), self.bob)
+        with self.assertRaises(Author.DoesNotExist):
+            run(Author.objects.aget(name='Carol'))
+        with self.assertRaises(Author.MultipleObjectsReturned):
+            run(Author.objects.aget())
+
+    def test_acount(self):
+        self.assertEqual(run(Author.objects.acount()), 2)
+        self.assertEqual(run(Author.objects.filter(age__gt=35).acount()), 1)
+
+    def test_aexists(self):
+        self.assertIs(run(Author.objects.filter(name='Alice').aexists()), True)
+        self.assertIs(run(Author.objects.filter(name='Carol').aexists()), False)
+
+    def test_afirst(self):
+        self.assertEqual(run(Author.objects.afirst()), self.alice)
+        self.assertEqual(run(Author.objects.order_by('-age').afirst()), self.bob)
+        self.assertIsNone(run(Author.objects.filter(name='Carol').afirst()))
+
+    def test_async_iteration(self):
+        async def names(queryset):
+            result = []
+            async for author in queryset:
+                result.append(author.name)
+            return result
+        queryset = Author.objects.all()
+        self.assertEqual(run(names(queryset)), ['Alice', 'Bob'])
+        # The results are cached like with synchronous iteration.
+        with self.assertNumQueries(0):
+            self.assertEqual([author.name for author in queryset], ['Alice', 'Bob'])
+
+    def test_acreate(self):
+        carol = run(Author.objects.acreate(name='Carol', age=50))
+        self.assertIsNotNone(carol.pk)
+        self.assertEqual(Author.objects.get(name='Carol'), carol)
+
+    def test_aupdate(self):
+        self.assertEqual(run(Author.objects.filter(name='Bob').aupdate(age=41)), 1)
+        self.assertEqual(Author.objects.get(name='Bob').age, 41)
+
+    def test_adelete(self):
+        self.assertEqual(run(Author.objects.filter(name='Bob').adelete()), (1, {'async_queries.Author': 1}))
+        self.assertSequenceEqual(Author.objects.all(), [self.alice])
+
+    def test_manager_has_no_adelete(self):
+        self.assertFalse(hasattr(Author.objects, 'adelete'))
+
+    def test_dedicated_thread(self):
+        """The queries run on a thread dedicated to the database alias."""
+        def get_thread():
+            Author.objects.count()
+            return threading.get_ident()
+
+        async def get_threads():
+            return [await connection.run_async(get_thread) for _ in range(3)]
+
+        threads = run(get_threads())
+        self.assertNotEqual(threads[0], threading.get_ident())
+        self.assertEqual(set(threads), {threads[0]})
+        self.assertIs(connections.async_executor('default'), connections.async_executor('default'))
+
+    def test_concurrent_queries(self):
+        async def queries():
+            return await asyncio.gather(
+                Author.objects.acount(),
+                Author.objects.filter(name='Alice').aexists(),
+                Author.objects.order_by('-name').afirst(),
+            )
+        self.assertEqual(run(queries()), [2, True, self.bob])
+
+    def test_run_async_exception(self):
+        def fail():
+            raise ValueError('error')
+        with self.assertRaisesMessage(ValueError, 'error'):
+            run(connection.run_async(fail))
+
+
+class AsyncQuerySetAtomicTests(TestCase):
+    def test_atomic_block(self):
+        """In an atomic block, the queries run in the current thread."""
+        with transaction.atomic():
+            author = run(Author.objects.acreate(name='Alice'))
+            self.assertEqual(run(Author.objects.aget(name='Alice')), author)
+            self.assertEqual(run(connection.run_async(threading.get_ident)), threading.get_ident())
@@ -1,10 +1,11 @@
 import copy
 
+from django.conf import settings
 from django.db import DEFAULT_DB_ALIAS, connections
 from django.db.backends.base.creation import (
     TEST_DATABASE_PREFIX, BaseDatabaseCreation,
 )
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 
 
 class TestDbSignatureTests(SimpleTestCase):
@@ -40,3 +41,19 @@ class TestDbSignatureTests(SimpleTestCase):
         test_connection.settings_dict['TEST'] = {'NAME': test_name}
         signature = BaseDatabaseCreation(test_connection).test_db_signature()
         self.assertEqual(signature[3], test_name)
+
+
+class TestDbSnapshotKeyTests(TestCase):
+
+    def test_snapshot_key(self):
+        creation = connections[DEFAULT_DB_ALIAS].creation
+        key = creation._get_test_db_snapshot_key()
+        self.assertEqual(creation._get_test_db_snapshot_key(), key)
+        # Changing how the tables of an app are created changes the key.
+        migration_modules = dict(settings.MIGRATION_MODULES)
+        if migration_modules.get('sessions', '') is None:
+            migration_modules['sessions'] = 'django.contrib.sessions.migrations'
+        else:
+            migration_modules['sessions'] = None
+        with override_settings(MIGRATION_MODULES=migration_modules):
+            self.assertNotEqual(creation._get_test_db_snapshot_key(), key)
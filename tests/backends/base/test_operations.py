@@ -137,3 +137,11 @@ class DatabaseOperationTests(SimpleTestCase):
         msg = 'This backend does not support window expressions.'
         with self.assertRaisesMessage(NotSupportedError, msg):
             connection.ops.window_frame_rows_start_end()
+
+    @skipIfDBFeature('supports_copy')
+    def test_copy_not_supported(self):
+        msg = 'This backend does not support COPY.'
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            connection.ops.copy_from(None, 'table', ['column'], [])
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            connection.ops.copy_to(None, 'SELECT 1', (), None)
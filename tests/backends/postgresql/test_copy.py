@@ -0,0 +1,106 @@
+import datetime
+import unittest
+from io import BytesIO, StringIO
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from ..models import Article, Person, RawData, Reporter, SchoolClass
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'PostgreSQL tests')
+class CopyTextTests(SimpleTestCase):
+
+    def test_copy_text(self):
+        from django.db.backends.postgresql.utils import copy_text
+        tests = [
+            (True, 't'),
+            (False, 'f'),
+            (b'\x00\xff', '\\x00ff'),
+            (datetime.timedelta(days=-1, seconds=5, microseconds=6), '-1 days 5 seconds 6 microseconds'),
+            ([1, None, 'a"b'], '{"1",NULL,"a\\"b"}'),
+            ([[1, 2], [3, 4]], '{{"1","2"},{"3","4"}}'),
+            ({'a': 'b', 'c': None}, '"a"=>"b", "c"=>NULL'),
+            (datetime.date(2018, 1, 2), '2018-01-02'),
+        ]
+        for value, expected in tests:
+            with self.subTest(value=value):
+                self.assertEqual(copy_text(value), expected)
+
+    def test_copy_reader(self):
+        from django.db.backends.postgresql.utils import CopyReader
+        reader = CopyReader([['a\tb', None], ['c\\d', 'e\nf']])
+        self.assertEqual(reader.read(3), b'a\\t')
+        self.assertEqual(reader.read(), b'b\t\\N\nc\\\\d\te\\nf\n')
+        self.assertEqual(reader.read(), b'')
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'PostgreSQL tests')
+class CopyTests(TestCase):
+
+    def test_copy_from_instances(self):
+        count = Person.objects.copy_from(
+            Person(first_name='John', last_name='Lennon\tand\nPaul') for _ in range(3)
+        )
+        self.assertEqual(count, 3)
+        self.assertEqual(Person.objects.filter(last_name='Lennon\tand\nPaul').count(), 3)
+
+    def test_copy_from_rows(self):
+        reporter = Reporter.objects.create(first_name='John', last_name='Smith')
+        count = Article.objects.copy_from(
+            [
+                ('First', '2018-01-01', reporter.pk),
+                {'headline': 'Second', 'pub_date': datetime.date(2018, 1, 2), 'reporter': reporter.pk},
+            ],
+            fields=['headline', 'pub_date', 'reporter'],
+        )
+        self.assertEqual(count, 2)
+        self.assertQuerysetEqual(
+            Article.objects.order_by('pub_date').values_list('headline', 'pub_date', 'reporter'),
+            [('First', datetime.date(2018, 1, 1), reporter.pk), ('Second', datetime.date(2018, 1, 2), reporter.pk)],
+            transform=tuple,
+        )
+
+    def test_copy_from_datetime(self):
+        SchoolClass.objects.copy_from([SchoolClass(year=2018, last_updated=datetime.datetime(2018, 1, 1))])
+        self.assertEqual(SchoolClass.objects.get().last_updated, datetime.datetime(2018, 1, 1))
+
+    def test_copy_from_binary_field(self):
+        RawData.objects.copy_from([(b'\x00\x01\\',)], fields=['raw_data'])
+        self.assertEqual(bytes(RawData.objects.get().raw_data), b'\x00\x01\\')
+
+    def test_copy_to_csv(self):
+        Person.objects.create(first_name='John', last_name='Lennon')
+        Person.objects.create(first_name='Paul', last_name='McCartney')
+        output = StringIO()
+        count = Person.objects.order_by('first_name').copy_to(
+            output, fields=['first_name', 'last_name'], header=True,
+        )
+        self.assertEqual(count, 2)
+        self.assertEqual(output.getvalue(), 'first_name,last_name\nJohn,Lennon\nPaul,McCartney\n')
+
+    def test_copy_to_filtered(self):
+        Person.objects.create(first_name='John', last_name="O'Brien")
+        Person.objects.create(first_name='Paul', last_name='McCartney')
+        output = StringIO()
+        Person.objects.filter(last_name="O'Brien").values_list('last_name').copy_to(output, format='text')
+        self.assertEqual(output.getvalue(), "O'Brien\n")
+
+    def test_copy_to_binary(self):
+        Person.objects.create(first_name='John', last_name='Lennon')
+        output = BytesIO()
+        self.assertEqual(Person.objects.copy_to(output, format='binary'), 1)
+        self.assertTrue(output.getvalue().startswith(b'PGCOPY\n\xff\r\n\x00'))
+
+    def test_copy_to_empty(self):
+        output = StringIO()
+        self.assertEqual(Person.objects.none().copy_to(output), 0)
+        self.assertEqual(output.getvalue(), '')
+
+    def test_copy_to_invalid_format(self):
+        msg = 'XML is not a recognized format. Allowed formats: BINARY, CSV, TEXT'
+        with self.assertRaisesMessage(ValueError, msg):
+            Person.objects.copy_to(StringIO(), format='xml')
+        msg = 'header is only supported with the CSV format.'
+        with self.assertRaisesMessage(ValueError, msg):
+            Person.objects.copy_to(StringIO(), format='text', header=True)
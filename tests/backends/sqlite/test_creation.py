@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+import unittest
+from sqlite3 import dbapi2
+
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase
+
+
+@unittest.skipUnless(connection.vendor == 'sqlite', 'SQLite tests')
+class SnapshotTests(SimpleTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def get_connection(self, name):
+        test_connection = DatabaseWrapper({**connection.settings_dict, 'NAME': name}, alias='snapshot')
+        self.addCleanup(test_connection.close)
+        return test_connection
+
+    def get_table_names(self, test_connection):
+        with test_connection.cursor() as cursor:
+            return test_connection.introspection.table_names(cursor)
+
+    def assertSnapshotRestored(self, test_connection, directory):
+        creation = test_connection.creation
+        with test_connection.cursor() as cursor:
+            cursor.execute('CREATE TABLE snapshot_table (id integer)')
+        snapshot_name = creation._get_test_db_snapshot_name('abc')
+        self.assertFalse(creation._restore_test_db_snapshot(snapshot_name, verbosity=0))
+        creation._create_test_db_snapshot(snapshot_name, verbosity=0)
+        with test_connection.cursor() as cursor:
+            cursor.execute('DROP TABLE snapshot_table')
+        self.assertNotIn('snapshot_table', self.get_table_names(test_connection))
+        self.assertIs(creation._restore_test_db_snapshot(snapshot_name, verbosity=0), True)
+        self.assertIn('snapshot_table', self.get_table_names(test_connection))
+        # Snapshots for other keys replace the previous ones.
+        creation._create_test_db_snapshot(creation._get_test_db_snapshot_name('def'), verbosity=0)
+        self.assertEqual(os.listdir(directory), ['test-snapshot-def.sqlite3'])
+
+    def test_file_database(self):
+        test_connection = self.get_connection(os.path.join(self.directory, 'db.sqlite3'))
+        directory = os.path.join(self.directory, 'snapshots')
+        with self.settings(MIGRATION_CACHE_DIR=directory):
+            self.assertSnapshotRestored(test_connection, directory)
+
+    @unittest.skipUnless(hasattr(dbapi2.Connection, 'backup'), 'SQLite backup API is required.')
+    def test_in_memory_database(self):
+        test_connection = self.get_connection('file:memorydb_snapshot?mode=memory&cache=shared')
+        with self.settings(MIGRATION_CACHE_DIR=self.directory):
+            self.assertSnapshotRestored(test_connection, self.directory)
@@ -532,6 +532,10 @@ class ManagerTest(SimpleTestCase):
         'update_or_create',
         'create',
         'bulk_create',
+        'copy_from',
+        'copy_to',
+        'cache',
+        'across',
         'filter',
         'aggregate',
         'annotate',
@@ -556,6 +560,12 @@ class ManagerTest(SimpleTestCase):
         'using',
         'exists',
         'explain',
+        'aget',
+        'acount',
+        'aexists',
+        'afirst',
+        'acreate',
+        'aupdate',
         '_insert',
         '_update',
         'raw',
@@ -290,6 +290,19 @@ class FileStorageTests(SimpleTestCase):
 
         self.storage.delete('path/to/test.file')
 
+    def test_file_open_for_writing_with_path(self):
+        """
+        Opening a pathname for writing creates intermediate directories as
+        necessary.
+        """
+        self.assertFalse(self.storage.exists('path/to'))
+        with self.storage.open('path/to/test.file', 'wb') as f:
+            f.write(b'file written with path')
+
+        with self.storage.open('path/to/test.file') as f:
+            self.assertEqual(f.read(), b'file written with path')
+        self.storage.delete('path/to/test.file')
+
     def test_save_doesnt_close(self):
         with TemporaryUploadedFile('test', 'text/plain', 1, 'utf8') as file:
             file.write(b'1')
@@ -381,6 +381,41 @@ class FileUploadTests(TestCase):
             # Large files don't go through.
             self.assertNotIn('f', self.client.post("/quota/", {'f': bigfile}).json())
 
+    def test_storage_upload_handler(self):
+        content = 'a' * (2 ** 21)
+        stored_dir = os.path.join(MEDIA_ROOT, 'stored')
+        with tempfile.NamedTemporaryFile(suffix='.txt') as file:
+            file.write(content.encode())
+            file.seek(0)
+            name = os.path.basename(file.name)
+            response = self.client.post('/storage/', {'f': file})
+            # A second upload of the same name is stored under another name.
+            file.seek(0)
+            response2 = self.client.post('/storage/', {'f': file})
+        stored = response.json()['f']
+        self.assertEqual(stored['name'], name)
+        self.assertEqual(stored['storage_name'], 'stored/%s' % name)
+        self.assertEqual(stored['size'], len(content))
+        self.assertEqual(stored['hexdigest'], hashlib.sha256(content.encode()).hexdigest())
+        self.assertEqual(stored['content'], content)
+        with open(os.path.join(stored_dir, name)) as f:
+            self.assertEqual(f.read(), content)
+        stored2 = response2.json()['f']
+        self.assertNotEqual(stored2['storage_name'], stored['storage_name'])
+        self.assertEqual(stored2['hexdigest'], stored['hexdigest'])
+
+    def test_storage_upload_handler_interrupted(self):
+        """
+        The partially stored file is deleted when the upload is interrupted.
+        """
+        stored_dir = os.path.join(MEDIA_ROOT, 'stored')
+        with tempfile.NamedTemporaryFile() as file:
+            file.write(b'a' * (10 * 2 ** 20))
+            file.seek(0)
+            name = os.path.basename(file.name)
+            self.assertNotIn('f', self.client.post('/storage/quota/', {'f': file}).json())
+        self.assertFalse(os.path.exists(os.path.join(stored_dir, name)))
+
     def test_broken_custom_upload_handler(self):
         with tempfile.NamedTemporaryFile() as file:
             file.write(b'a' * (2 ** 21))
@@ -2,7 +2,9 @@
 Upload handlers to test the upload API.
 """
 
-from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.core.files.uploadhandler import (
+    FileUploadHandler, StopUpload, StorageFileUploadHandler,
+)
 
 
 class QuotaUploadHandler(FileUploadHandler):
@@ -35,3 +37,7 @@ class ErroringUploadHandler(FileUploadHandler):
     """A handler that raises an exception."""
     def receive_data_chunk(self, raw_data, start):
         raise CustomUploadError("Oops!")
+
+
+class StoredUploadHandler(StorageFileUploadHandler):
+    upload_to = 'stored'
@@ -11,6 +11,8 @@ urlpatterns = [
     url(r'^echo_content/$', views.file_upload_echo_content),
     url(r'^quota/$', views.file_upload_quota),
     url(r'^quota/broken/$', views.file_upload_quota_broken),
+    url(r'^storage/$', views.file_upload_storage),
+    url(r'^storage/quota/$', views.file_upload_storage_quota),
     url(r'^getlist_count/$', views.file_upload_getlist_count),
     url(r'^upload_errors/$', views.file_upload_errors),
     url(r'^filename_case/$', views.file_upload_filename_case_view),
@@ -6,7 +6,9 @@ from django.http import HttpResponse, HttpResponseServerError, JsonResponse
 
 from .models import FileModel
 from .tests import UNICODE_FILENAME, UPLOAD_TO
-from .uploadhandler import ErroringUploadHandler, QuotaUploadHandler
+from .uploadhandler import (
+    ErroringUploadHandler, QuotaUploadHandler, StoredUploadHandler,
+)
 
 
 def file_upload_view(request):
@@ -109,6 +111,30 @@ def file_upload_quota(request):
     return file_upload_echo(request)
 
 
+def file_upload_storage(request):
+    """
+    Stream the uploaded files to the default storage and echo back where they
+    were stored.
+    """
+    request.upload_handlers = [StoredUploadHandler()]
+    r = {}
+    for k, f in request.FILES.items():
+        with f:
+            r[k] = {
+                'name': f.name,
+                'storage_name': f.storage_name,
+                'size': f.size,
+                'hexdigest': f.hexdigest,
+                'content': f.read().decode(),
+            }
+    return JsonResponse(r)
+
+
+def file_upload_storage_quota(request):
+    request.upload_handlers = [QuotaUploadHandler(), StoredUploadHandler()]
+    return file_upload_echo(request)
+
+
 def file_upload_quota_broken(request):
     """
     You can't change handlers after reading FILES; this view shouldn't work.
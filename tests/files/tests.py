@@ -10,10 +10,11 @@ from unittest import mock
 from django.core.files import File
 from django.core.files.base import ContentFile
 from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
 from django.core.files.temp import NamedTemporaryFile
 from django.core.files.uploadedfile import (
-    InMemoryUploadedFile, SimpleUploadedFile, TemporaryUploadedFile,
-    UploadedFile,
+    InMemoryUploadedFile, SimpleUploadedFile, StoredUploadedFile,
+    TemporaryUploadedFile, UploadedFile,
 )
 
 try:
@@ -232,6 +233,25 @@ class TemporaryUploadedFileTests(unittest.TestCase):
             self.assertTrue(temp_file.file.name.endswith('.upload.txt'))
 
 
+class StoredUploadedFileTests(unittest.TestCase):
+    def test_existing_file_not_truncated(self):
+        """
+        A file created with the storage name before the upload is opened
+        isn't overwritten; the upload gets another available name.
+        """
+        with tempfile.TemporaryDirectory() as location:
+            storage = FileSystemStorage(location=location)
+            storage.save('test.txt', ContentFile(b'existing'))
+            uf = StoredUploadedFile(storage, 'test.txt', 'test.txt', 'text/plain', 0, None)
+            uf.write(b'uploaded')
+            uf.close()
+            self.assertNotEqual(uf.storage_name, 'test.txt')
+            with storage.open('test.txt') as f:
+                self.assertEqual(f.read(), b'existing')
+            with storage.open(uf.storage_name) as f:
+                self.assertEqual(f.read(), b'uploaded')
+
+
 class DimensionClosingBug(unittest.TestCase):
     """
     get_image_dimensions() properly closes files (#8817)
@@ -1,3 +1,4 @@
+import glob
 import os
 import sys
 import tempfile
@@ -15,10 +16,11 @@ from django.core.management.commands.dumpdata import ProxyModelWarning
 from django.core.serializers.base import ProgressBar
 from django.db import IntegrityError, connection
 from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
 
 from .models import (
-    Article, Category, NaturalKeyThing, PrimaryKeyUUIDModel, ProxySpy, Spy,
-    Tag, Visa,
+    Article, Category, NaturalKeyThing, Person, PrimaryKeyUUIDModel, ProxySpy,
+    Spy, Tag, Visa,
 )
 
 
@@ -464,6 +466,36 @@ class FixtureLoadingTests(DumpDataAssertMixin, TestCase):
             filename='dumpdata.json'
         )
 
+    def test_dumpdata_jsonl(self):
+        management.call_command('loaddata', 'fixture1.json', verbosity=0)
+        self._dumpdata_assert(
+            ['fixtures.Article'],
+            '{"model": "fixtures.article","pk": 2,"fields": {"headline": "Poker has no place on ESPN",'
+            '"pub_date": "2006-06-16T12:00:00"}}\n'
+            '{"model": "fixtures.article","pk": 3,"fields": {"headline": "Time to reform copyright",'
+            '"pub_date": "2006-06-16T13:00:00"}}',
+            format='jsonl',
+        )
+
+    def test_dumpdata_does_not_instantiate_models(self):
+        management.call_command('loaddata', 'fixture1.json', verbosity=0)
+        with mock.patch.object(Article, 'from_db') as from_db:
+            self._dumpdata_assert(
+                ['fixtures.Article'],
+                '[{"pk": 2, "model": "fixtures.article", "fields": {"headline": "Poker has no place on ESPN", '
+                '"pub_date": "2006-06-16T12:00:00"}}, {"pk": 3, "model": "fixtures.article", "fields": {"headline": '
+                '"Time to reform copyright", "pub_date": "2006-06-16T13:00:00"}}]'
+            )
+        from_db.assert_not_called()
+
+    def test_dumpdata_output_dir_errors(self):
+        msg = "--output and --output-dir can't be used together."
+        with self.assertRaisesMessage(CommandError, msg):
+            management.call_command('dumpdata', output='dump.json', output_dir='dump')
+        msg = '--parallel requires --output-dir.'
+        with self.assertRaisesMessage(CommandError, msg):
+            management.call_command('dumpdata', parallel=2)
+
     def test_dumpdata_progressbar(self):
         """
         Dumpdata shows a progress bar on the command line when --output is set,
@@ -593,6 +625,54 @@ class FixtureLoadingTests(DumpDataAssertMixin, TestCase):
             command_output
         )
 
+    def test_loaddata_jsonl(self):
+        management.call_command('loaddata', 'fixture10', verbosity=0)
+        self.assertQuerysetEqual(Article.objects.all(), [
+            '<Article: One object per line>',
+            '<Article: JSON Lines fixtures>',
+        ])
+
+    def test_loaddata_bulk(self):
+        management.call_command('loaddata', 'fixture1', verbosity=0)
+        with CaptureQueriesContext(connection) as ctx:
+            management.call_command('loaddata', 'fixture6', verbosity=0, bulk=True)
+        # Tags and people are each inserted with a single query.
+        inserts = [query for query in ctx.captured_queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 2)
+        self.assertQuerysetEqual(Tag.objects.all(), [
+            '<Tag: <Article: Time to reform copyright> tagged "copyright">',
+            '<Tag: <Article: Time to reform copyright> tagged "law">',
+        ], ordered=False)
+        self.assertQuerysetEqual(Person.objects.all(), [
+            '<Person: Django Reinhardt>',
+            '<Person: Prince>',
+            '<Person: Stephane Grappelli>',
+        ])
+
+    def test_loaddata_bulk_auto_now(self):
+        """Fixture values of auto_now fields aren't replaced by --bulk."""
+        with mock.patch.object(Article._meta.get_field('pub_date'), 'auto_now', True):
+            management.call_command('loaddata', 'fixture2.json', verbosity=0, bulk=True)
+        self.assertQuerysetEqual(Article.objects.order_by('pub_date'), [
+            ('Copyright is fine the way it is', '2006-06-16 14:00:00'),
+            ('Django conquers world!', '2006-06-16 15:00:00'),
+        ], lambda a: (a.headline, a.pub_date.strftime('%Y-%m-%d %H:%M:%S')))
+
+    def test_loaddata_bulk_forward_references(self):
+        management.call_command('loaddata', 'forward_reference_m2m.json', verbosity=0, bulk=True)
+        t1 = NaturalKeyThing.objects.get_by_natural_key('t1')
+        self.assertQuerysetEqual(
+            t1.other_things.order_by('key'),
+            ['<NaturalKeyThing: t2>', '<NaturalKeyThing: t3>']
+        )
+
+    def test_loaddata_bulk_error_message(self):
+        if connection.vendor == 'mysql':
+            connection.cursor().execute("SET sql_mode = 'TRADITIONAL'")
+        msg = 'Could not load fixtures.Article objects (pk=1):'
+        with self.assertRaisesMessage(IntegrityError, msg):
+            management.call_command('loaddata', 'invalid.json', verbosity=0, bulk=True)
+
     def test_loading_using(self):
         # Load db fixtures 1 and 2. These will load using the 'default' database identifier explicitly
         management.call_command('loaddata', 'db_fixture_1', verbosity=0, database='default')
@@ -744,6 +824,31 @@ class FixtureTransactionTests(DumpDataAssertMixin, TransactionTestCase):
         'django.contrib.sites',
     ]
 
+    def test_dumpdata_output_dir_parallel(self):
+        management.call_command('loaddata', 'fixture1.json', verbosity=0)
+        with tempfile.TemporaryDirectory() as output_dir:
+            management.call_command(
+                'dumpdata', 'fixtures.Article', 'fixtures.Category', 'sites.Site',
+                output_dir=output_dir, parallel=3,
+            )
+            self.assertEqual(
+                sorted(os.listdir(output_dir)),
+                ['fixtures.article.json', 'fixtures.category.json', 'sites.site.json'],
+            )
+            with open(os.path.join(output_dir, 'fixtures.category.json')) as f:
+                self.assertJSONEqual(
+                    f.read(),
+                    '[{"pk": 1, "model": "fixtures.category", "fields": '
+                    '{"description": "Latest news stories", "title": "News Stories"}}]'
+                )
+            Article.objects.all().delete()
+            Category.objects.all().delete()
+            # The files of each model can be loaded again.
+            management.call_command('loaddata', *glob.glob(os.path.join(output_dir, '*.json')), verbosity=0)
+        self.assertEqual(Article.objects.count(), 2)
+        self.assertEqual(Category.objects.count(), 1)
+        self.assertEqual(Site.objects.count(), 1)
+
     @skipUnlessDBFeature('supports_forward_references')
     def test_format_discovery(self):
         # Load fixture 1 again, using format discovery
@@ -1,3 +1,5 @@
+import os
+
 from django.core.exceptions import ImproperlyConfigured
 from django.core.handlers.wsgi import WSGIHandler, WSGIRequest, get_script_name
 from django.core.signals import request_finished, request_started
@@ -183,6 +185,20 @@ class HandlerRequestTests(SimpleTestCase):
         WSGIHandler()(environ, start_response)
         self.assertEqual(start_response.status, '200 OK')
 
+    @override_settings(FILE_RESPONSE_OFFLOAD_HEADER='X-Sendfile')
+    def test_file_response_offload(self):
+        """The handler lets the front-end web server send FileResponse files."""
+        def start_response(status, headers):
+            start_response.headers = dict(headers)
+
+        environ = RequestFactory().get('/file/').environ
+        environ['wsgi.file_wrapper'] = lambda filelike: self.fail('The file was sent.')
+        response = WSGIHandler()(environ, start_response)
+        self.assertEqual(list(response), [])
+        response.close()
+        self.assertTrue(start_response.headers['X-Sendfile'].endswith(os.path.join('handlers', 'views.py')))
+        self.assertNotIn('Content-Length', start_response.headers)
+
     @override_settings(MIDDLEWARE=['handlers.tests.empty_middleware'])
     def test_middleware_returns_none(self):
         msg = 'Middleware factory handlers.tests.empty_middleware returned None.'
@@ -2,7 +2,7 @@ from http import HTTPStatus
 
 from django.core.exceptions import SuspiciousOperation
 from django.db import connection, transaction
-from django.http import HttpResponse, StreamingHttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 
 
@@ -14,6 +14,10 @@ def streaming(request):
     return StreamingHttpResponse([b"streaming", b" ", b"content"])
 
 
+def file_response(request):
+    return FileResponse(open(__file__, 'rb'))
+
+
 def in_transaction(request):
     return HttpResponse(str(connection.in_atomic_block))
 
@@ -2,23 +2,32 @@ import copy
 import json
 import os
 import pickle
+import threading
 import unittest
 import uuid
 
 from django.core.exceptions import DisallowedRedirect
-from django.core.serializers.json import DjangoJSONEncoder
+from django.core.serializers.json import DjangoJSONEncoder, JSONBackend
 from django.core.signals import request_finished
 from django.db import close_old_connections
 from django.http import (
-    BadHeaderError, HttpResponse, HttpResponseNotAllowed,
+    BadHeaderError, EventStreamResponse, HttpResponse, HttpResponseNotAllowed,
     HttpResponseNotModified, HttpResponsePermanentRedirect,
-    HttpResponseRedirect, JsonResponse, QueryDict, SimpleCookie,
-    StreamingHttpResponse, parse_cookie,
+    HttpResponseRedirect, JsonResponse, QueryDict, ServerSentEvent,
+    SimpleCookie, StreamingHttpResponse, StreamingJsonResponse, parse_cookie,
 )
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
+from django.urls import get_script_prefix, set_script_prefix
+from django.utils import timezone, translation
 from django.utils.functional import lazystr
 
 
+class CompactJSONBackend(JSONBackend):
+    def dumps(self, obj, cls=DjangoJSONEncoder, **kwargs):
+        kwargs['separators'] = (',', ':')
+        return super().dumps(obj, cls=cls, **kwargs)
+
+
 class QueryDictTests(SimpleTestCase):
     def test_create_with_no_args(self):
         self.assertEqual(QueryDict(), QueryDict(''))
@@ -561,6 +570,191 @@ class JsonResponseTests(SimpleTestCase):
         response = JsonResponse({'foo': 'bar'}, json_dumps_params={'indent': 2})
         self.assertEqual(response.content.decode(), '{\n  "foo": "bar"\n}')
 
+    @override_settings(JSON_BACKEND='httpwrappers.tests.CompactJSONBackend')
+    def test_json_response_json_backend(self):
+        response = JsonResponse({'foo': ['bar', 1]})
+        self.assertEqual(response.content, b'{"foo":["bar",1]}')
+
+
+class StreamingJsonResponseTests(SimpleTestCase):
+    def test_streaming_json_response(self):
+        u = uuid.uuid4()
+        response = StreamingJsonResponse(iter([{'foo': 'bar'}, u, 'łóżko']))
+        self.assertEqual(response['Content-Type'], 'application/json')
+        content = b''.join(response)
+        self.assertEqual(json.loads(content.decode()), [{'foo': 'bar'}, str(u), 'łóżko'])
+
+    def test_streaming_json_response_empty(self):
+        self.assertEqual(b''.join(StreamingJsonResponse([])), b'[]')
+
+    def test_streaming_json_response_consumes_items_lazily(self):
+        consumed = []
+
+        def items():
+            for i in range(3):
+                consumed.append(i)
+                yield 'x' * 6
+
+        response = StreamingJsonResponse(items())
+        response.chunk_size = 16
+        self.assertEqual(consumed, [])
+        chunks = iter(response)
+        self.assertEqual(next(chunks), b'["xxxxxx","xxxxxx"')
+        self.assertEqual(consumed, [0, 1])
+        self.assertEqual(list(chunks), [b',"xxxxxx"]'])
+
+    def test_streaming_json_response_arguments(self):
+        class CustomDjangoJSONEncoder(DjangoJSONEncoder):
+            def default(self, o):
+                return 'custom'
+
+        response = StreamingJsonResponse(
+            [{'foo': object()}], encoder=CustomDjangoJSONEncoder,
+            json_dumps_params={'separators': (',', ':')}, status=201,
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(b''.join(response), b'[{"foo":"custom"}]')
+
+
+class ServerSentEventTests(SimpleTestCase):
+    def test_encode(self):
+        tests = (
+            (ServerSentEvent('hello'), b'data: hello\n\n'),
+            (ServerSentEvent(b'hello'), b'data: hello\n\n'),
+            (ServerSentEvent(42), b'data: 42\n\n'),
+            (ServerSentEvent('a\nb\r\nc\rd'), b'data: a\ndata: b\ndata: c\ndata: d\n\n'),
+            (ServerSentEvent(''), b'data: \n\n'),
+            (
+                ServerSentEvent('café', event='update', id=3, retry=1000),
+                'event: update\nid: 3\nretry: 1000\ndata: café\n\n'.encode(),
+            ),
+            (ServerSentEvent(retry=1000), b'retry: 1000\n\n'),
+        )
+        for event, expected in tests:
+            with self.subTest(event=event):
+                self.assertEqual(event.encode(), expected)
+
+    def test_line_breaks(self):
+        for name in ('event', 'id'):
+            msg = "The %s of a server-sent event can't contain line breaks." % name
+            for value in ('a\nb', 'a\rb'):
+                with self.subTest(name=name, value=value), self.assertRaisesMessage(ValueError, msg):
+                    ServerSentEvent('data', **{name: value})
+
+
+class EventStreamResponseTests(SimpleTestCase):
+    def test_event_stream_response(self):
+        response = EventStreamResponse(
+            iter(['hello', ServerSentEvent('world', event='greeting', id=1)]),
+            retry=500,
+        )
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        self.assertEqual(response['X-Accel-Buffering'], 'no')
+        self.assertEqual(list(response), [
+            b'retry: 500\n\n',
+            b'data: hello\n\n',
+            b'event: greeting\nid: 1\ndata: world\n\n',
+        ])
+
+    def test_without_heartbeat(self):
+        closed = []
+
+        def events():
+            try:
+                yield 'hello'
+                yield 'world'
+            finally:
+                closed.append(threading.current_thread())
+
+        response = EventStreamResponse(events(), heartbeat_interval=None)
+        self.assertEqual(list(response), [b'data: hello\n\n', b'data: world\n\n'])
+        # The events are produced in the thread iterating the response.
+        self.assertEqual(closed, [threading.current_thread()])
+
+    def test_heartbeat(self):
+        release = threading.Event()
+
+        def events():
+            yield 'first'
+            release.wait(5)
+            yield 'second'
+
+        response = EventStreamResponse(events(), heartbeat_interval=0.01)
+        chunks = iter(response)
+        self.assertEqual(next(chunks), b'data: first\n\n')
+        self.assertEqual(next(chunks), b':\n\n')
+        release.set()
+        self.assertEqual([chunk for chunk in chunks if chunk != b':\n\n'], [b'data: second\n\n'])
+
+    def test_max_duration(self):
+        release = threading.Event()
+        closed = threading.Event()
+
+        def events():
+            try:
+                yield 'first'
+                release.wait(5)
+                yield 'second'
+            finally:
+                closed.set()
+
+        for heartbeat_interval in (None, 0.01):
+            release.clear()
+            closed.clear()
+            with self.subTest(heartbeat_interval=heartbeat_interval):
+                response = EventStreamResponse(events(), heartbeat_interval=heartbeat_interval, max_duration=0)
+                self.assertNotIn(b'data: second\n\n', list(response))
+                release.set()
+                self.assertIs(closed.wait(5), True)
+
+    def test_thread_state(self):
+        """
+        The events are produced with the language, time zone, and script
+        prefix active while iterating over the response.
+        """
+        def events():
+            yield translation.get_language()
+            yield timezone.get_current_timezone_name()
+            yield get_script_prefix()
+
+        self.addCleanup(set_script_prefix, get_script_prefix())
+        set_script_prefix('/prefix/')
+        for heartbeat_interval in (None, 15):
+            with self.subTest(heartbeat_interval=heartbeat_interval):
+                response = EventStreamResponse(events(), heartbeat_interval=heartbeat_interval)
+                with translation.override('fr'), timezone.override('America/Chicago'):
+                    self.assertEqual(list(response), [
+                        b'data: fr\n\n', b'data: America/Chicago\n\n', b'data: /prefix/\n\n',
+                    ])
+
+    def test_close_stops_events(self):
+        closed = threading.Event()
+
+        def events():
+            try:
+                while True:
+                    yield 'event'
+            finally:
+                closed.set()
+
+        response = EventStreamResponse(events())
+        chunks = iter(response)
+        self.assertEqual(next(chunks), b'data: event\n\n')
+        response.close()
+        self.assertIs(closed.wait(5), True)
+
+    def test_events_error(self):
+        def events():
+            yield 'first'
+            raise ValueError('Broken')
+
+        response = EventStreamResponse(events())
+        chunks = iter(response)
+        self.assertEqual(next(chunks), b'data: first\n\n')
+        with self.assertRaisesMessage(ValueError, 'Broken'):
+            next(chunks)
+
 
 class StreamingHttpResponseTests(SimpleTestCase):
     def test_streaming_response(self):
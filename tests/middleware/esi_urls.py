@@ -0,0 +1,11 @@
+from django.conf.urls import url
+
+from . import views
+
+urlpatterns = [
+    url(r'^page/$', views.esi_page),
+    url(r'^dated_page/$', views.esi_dated_page),
+    url(r'^menu/$', views.esi_menu),
+    url(r'^not_found/$', views.esi_not_found),
+    url(r'^error/$', views.esi_error),
+]
@@ -0,0 +1,118 @@
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.middleware.esi import ESIMiddleware
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from . import views
+
+
+@override_settings(
+    ROOT_URLCONF='middleware.esi_urls',
+    MIDDLEWARE=[
+        'django.middleware.esi.ESIMiddleware',
+        'django.middleware.cache.UpdateCacheMiddleware',
+        'django.middleware.cache.FetchFromCacheMiddleware',
+    ],
+    CACHE_MIDDLEWARE_SECONDS=60,
+)
+class ESIMiddlewareTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        views.page_renders.clear()
+
+    def test_assemble_fragments(self):
+        response = self.client.get('/page/')
+        self.assertEqual(response.content, b'<p>Page 1</p><ul>anonymous small</ul>')
+        self.assertIn('private', response['Cache-Control'])
+        self.assertEqual(response['Vary'], 'Cookie')
+        self.assertNotIn('ETag', response)
+
+    @override_settings(MIDDLEWARE=[
+        'django.middleware.http.ConditionalGetMiddleware',
+        'django.middleware.esi.ESIMiddleware',
+    ])
+    def test_page_validators_removed(self):
+        """
+        The Last-Modified date of the page doesn't apply to the fragments, so
+        conditional requests get the current fragments.
+        """
+        response = self.client.get('/dated_page/', HTTP_IF_MODIFIED_SINCE='Mon, 01 Jan 2018 00:00:00 GMT')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'<p>Page</p><ul>anonymous small</ul>')
+        self.assertNotIn('Last-Modified', response)
+
+    def test_page_cached_without_fragments(self):
+        """
+        The page is cached with its ESI tags, so that each user gets their
+        own fragment in the cached page.
+        """
+        self.client.cookies['user'] = 'alice'
+        response = self.client.get('/page/')
+        self.assertEqual(response.content, b'<p>Page 1</p><ul>alice small</ul>')
+        self.client.cookies['user'] = 'bob'
+        response = self.client.get('/page/')
+        self.assertEqual(response.content, b'<p>Page 1</p><ul>bob small</ul>')
+        self.assertEqual(views.page_renders, ['/page/'])
+
+    def test_surrogate_capability(self):
+        """ESI tags are left to a proxy which can process them."""
+        response = self.client.get('/page/', HTTP_SURROGATE_CAPABILITY='proxy="ESI/1.0"')
+        self.assertEqual(
+            response.content,
+            b'<p>Page 1</p><esi:include src="/menu/?size=small" />',
+        )
+        self.assertEqual(response['Surrogate-Control'], 'content="ESI/1.0"')
+
+    def test_failed_fragment(self):
+        response = self.client.get('/page/', {'menu': '/not_found/'})
+        self.assertEqual(response.content, b'<p>Page 1</p>')
+
+    def test_unresolvable_fragment(self):
+        with self.assertLogs('django.request', 'WARNING') as cm:
+            response = self.client.get('/page/', {'menu': '/nonexistent/'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'<p>Page 1</p>')
+        self.assertEqual(cm.records[0].getMessage(), 'ESI fragment not found: /nonexistent/')
+
+    def test_fragment_view_error(self):
+        with self.assertLogs('django.request', 'ERROR') as cm:
+            response = self.client.get('/page/', {'menu': '/error/'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'<p>Page 1</p>')
+        self.assertEqual(cm.records[0].getMessage(), 'Error in ESI fragment: /error/')
+        self.assertIsInstance(cm.records[0].exc_info[1], ValueError)
+
+
+class ESIMiddlewareResponseTests(SimpleTestCase):
+    rf = RequestFactory()
+
+    def test_not_html(self):
+        content = b'<esi:include src="/menu/" />'
+        response = HttpResponse(content, content_type='text/plain')
+        response = ESIMiddleware().process_response(self.rf.get('/'), response)
+        self.assertEqual(response.content, content)
+
+    def test_content_encoding(self):
+        response = HttpResponse(b'<esi:include src="/menu/" />')
+        response['Content-Encoding'] = 'identity'
+        response = ESIMiddleware().process_response(self.rf.get('/'), response)
+        self.assertEqual(response.content, b'<esi:include src="/menu/" />')
+
+    def test_streaming(self):
+        response = StreamingHttpResponse([b'<esi:include src="/menu/" />'])
+        self.assertIs(ESIMiddleware().process_response(self.rf.get('/'), response), response)
+
+    @override_settings(ROOT_URLCONF='middleware.esi_urls')
+    def test_content_length(self):
+        response = HttpResponse('<esi:include src="/menu/?size=big" />')
+        response['Content-Length'] = str(len(response.content))
+        response = ESIMiddleware().process_response(self.rf.get('/'), response)
+        self.assertEqual(response.content, b'<ul>anonymous big</ul>')
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+
+    @override_settings(ROOT_URLCONF='middleware.esi_urls')
+    def test_include_without_src(self):
+        response = HttpResponse('<p><esi:include alt="/menu/" /></p>')
+        response = ESIMiddleware().process_response(self.rf.get('/'), response)
+        self.assertEqual(response.content, b'<p></p>')
@@ -1,24 +1,40 @@
 import gzip
+import os
 import random
 import re
 import struct
+import unittest
+import zlib
 from io import BytesIO
+from unittest import mock
 from urllib.parse import quote
 
 from django.conf import settings
 from django.core import mail
 from django.core.exceptions import PermissionDenied
 from django.http import (
-    FileResponse, HttpRequest, HttpResponse, HttpResponseNotFound,
-    HttpResponsePermanentRedirect, HttpResponseRedirect, StreamingHttpResponse,
+    EventStreamResponse, FileResponse, HttpRequest, HttpResponse,
+    HttpResponseNotFound, HttpResponsePermanentRedirect, HttpResponseRedirect,
+    StreamingHttpResponse,
 )
 from django.middleware.clickjacking import XFrameOptionsMiddleware
 from django.middleware.common import (
     BrokenLinkEmailsMiddleware, CommonMiddleware,
 )
-from django.middleware.gzip import GZipMiddleware
+from django.middleware.gzip import GZipMiddleware, parse_accept_encoding
 from django.middleware.http import ConditionalGetMiddleware
 from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 int2byte = struct.Struct(">B").pack
 
@@ -451,6 +467,14 @@ class ConditionalGetMiddlewareTest(SimpleTestCase):
         res = StreamingHttpResponse(['content'])
         self.assertFalse(ConditionalGetMiddleware().process_response(self.req, res).has_header('ETag'))
 
+    def test_no_conditional_response_event_stream(self):
+        self.req.META['HTTP_IF_MODIFIED_SINCE'] = 'Sat, 12 Feb 2011 17:38:44 GMT'
+        res = EventStreamResponse(['event'])
+        res['Last-Modified'] = 'Sat, 12 Feb 2011 17:38:44 GMT'
+        res = ConditionalGetMiddleware().process_response(self.req, res)
+        self.assertEqual(res.status_code, 200)
+        self.assertFalse(res.has_header('ETag'))
+
     def test_no_etag_no_store_cache(self):
         self.resp['Cache-Control'] = 'No-Cache, No-Store, Max-age=0'
         self.assertFalse(ConditionalGetMiddleware().process_response(self.req, self.resp).has_header('ETag'))
@@ -585,6 +609,18 @@ class ConditionalGetMiddlewareTest(SimpleTestCase):
         conditional_get_response = ConditionalGetMiddleware().process_response(request, response)
         self.assertNotIn('ETag', conditional_get_response)
 
+    def test_range_file_response(self):
+        """
+        ConditionalGetMiddleware restricts file responses with an ETag to the
+        range of a Range header.
+        """
+        response = FileResponse(open(__file__, 'rb'))
+        request = RequestFactory().get('/', HTTP_RANGE='bytes=0-5', HTTP_IF_RANGE=response['ETag'])
+        response = ConditionalGetMiddleware().process_response(request, response)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response), b'import')
+        response.close()
+
 
 class XFrameOptionsMiddlewareTest(SimpleTestCase):
     """
@@ -743,6 +779,14 @@ class GZipMiddlewareTest(SimpleTestCase):
         self.assertEqual(r.get('Content-Encoding'), 'gzip')
         self.assertFalse(r.has_header('Content-Length'))
 
+    def test_no_compress_event_stream(self):
+        """
+        Compression isn't performed on event streams, which would be delayed.
+        """
+        r = GZipMiddleware().process_response(self.req, EventStreamResponse(['a' * 500]))
+        self.assertEqual(b''.join(r), b'data: ' + b'a' * 500 + b'\n\n')
+        self.assertIsNone(r.get('Content-Encoding'))
+
     def test_compress_streaming_response_unicode(self):
         """
         Compression is performed on responses with streaming Unicode content.
@@ -819,6 +863,162 @@ class GZipMiddlewareTest(SimpleTestCase):
         self.assertEqual(self.get_mtime(r1.content), 0)
         self.assertEqual(self.get_mtime(r2.content), 0)
 
+    def test_no_compress_refused_encoding(self):
+        """
+        Compression isn't performed if the browser refuses gzip with q=0.
+        """
+        self.req.META['HTTP_ACCEPT_ENCODING'] = 'gzip;q=0, deflate'
+        r = GZipMiddleware().process_response(self.req, self.resp)
+        self.assertEqual(r.content, self.compressible_string)
+        self.assertIsNone(r.get('Content-Encoding'))
+        self.assertEqual(r.get('Vary'), 'Accept-Encoding')
+
+    def test_parse_accept_encoding(self):
+        self.assertEqual(parse_accept_encoding(''), {})
+        self.assertEqual(
+            parse_accept_encoding('gzip, deflate;q=0.5, BR ; q=0.8, zstd;q=x, *;q=0'),
+            {'gzip': 1.0, 'deflate': 0.5, 'br': 0.8, 'zstd': 0.0, '*': 0.0},
+        )
+
+    def test_content_negotiation(self):
+        """
+        The preferred encoding is the one with the highest quality value
+        which has a compressor, in the order of GZipMiddleware.encodings in
+        case of a tie.
+        """
+        compressors = {
+            'gzip': (lambda s, level: b'gzip', None),
+            'br': (lambda s, level: b'br', None),
+        }
+        tests = [
+            ('gzip, deflate', 'gzip'),
+            ('gzip, br', 'br'),
+            ('br;q=0.5, gzip', 'gzip'),
+            ('br;q=0, *', 'gzip'),
+            ('zstd', None),
+            ('*', 'br'),
+        ]
+        with mock.patch.dict('django.middleware.gzip.COMPRESSORS', compressors, clear=True):
+            for accept_encoding, encoding in tests:
+                with self.subTest(accept_encoding=accept_encoding):
+                    self.req.META['HTTP_ACCEPT_ENCODING'] = accept_encoding
+                    resp = HttpResponse(self.compressible_string)
+                    r = GZipMiddleware().process_response(self.req, resp)
+                    self.assertEqual(r.get('Content-Encoding'), encoding)
+                    if encoding:
+                        self.assertEqual(r.content, encoding.encode())
+
+    def test_compression_level(self):
+        class LowLevelGZipMiddleware(GZipMiddleware):
+            compression_levels = {'gzip': 1}
+
+        content = ' '.join(str(i) for i in range(1000)).encode()
+        self.resp.content = content
+        r = LowLevelGZipMiddleware().process_response(self.req, self.resp)
+        self.assertEqual(self.decompress(r.content), content)
+        self.assertEqual(r.content, compress_string(content, level=1))
+
+    def test_no_compress_partial_content(self):
+        """
+        Partial responses, such as those of ConditionalGetMiddleware for
+        Range requests, aren't compressed.
+        """
+        response = FileResponse(open(__file__, 'rb'))
+        request = RequestFactory().get(
+            '/', HTTP_ACCEPT_ENCODING='gzip', HTTP_RANGE='bytes=0-5', HTTP_IF_RANGE=response['ETag'],
+        )
+        response = ConditionalGetMiddleware().process_response(request, response)
+        response = GZipMiddleware().process_response(request, response)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 0-5/%d' % os.path.getsize(__file__))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(b''.join(response), b'import')
+        response.close()
+
+    def test_compressed_content_cached_by_etag(self):
+        """
+        The compressed content of responses with a strong ETag is reused.
+        """
+        compress = mock.Mock(side_effect=compress_string)
+        middleware = GZipMiddleware()
+        with mock.patch.dict('django.middleware.gzip.COMPRESSORS', {'gzip': (compress, None)}):
+            for etag in ('"eggs"', '"eggs"', 'W/"spam"', 'W/"spam"'):
+                resp = HttpResponse(self.compressible_string)
+                resp['ETag'] = etag
+                r = middleware.process_response(self.req, resp)
+                self.assertEqual(self.decompress(r.content), self.compressible_string)
+        # A weak ETag doesn't guarantee that the content is the same.
+        self.assertEqual(compress.call_count, 3)
+
+    def test_compressed_content_cache_key(self):
+        """
+        Responses with the same ETag but another path or content don't share
+        their compressed content.
+        """
+        middleware = GZipMiddleware()
+        for path, content in (('/a/', b'a' * 500), ('/b/', b'b' * 500), ('/b/', b'c' * 500)):
+            with self.subTest(path=path, content=content[:1]):
+                request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING='gzip')
+                resp = HttpResponse(content)
+                resp['ETag'] = '"eggs"'
+                r = middleware.process_response(request, resp)
+                self.assertEqual(self.decompress(r.content), content)
+        self.assertEqual(len(middleware.cache), 3)
+
+    def test_compressed_content_cache_size(self):
+        class SmallCacheGZipMiddleware(GZipMiddleware):
+            cache_size = 2
+
+        middleware = SmallCacheGZipMiddleware()
+        for etag in ('"a"', '"b"', '"c"'):
+            resp = HttpResponse(self.compressible_string)
+            resp['ETag'] = etag
+            middleware.process_response(self.req, resp)
+        self.assertEqual([key[0] for key in middleware.cache], ['"b"', '"c"'])
+
+    def test_streaming_response_flushed(self):
+        """
+        The compressed data of a streaming response is flushed once enough
+        content was compressed, rather than only at the end.
+        """
+        chunk = b'a' * (16 * 1024)
+
+        def content():
+            yield chunk
+            yield chunk
+            raise AssertionError('The content was consumed too early.')
+
+        r = GZipMiddleware().process_response(self.req, StreamingHttpResponse(content()))
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        decompressed = b''
+        for data in r.streaming_content:
+            decompressed += decompressor.decompress(data)
+            if len(decompressed) == 2 * len(chunk):
+                break
+        self.assertEqual(decompressed, chunk * 2)
+
+    @unittest.skipUnless(brotli, 'brotli is required')
+    def test_compress_brotli(self):
+        self.req.META['HTTP_ACCEPT_ENCODING'] = 'gzip, br'
+        r = GZipMiddleware().process_response(self.req, self.resp)
+        self.assertEqual(r.get('Content-Encoding'), 'br')
+        self.assertEqual(brotli.decompress(r.content), self.compressible_string)
+        r = GZipMiddleware().process_response(self.req, self.stream_resp)
+        self.assertEqual(r.get('Content-Encoding'), 'br')
+        self.assertEqual(brotli.decompress(b''.join(r)), b''.join(self.sequence))
+
+    @unittest.skipUnless(zstandard, 'zstandard is required')
+    def test_compress_zstd(self):
+        self.req.META['HTTP_ACCEPT_ENCODING'] = 'gzip, zstd'
+        decompress = zstandard.ZstdDecompressor().decompressobj().decompress
+        r = GZipMiddleware().process_response(self.req, self.resp)
+        self.assertEqual(r.get('Content-Encoding'), 'zstd')
+        self.assertEqual(decompress(r.content), self.compressible_string)
+        r = GZipMiddleware().process_response(self.req, self.stream_resp)
+        self.assertEqual(r.get('Content-Encoding'), 'zstd')
+        decompress = zstandard.ZstdDecompressor().decompressobj().decompress
+        self.assertEqual(decompress(b''.join(r)), b''.join(self.sequence))
+
 
 class ETagGZipMiddlewareTest(SimpleTestCase):
     """
@@ -1,5 +1,48 @@
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseNotFound
+from django.template import Context, Engine, engines
+from django.template.response import TemplateResponse
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 
 
 def empty_view(request, *args, **kwargs):
     return HttpResponse('')
+
+
+page_renders = []
+
+esi_page_template = Engine(libraries={'cache': 'django.templatetags.cache'}).from_string(
+    '{% load cache %}<p>Page {{ count }}</p>{% esi_include menu_url %}'
+)
+
+
+@cache_page(60)
+def esi_page(request):
+    page_renders.append(request.path)
+    return HttpResponse(esi_page_template.render(Context({
+        'count': len(page_renders),
+        'menu_url': request.GET.get('menu', '/menu/?size=small'),
+    })))
+
+
+@vary_on_cookie
+def esi_menu(request):
+    return TemplateResponse(
+        request,
+        engines['django'].from_string('<ul>{{ user }} {{ size }}</ul>'),
+        {'user': request.COOKIES.get('user', 'anonymous'), 'size': request.GET['size']},
+    )
+
+
+def esi_dated_page(request):
+    response = HttpResponse('<p>Page</p><esi:include src="/menu/?size=small" />')
+    response['Last-Modified'] = 'Mon, 01 Jan 2018 00:00:00 GMT'
+    return response
+
+
+def esi_not_found(request):
+    return HttpResponseNotFound('<p>Not found</p>')
+
+
+def esi_error(request):
+    raise ValueError('Fragment error')
@@ -1,6 +1,7 @@
 from django.http import Http404, HttpResponse
 from django.template import engines
 from django.template.response import TemplateResponse
+from django.utils.deprecation import MiddlewareMixin
 
 log = []
 
@@ -61,3 +62,43 @@ class LogMiddleware(BaseMiddleware):
 class NotFoundMiddleware(BaseMiddleware):
     def __call__(self, request):
         raise Http404('not found')
+
+
+class LogHooksMiddleware(MiddlewareMixin):
+    def process_request(self, request):
+        log.append('%s.process_request' % self.__class__.__name__)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        log.append('%s.process_view' % self.__class__.__name__)
+
+    def process_response(self, request, response):
+        log.append('%s.process_response' % self.__class__.__name__)
+        return response
+
+
+class OuterMiddleware(LogHooksMiddleware):
+    pass
+
+
+class InnerMiddleware(LogHooksMiddleware):
+    pass
+
+
+class ShortCircuitMiddleware(LogHooksMiddleware):
+    def process_request(self, request):
+        super().process_request(request)
+        return HttpResponse('Short-circuited')
+
+
+class ProcessRequestNotFoundMiddleware(LogHooksMiddleware):
+    def process_request(self, request):
+        super().process_request(request)
+        raise Http404('not found')
+
+
+class SkipViewPathMiddleware(LogHooksMiddleware):
+    skip_path_prefixes = ['/middleware_exceptions/view/']
+
+
+class SkipViewPathLogMiddleware(LogMiddleware):
+    skip_path_prefixes = ['/middleware_exceptions/view/']
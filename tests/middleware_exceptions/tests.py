@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.base import BaseHandler, MiddlewareMixinChain
 from django.test import RequestFactory, SimpleTestCase, override_settings
 
 from . import middleware as mw
@@ -91,6 +92,136 @@ class MiddlewareTests(SimpleTestCase):
         self.assertEqual(response.content, b'Exception caught')
 
 
+@override_settings(ROOT_URLCONF='middleware_exceptions.urls')
+class MiddlewareChainTests(SimpleTestCase):
+    rf = RequestFactory()
+
+    def tearDown(self):
+        mw.log = []
+
+    def get_response(self, path='/middleware_exceptions/view/'):
+        handler = BaseHandler()
+        handler.load_middleware()
+        return handler, handler.get_response(self.rf.get(path))
+
+    @override_settings(MIDDLEWARE=[
+        'middleware_exceptions.middleware.OuterMiddleware',
+        'middleware_exceptions.middleware.InnerMiddleware',
+    ])
+    def test_middleware_mixin_flattened(self):
+        handler, response = self.get_response()
+        self.assertIsInstance(handler._middleware_chain, MiddlewareMixinChain)
+        self.assertEqual(len(handler._middleware_chain.middleware), 2)
+        self.assertEqual(response.content, b'OK')
+        self.assertEqual(mw.log, [
+            'OuterMiddleware.process_request',
+            'InnerMiddleware.process_request',
+            'OuterMiddleware.process_view',
+            'InnerMiddleware.process_view',
+            'InnerMiddleware.process_response',
+            'OuterMiddleware.process_response',
+        ])
+
+    @override_settings(MIDDLEWARE=[
+        'middleware_exceptions.middleware.OuterMiddleware',
+        'middleware_exceptions.middleware.LogMiddleware',
+        'middleware_exceptions.middleware.InnerMiddleware',
+    ])
+    def test_middleware_mixin_not_flattened_across_other_middleware(self):
+        handler, response = self.get_response()
+        self.assertEqual(len(handler._middleware_chain.middleware), 1)
+        self.assertEqual(mw.log, [
+            'OuterMiddleware.process_request',
+            'InnerMiddleware.process_request',
+            'OuterMiddleware.process_view',
+            'InnerMiddleware.process_view',
+            'InnerMiddleware.process_response',
+            (200, b'OK'),
+            'OuterMiddleware.process_response',
+        ])
+
+    @override_settings(MIDDLEWARE=[
+        'middleware_exceptions.middleware.OuterMiddleware',
+        'middleware_exceptions.middleware.ShortCircuitMiddleware',
+        'middleware_exceptions.middleware.InnerMiddleware',
+    ])
+    def test_process_request_short_circuit(self):
+        handler, response = self.get_response()
+        self.assertEqual(response.content, b'Short-circuited')
+        self.assertEqual(mw.log, [
+            'OuterMiddleware.process_request',
+            'ShortCircuitMiddleware.process_request',
+            'ShortCircuitMiddleware.process_response',
+            'OuterMiddleware.process_response',
+        ])
+
+    @override_settings(MIDDLEWARE=[
+        'middleware_exceptions.middleware.OuterMiddleware',
+        'middleware_exceptions.middleware.ProcessRequestNotFoundMiddleware',
+        'middleware_exceptions.middleware.InnerMiddleware',
+    ])
+    def test_process_request_exception_converted(self):
+        handler, response = self.get_response()
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(mw.log, [
+            'OuterMiddleware.process_request',
+            'ProcessRequestNotFoundMiddleware.process_request',
+            'OuterMiddleware.process_response',
+        ])
+
+    @override_settings(MIDDLEWARE=[
+        'middleware_exceptions.middleware.OuterMiddleware',
+        'middleware_exceptions.middleware.SkipViewPathMiddleware',
+        'middleware_exceptions.middleware.SkipViewPathLogMiddleware',
+    ])
+    def test_skip_path_prefixes(self):
+        handler, response = self.get_response()
+        self.assertEqual(response.content, b'OK')
+        self.assertEqual(mw.log, [
+            'OuterMiddleware.process_request',
+            'OuterMiddleware.process_view',
+            'OuterMiddleware.process_response',
+        ])
+        mw.log = []
+        handler.get_response(self.rf.get('/middleware_exceptions/template_response/'))
+        self.assertEqual(mw.log, [
+            'OuterMiddleware.process_request',
+            'SkipViewPathMiddleware.process_request',
+            'OuterMiddleware.process_view',
+            'SkipViewPathMiddleware.process_view',
+            (200, b'template_response OK'),
+            'SkipViewPathMiddleware.process_response',
+            'OuterMiddleware.process_response',
+        ])
+
+    @override_settings(MIDDLEWARE=[
+        'middleware_exceptions.middleware.OuterMiddleware',
+        'middleware_exceptions.middleware.LogMiddleware',
+        'middleware_exceptions.middleware.ShortCircuitMiddleware',
+    ])
+    def test_middleware_stats(self):
+        handler, response = self.get_response()
+        self.assertIsNone(handler.middleware_stats)
+        with self.settings(MIDDLEWARE_STATS=True):
+            handler, response = self.get_response()
+        handler.get_response(self.rf.get('/middleware_exceptions/view/'))
+        self.assertEqual(list(handler.middleware_stats), [
+            'middleware_exceptions.middleware.OuterMiddleware',
+            'middleware_exceptions.middleware.LogMiddleware',
+            'middleware_exceptions.middleware.ShortCircuitMiddleware',
+        ])
+        outer, log, short_circuit = handler.middleware_stats.values()
+        for stats in (outer, log, short_circuit):
+            self.assertEqual(stats.calls, 2)
+            self.assertGreater(stats.time, 0)
+        self.assertGreaterEqual(outer.time, log.time)
+        self.assertGreaterEqual(log.time, short_circuit.time)
+        self.assertEqual(outer.short_circuits, 0)
+        self.assertEqual(short_circuit.short_circuits, 2)
+        short_circuit.reset()
+        self.assertEqual((short_circuit.calls, short_circuit.short_circuits, short_circuit.time), (0, 0, 0))
+
+
 @override_settings(ROOT_URLCONF='middleware_exceptions.urls')
 class RootUrlconfTests(SimpleTestCase):
 
@@ -669,6 +669,30 @@ class AutodetectorTests(TestCase):
         self.assertOperationTypes(changes, 'testapp', 0, ["DeleteModel"])
         self.assertOperationAttributes(changes, "testapp", 0, 0, name="Author")
 
+    def test_no_changes_not_rendered(self):
+        """
+        The states aren't rendered when all models are the same in both.
+        """
+        before = self.make_project_state([self.author_name, self.publisher, self.book])
+        after = self.make_project_state([self.author_name, self.publisher, self.book])
+        changes = MigrationAutodetector(before, after)._detect_changes()
+        self.assertEqual(changes, {})
+        self.assertNotIn('apps', before.__dict__)
+        self.assertNotIn('apps', after.__dict__)
+
+    def test_unchanged_models_skipped(self):
+        """
+        Only the models which changed are compared in detail.
+        """
+        before = self.make_project_state([self.author_empty, self.publisher, self.book])
+        after = self.make_project_state([self.author_name, self.publisher, self.book])
+        autodetector = MigrationAutodetector(before, after)
+        changes = autodetector._detect_changes()
+        self.assertEqual(autodetector.unchanged_model_keys, {('testapp', 'publisher'), ('otherapp', 'book')})
+        self.assertEqual(autodetector.kept_model_keys, {('testapp', 'author')})
+        self.assertEqual(list(changes), ['testapp'])
+        self.assertOperationTypes(changes, 'testapp', 0, ["AddField"])
+
     def test_add_field(self):
         """Tests autodetection of new fields."""
         changes = self.get_changes([self.author_empty], [self.author_name])
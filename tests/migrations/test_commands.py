@@ -63,6 +63,27 @@ class MigrateTests(MigrationTestBase):
         self.assertTableNotExists("migrations_tribble")
         self.assertTableNotExists("migrations_book")
 
+    @override_settings(MIGRATION_MODULES={"migrations": "migrations.test_migrations"})
+    def test_migrate_databases(self):
+        stdout = io.StringIO()
+        call_command('migrate', 'migrations', databases=['default', 'other'], stdout=stdout, no_color=True)
+        stdout = stdout.getvalue()
+        self.assertIn("Database 'default':", stdout)
+        self.assertIn("Database 'other':", stdout)
+        self.assertLess(stdout.index("Database 'default':"), stdout.index("Database 'other':"))
+        self.assertEqual(stdout.count('Applying migrations.0002_second... OK'), 2)
+        for db in ('default', 'other'):
+            self.assertTableExists("migrations_author", using=db)
+            self.assertTableExists("migrations_book", using=db)
+        call_command('migrate', 'migrations', 'zero', databases=['default', 'other'], verbosity=0)
+        for db in ('default', 'other'):
+            self.assertTableNotExists("migrations_author", using=db)
+            self.assertTableNotExists("migrations_book", using=db)
+
+    def test_migrate_databases_nonexistent_database(self):
+        with self.assertRaisesMessage(CommandError, "Database 'nonexistent' doesn't exist."):
+            call_command('migrate', databases=['default', 'nonexistent'], verbosity=0)
+
     @override_settings(INSTALLED_APPS=[
         'django.contrib.auth',
         'django.contrib.contenttypes',
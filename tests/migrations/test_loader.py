@@ -1,7 +1,10 @@
 import compileall
 import os
+import tempfile
 
 from django.db import connection, connections
+from django.db.migrations import Migration
+from django.db.migrations.cache import CachedMigration
 from django.db.migrations.exceptions import (
     AmbiguityError, InconsistentMigrationHistory, NodeNotFoundError,
 )
@@ -102,6 +105,30 @@ class LoaderTests(TestCase):
             [('migrations', '0001_initial'), ('migrations', '0002_second'), ('migrations2', '0001_initial')]
         )
 
+    @override_settings(MIGRATION_MODULES={'migrations': 'migrations.test_migrations'})
+    def test_project_state_cached(self):
+        """
+        The states of a set of migrations are cached and rendered once they're
+        requested again.
+        """
+        migration_loader = MigrationLoader(connection)
+        project_state = migration_loader.project_state(('migrations', '0002_second'))
+        self.assertNotIn('apps', project_state.__dict__)
+        # Changing a state doesn't change the cached one.
+        project_state.models['migrations', 'author'].fields.pop()
+        project_state_2 = migration_loader.project_state(('migrations', '0002_second'))
+        self.assertEqual(len(project_state_2.models['migrations', 'author'].fields), 5)
+        self.assertIn('apps', project_state_2.__dict__)
+        project_state_3 = migration_loader.project_state(('migrations', '0002_second'))
+        self.assertIs(
+            project_state_2.apps.get_model('migrations', 'Author'),
+            project_state_3.apps.get_model('migrations', 'Author'),
+        )
+        # Changing the graph clears the cache.
+        self.assertEqual(len(migration_loader.graph.state_cache), 1)
+        migration_loader.graph.add_node(('migrations', '0003_third'), None)
+        self.assertEqual(migration_loader.graph.state_cache, {})
+
     @override_settings(MIGRATION_MODULES={"migrations": "migrations.test_migrations_unmigdep"})
     def test_load_unmigrated_dependency(self):
         """
@@ -533,3 +560,54 @@ class PycLoaderTests(MigrationTestBase):
             )
             with self.assertRaisesRegex(ImportError, msg):
                 MigrationLoader(connection)
+
+
+class MigrationCacheTests(MigrationTestBase):
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        settings_override = self.settings(MIGRATION_CACHE_DIR=cache_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_cached_migrations(self):
+        with self.temporary_migration_module(module='migrations.test_migrations'):
+            loader = MigrationLoader(connection)
+            self.assertIsInstance(loader.disk_migrations['migrations', '0001_initial'], Migration)
+            cached_loader = MigrationLoader(connection)
+            migration = cached_loader.disk_migrations['migrations', '0002_second']
+            self.assertIsInstance(migration, CachedMigration)
+            self.assertEqual(migration.dependencies, [('migrations', '0001_initial')])
+            self.assertEqual(cached_loader.migrated_apps, loader.migrated_apps)
+            self.assertEqual(cached_loader.unmigrated_apps, loader.unmigrated_apps)
+            self.assertEqual(
+                cached_loader.graph.forwards_plan(('migrations', '0002_second')),
+                loader.graph.forwards_plan(('migrations', '0002_second')),
+            )
+            # The migration module is imported when the operations are needed.
+            self.assertNotIn('migration', migration.__dict__)
+            self.assertEqual(len(migration.operations), 4)
+            self.assertIsInstance(migration.migration, Migration)
+
+    def test_changed_migration_files(self):
+        with self.temporary_migration_module(module='migrations.test_migrations') as migration_dir:
+            MigrationLoader(connection)
+            path = os.path.join(migration_dir, '0002_second.py')
+            mtime = os.stat(path).st_mtime
+            os.utime(path, (mtime + 1, mtime + 1))
+            loader = MigrationLoader(connection)
+            self.assertIsInstance(loader.disk_migrations['migrations', '0002_second'], Migration)
+
+    def test_cached_project_state(self):
+        with self.temporary_migration_module(module='migrations.test_migrations'):
+            project_state = MigrationLoader(connection).project_state(('migrations', '0002_second'))
+            cached_loader = MigrationLoader(connection)
+            cached_state = cached_loader.project_state(('migrations', '0002_second'))
+            self.assertEqual(cached_state, project_state)
+            # The state was read from the cache and rendered.
+            self.assertIn('apps', cached_state.__dict__)
+            self.assertNotIn('migration', cached_loader.disk_migrations['migrations', '0002_second'].__dict__)
+            # Changing the graph stops using the cache.
+            cached_loader.graph.add_node(('migrations', '0003_third'), None)
+            self.assertIsNone(cached_loader.graph.state_cache.directory)
@@ -5,10 +5,11 @@ from django.db import connection, migrations, models, transaction
 from django.db.migrations.migration import Migration
 from django.db.migrations.operations import CreateModel
 from django.db.migrations.operations.fields import FieldOperation
+from django.db.migrations.recorder import MigrationRecorder
 from django.db.migrations.state import ModelState, ProjectState
 from django.db.models.fields import NOT_PROVIDED
 from django.db.transaction import atomic
-from django.db.utils import IntegrityError
+from django.db.utils import IntegrityError, NotSupportedError
 from django.test import SimpleTestCase, override_settings, skipUnlessDBFeature
 
 from .models import FoodManager, FoodQuerySet, UnicodeModel
@@ -1656,6 +1657,41 @@ class OperationTests(OperationTestBase):
         self.assertEqual(definition[1], [])
         self.assertEqual(definition[2], {'model_name': "Pony", 'index': index})
 
+    def test_add_index_online(self):
+        project_state = self.set_up_test_model("test_adinon")
+        index = models.Index(fields=["pink"], name="test_adinon_pony_pink_idx")
+        operation = migrations.AddIndex("Pony", index, online=True)
+        new_state = project_state.clone()
+        operation.state_forwards("test_adinon", new_state)
+        requires_autocommit = connection.features.online_index_changes_require_autocommit
+        self.assertIs(operation.can_run_in_transaction(connection), not requires_autocommit)
+        migration = Migration("0001_online", "test_adinon")
+        migration.operations = [operation]
+        self.assertIs(migration.is_atomic(connection), not requires_autocommit)
+        with connection.schema_editor(atomic=False) as editor:
+            operation.database_forwards("test_adinon", editor, project_state, new_state)
+        self.assertIndexExists("test_adinon_pony", ["pink"])
+        with connection.schema_editor(atomic=False) as editor:
+            operation.database_backwards("test_adinon", editor, new_state, project_state)
+        self.assertIndexNotExists("test_adinon_pony", ["pink"])
+        definition = operation.deconstruct()
+        self.assertEqual(definition[0], "AddIndex")
+        self.assertEqual(definition[1], [])
+        self.assertEqual(definition[2], {'model_name': "Pony", 'index': index, 'online': True})
+
+    @skipUnlessDBFeature('online_index_changes_require_autocommit')
+    def test_add_index_online_in_transaction(self):
+        project_state = self.set_up_test_model("test_adinontx")
+        index = models.Index(fields=["pink"], name="test_adinontx_pony_pink_idx")
+        operation = migrations.AddIndex("Pony", index, online=True)
+        new_state = project_state.clone()
+        operation.state_forwards("test_adinontx", new_state)
+        msg = 'cannot change indexes online inside a transaction.'
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            with connection.schema_editor(atomic=True) as editor:
+                operation.database_forwards("test_adinontx", editor, project_state, new_state)
+        self.assertIndexNotExists("test_adinontx_pony", ["pink"])
+
     def test_remove_index(self):
         """
         Test the RemoveIndex operation.
@@ -1683,6 +1719,7 @@ class OperationTests(OperationTestBase):
         self.assertEqual(definition[0], "RemoveIndex")
         self.assertEqual(definition[1], [])
         self.assertEqual(definition[2], {'model_name': "Pony", 'name': "pony_test_idx"})
+        self.assertIs(operation.can_run_in_transaction(connection), True)
 
         # Also test a field dropped with index - sqlite remake issue
         operations = [
@@ -1700,6 +1737,24 @@ class OperationTests(OperationTestBase):
         self.unapply_operations("test_rmin", project_state, operations=operations)
         self.assertIndexExists("test_rmin_pony", ["pink", "weight"])
 
+    def test_remove_index_online(self):
+        project_state = self.apply_operations("test_rminon", self.set_up_test_model("test_rminon"), [
+            migrations.AddIndex("Pony", models.Index(fields=["pink"], name="test_rminon_pony_pink_idx")),
+        ])
+        operation = migrations.RemoveIndex("Pony", "test_rminon_pony_pink_idx", online=True)
+        new_state = project_state.clone()
+        operation.state_forwards("test_rminon", new_state)
+        requires_autocommit = connection.features.online_index_changes_require_autocommit
+        self.assertIs(operation.can_run_in_transaction(connection), not requires_autocommit)
+        with connection.schema_editor(atomic=False) as editor:
+            operation.database_forwards("test_rminon", editor, project_state, new_state)
+        self.assertIndexNotExists("test_rminon_pony", ["pink"])
+        with connection.schema_editor(atomic=False) as editor:
+            operation.database_backwards("test_rminon", editor, new_state, project_state)
+        self.assertIndexExists("test_rminon_pony", ["pink"])
+        definition = operation.deconstruct()
+        self.assertEqual(definition[2], {'model_name': "Pony", 'name': "test_rminon_pony_pink_idx", 'online': True})
+
     def test_add_index_state_forwards(self):
         project_state = self.set_up_test_model('test_adinsf')
         index = models.Index(fields=['pink'], name='test_adinsf_pony_pink_idx')
@@ -2557,6 +2612,86 @@ class OperationTests(OperationTestBase):
             operation.database_forwards("test_runpython", editor, project_state, new_state)
             operation.database_backwards("test_runpython", editor, new_state, project_state)
 
+    def test_run_python_in_batches(self):
+        project_state = self.set_up_test_model("test_runpythonbatches")
+        Pony = project_state.apps.get_model("test_runpythonbatches", "Pony")
+        Pony.objects.bulk_create([Pony(pink=1, weight=1.0) for _ in range(5)])
+        batches = []
+
+        def forwards(models, schema_editor, queryset):
+            batches.append(list(queryset.values_list('pk', flat=True)))
+            queryset.update(pink=2)
+
+        def backwards(models, schema_editor, queryset):
+            queryset.update(pink=1)
+
+        operation = migrations.RunPythonInBatches("Pony", forwards, backwards, batch_size=2)
+        self.assertEqual(operation.describe(), "Raw Python operation on Pony in batches")
+        self.assertIs(operation.can_run_in_transaction(connection), False)
+        progress = []
+        new_state = project_state.clone()
+        operation.state_forwards("test_runpythonbatches", new_state)
+        callback = lambda action, **kwargs: progress.append((action, kwargs))  # NOQA
+        with connection.schema_editor(atomic=False, progress_callback=callback) as editor:
+            operation.database_forwards("test_runpythonbatches", editor, project_state, new_state)
+        pks = list(Pony.objects.order_by('pk').values_list('pk', flat=True))
+        self.assertEqual(batches, [pks[:2], pks[2:4], pks[4:]])
+        self.assertEqual(progress, [('batch_success', {'rows': rows}) for rows in (2, 4, 5)])
+        self.assertEqual(Pony.objects.filter(pink=2).count(), 5)
+        # The progress is forgotten once done.
+        self.assertEqual(MigrationRecorder(connection).progress_qs.count(), 0)
+        # And test reversal
+        with connection.schema_editor(atomic=False) as editor:
+            operation.database_backwards("test_runpythonbatches", editor, new_state, project_state)
+        self.assertEqual(Pony.objects.filter(pink=1).count(), 5)
+        # And deconstruction
+        definition = operation.deconstruct()
+        self.assertEqual(definition[0], "RunPythonInBatches")
+        self.assertEqual(definition[1], [])
+        self.assertEqual(definition[2], {
+            'model_name': "Pony", 'code': forwards, 'reverse_code': backwards, 'batch_size': 2,
+        })
+        with self.assertRaisesMessage(ValueError, "RunPythonInBatches must be supplied with a callable"):
+            migrations.RunPythonInBatches("Pony", "print 'ahahaha'")
+        with self.assertRaisesMessage(ValueError, "RunPythonInBatches batch_size must be a positive integer"):
+            migrations.RunPythonInBatches("Pony", forwards, batch_size=0)
+
+    def test_run_python_in_batches_resume(self):
+        """
+        An interrupted RunPythonInBatches continues after the last committed
+        batch.
+        """
+        project_state = self.set_up_test_model("test_runpythonbatchesresume")
+        Pony = project_state.apps.get_model("test_runpythonbatchesresume", "Pony")
+        Pony.objects.bulk_create([Pony(pink=1, weight=1.0) for _ in range(5)])
+        pks = list(Pony.objects.order_by('pk').values_list('pk', flat=True))
+        batches = []
+
+        def forwards(models, schema_editor, queryset):
+            if fail and batches:
+                raise ValueError("Interrupted.")
+            batches.append(list(queryset.values_list('pk', flat=True)))
+            queryset.update(pink=2)
+
+        operation = migrations.RunPythonInBatches("Pony", forwards, batch_size=2)
+        migration = Migration("0002_backfill", "test_runpythonbatchesresume")
+        migration.operations = [operation]
+        fail = True
+        with self.assertRaisesMessage(ValueError, "Interrupted."):
+            with connection.schema_editor(atomic=migration.is_atomic(connection)) as editor:
+                migration.apply(project_state, editor)
+        # The first batch is committed and recorded.
+        self.assertEqual(batches, [pks[:2]])
+        self.assertEqual(list(Pony.objects.filter(pink=2).order_by('pk').values_list('pk', flat=True)), pks[:2])
+        recorder = MigrationRecorder(connection)
+        self.assertEqual(recorder.progress_qs.get().last_key, str(pks[1]))
+        fail = False
+        with connection.schema_editor(atomic=migration.is_atomic(connection)) as editor:
+            migration.apply(project_state, editor)
+        self.assertEqual(batches, [pks[:2], pks[2:4], pks[4:]])
+        self.assertEqual(Pony.objects.filter(pink=2).count(), 5)
+        self.assertEqual(recorder.progress_qs.count(), 0)
+
     @unittest.skipIf(sqlparse is None and connection.features.requires_sqlparse_for_splitting, "Missing sqlparse")
     def test_separate_database_and_state(self):
         """
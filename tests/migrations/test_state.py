@@ -691,6 +691,33 @@ class StateTests(SimpleTestCase):
         self.assertIs(field_to_a_new.remote_field.through._meta.get_field('to_a').related_model, model_a_new)
         self.assertIs(field_to_a_new.remote_field.through._meta.get_field('from_a').related_model, model_a_new)
 
+    def test_clone_shares_model_states(self):
+        """
+        Model states are shared between clones until they're retrieved.
+        """
+        project_state = ProjectState()
+        project_state.add_model(ModelState('migrations', 'Tag', [('id', models.AutoField(primary_key=True))]))
+        project_state.add_model(ModelState('migrations', 'Food', [('id', models.AutoField(primary_key=True))]))
+        new_state = project_state.clone()
+        for key in project_state.models:
+            self.assertIs(new_state.models.readonly_get(key), project_state.models.readonly_get(key))
+
+        operation = AddField('tag', 'name', models.CharField(max_length=100))
+        operation.state_forwards('migrations', new_state)
+        self.assertEqual([name for name, _ in new_state.models['migrations', 'tag'].fields], ['id', 'name'])
+        self.assertEqual([name for name, _ in project_state.models['migrations', 'tag'].fields], ['id'])
+        self.assertIsNot(new_state.models['migrations', 'tag'], project_state.models['migrations', 'tag'])
+        # Only retrieving a model state clones it.
+        self.assertIs(
+            new_state.models.readonly_get(('migrations', 'food')),
+            project_state.models.readonly_get(('migrations', 'food')),
+        )
+        self.assertIsNot(
+            new_state.models.get(('migrations', 'food')),
+            project_state.models.readonly_get(('migrations', 'food')),
+        )
+        self.assertEqual(new_state.models['migrations', 'food'], project_state.models['migrations', 'food'])
+
     def test_equality(self):
         """
         == and != are implemented correctly.
@@ -0,0 +1,131 @@
+import datetime
+
+from django.db import NotSupportedError, connection
+from django.db.models import Avg, Count, Max, Min, Q, Sum
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+
+from .models import Book, Person
+
+
+class AcrossTests(TestCase):
+    multi_db = True
+
+    @classmethod
+    def setUpTestData(cls):
+        for alias, titles in (('default', ('B', 'D', 'F')), ('other', ('A', 'C', 'E'))):
+            for pages, title in enumerate(titles, 1):
+                Book.objects.using(alias).create(
+                    title=title, published=datetime.date(2009, 5, pages), pages=pages * 100,
+                )
+
+    def test_fetch(self):
+        books = Book.objects.across(['default', 'other']).order_by('title')
+        self.assertEqual([b.title for b in books], ['A', 'B', 'C', 'D', 'E', 'F'])
+        self.assertEqual(
+            [b._state.db for b in books],
+            ['other', 'default', 'other', 'default', 'other', 'default'],
+        )
+
+    def test_unordered(self):
+        books = Book.objects.across(['other', 'default']).order_by()
+        self.assertCountEqual([b.title for b in books], ['A', 'B', 'C', 'D', 'E', 'F'])
+
+    def test_multiple_orderings(self):
+        books = Book.objects.across(['default', 'other']).order_by('-pages', 'title')
+        self.assertEqual([b.title for b in books], ['E', 'F', 'C', 'D', 'A', 'B'])
+
+    def test_reverse(self):
+        books = Book.objects.across(['default', 'other']).order_by('title').reverse()
+        self.assertEqual([b.title for b in books], ['F', 'E', 'D', 'C', 'B', 'A'])
+
+    def test_limits_pushed_down(self):
+        qs = Book.objects.across(['default', 'other']).order_by('title')
+        with self.assertNumQueries(1, using='default'), self.assertNumQueries(1, using='other'):
+            self.assertEqual([b.title for b in qs[1:4]], ['B', 'C', 'D'])
+        self.assertIn('LIMIT 4', str(qs[1:4]._shard_limits().query))
+        self.assertEqual(qs[4].title, 'E')
+        self.assertEqual(qs.first().title, 'A')
+        self.assertEqual(qs.last().title, 'F')
+
+    def test_values(self):
+        qs = Book.objects.across(['default', 'other']).order_by('-title')
+        self.assertEqual(list(qs.values_list('title', flat=True)[:2]), ['F', 'E'])
+        self.assertEqual(list(qs.values('title', 'pages')[:1]), [{'title': 'F', 'pages': 300}])
+        self.assertEqual(list(qs.values_list('pages', 'title')[:1]), [(300, 'F')])
+
+    def test_get(self):
+        book = Book.objects.across(['default', 'other']).get(title='C')
+        self.assertEqual(book._state.db, 'other')
+
+    def test_count_and_exists(self):
+        qs = Book.objects.across(['default', 'other'])
+        self.assertEqual(qs.count(), 6)
+        self.assertEqual(qs.filter(pages__gt=100).count(), 4)
+        self.assertEqual(qs.order_by('title')[2:].count(), 4)
+        self.assertEqual(qs.order_by('title')[5:10].count(), 1)
+        self.assertIs(qs.filter(title='E').exists(), True)
+        self.assertIs(qs.filter(title='Z').exists(), False)
+        self.assertIs(qs.order_by('title')[6:].exists(), False)
+
+    def test_aggregate(self):
+        Book.objects.using('other').filter(title='A').update(pages=700)
+        self.assertEqual(
+            Book.objects.across(['default', 'other']).aggregate(
+                Count('pk'), Sum('pages'), Max('pages'), Min('pages'), Avg('pages'),
+                filtered=Avg('pages', filter=Q(title__in=['A', 'B'])),
+            ),
+            {
+                'pk__count': 6, 'pages__sum': 1800, 'pages__max': 700,
+                'pages__min': 100, 'pages__avg': 300, 'filtered': 400,
+            },
+        )
+
+    def test_aggregate_empty(self):
+        self.assertEqual(
+            Book.objects.across(['default', 'other']).filter(pages=0).aggregate(
+                Count('pk'), Sum('pages'), Avg('pages'),
+            ),
+            {'pk__count': 0, 'pages__sum': None, 'pages__avg': None},
+        )
+
+    def test_using_resets_across(self):
+        self.assertEqual(Book.objects.across(['default', 'other']).using('other').count(), 3)
+
+    def test_no_aliases(self):
+        with self.assertRaisesMessage(ValueError, 'across() requires at least one database alias.'):
+            Book.objects.across([])
+
+    def test_unsupported(self):
+        qs = Book.objects.across(['default', 'other'])
+        msg = 'Calling QuerySet.%s() after across() is not supported.'
+        with self.assertRaisesMessage(NotSupportedError, msg % 'delete'):
+            qs.delete()
+        with self.assertRaisesMessage(NotSupportedError, msg % 'update'):
+            qs.update(pages=1)
+        with self.assertRaisesMessage(NotSupportedError, msg % 'iterator'):
+            qs.iterator()
+        msg = "across() can only order by fields of the model, got 'editor__name'."
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            list(qs.order_by('editor__name'))
+        with self.assertRaisesMessage(NotSupportedError, "got 'editor'."):
+            list(qs.order_by('editor'))
+        msg = "across() can only order by selected fields, got 'pages'."
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            list(qs.order_by('pages').values('title'))
+        msg = 'across() only supports non-distinct Avg, Count, Max, Min, and Sum aggregates.'
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            qs.aggregate(Count('pages', distinct=True))
+
+
+class AcrossThreadTests(TransactionTestCase):
+    multi_db = True
+    available_apps = ['multiple_database']
+
+    @skipUnlessDBFeature('test_db_allows_multiple_connections')
+    def test_concurrent_fetch(self):
+        Person.objects.using('default').create(name='Marty')
+        Person.objects.using('other').create(name='Doc')
+        self.assertFalse(connection.in_atomic_block)
+        people = Person.objects.across(['default', 'other'])
+        self.assertEqual([p.name for p in people], ['Doc', 'Marty'])
+        self.assertEqual(people.count(), 2)
@@ -0,0 +1,113 @@
+import datetime
+from unittest import mock
+
+from django.core import signals
+from django.db import DatabaseError, connections, router
+from django.db.routers import (
+    PrimaryReplicaRouter, is_pinned_to_primary, unpin_from_primary,
+    use_primary,
+)
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from .models import Book, Person
+
+
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    allow_database_queries = True
+
+    def setUp(self):
+        unpin_from_primary()
+        self.addCleanup(unpin_from_primary)
+        self.router = PrimaryReplicaRouter(replicas=['other'])
+
+    def test_invalid_keyword(self):
+        msg = "PrimaryReplicaRouter() received an invalid keyword 'replica'."
+        with self.assertRaisesMessage(TypeError, msg):
+            PrimaryReplicaRouter(replica='other')
+
+    def test_reads_go_to_replica(self):
+        self.assertEqual(self.router.db_for_read(Book), 'other')
+        self.assertEqual(self.router.db_for_write(Book), 'default')
+
+    def test_round_robin(self):
+        router = PrimaryReplicaRouter(replicas=['other', 'default'])
+        with mock.patch.object(router, 'check_replica', return_value=True):
+            self.assertEqual(
+                [router.get_replica() for _ in range(4)],
+                ['other', 'default', 'other', 'default'],
+            )
+
+    def test_no_replicas(self):
+        self.assertEqual(PrimaryReplicaRouter().db_for_read(Book), 'default')
+
+    def test_write_pins_thread_until_request_finished(self):
+        self.router.db_for_write(Book)
+        self.assertIs(is_pinned_to_primary(), True)
+        self.assertEqual(self.router.db_for_read(Person), 'default')
+        signals.request_finished.send(sender=self.__class__)
+        self.assertIs(is_pinned_to_primary(), False)
+        self.assertEqual(self.router.db_for_read(Person), 'other')
+
+    def test_use_primary(self):
+        with use_primary():
+            with use_primary():
+                self.assertEqual(self.router.db_for_read(Book), 'default')
+            self.assertEqual(self.router.db_for_read(Book), 'default')
+        self.assertEqual(self.router.db_for_read(Book), 'other')
+
+    def test_atomic_block_reads_primary(self):
+        with mock.patch.object(connections['default'], 'in_atomic_block', True):
+            self.assertEqual(self.router.db_for_read(Book), 'default')
+
+    def test_instance_hint(self):
+        self.assertIsNone(self.router.db_for_read(Book, instance=Book()))
+
+    def test_unavailable_replica(self):
+        with mock.patch.object(connections['other'], 'ensure_connection', side_effect=DatabaseError):
+            self.assertEqual(self.router.db_for_read(Book), 'default')
+        # The result of the health check is reused until it expires.
+        self.assertEqual(self.router.db_for_read(Book), 'default')
+        with mock.patch('django.db.routers.time.monotonic', return_value=10 ** 9):
+            self.assertEqual(self.router.db_for_read(Book), 'other')
+
+    def test_replication_lag(self):
+        router = PrimaryReplicaRouter(replicas=['other'], max_replication_lag=5, health_check_interval=0)
+        ops = connections['other'].ops
+        with mock.patch.object(ops, 'replication_lag', return_value=10):
+            self.assertEqual(router.db_for_read(Book), 'default')
+        with mock.patch.object(ops, 'replication_lag', return_value=2):
+            self.assertEqual(router.db_for_read(Book), 'other')
+        # Backends which can't report the lag are assumed to be up to date.
+        self.assertEqual(router.db_for_read(Book), 'other')
+
+    def test_allow_migrate(self):
+        self.assertIs(self.router.allow_migrate('other', 'multiple_database'), False)
+        self.assertIsNone(self.router.allow_migrate('default', 'multiple_database'))
+
+    def test_allow_relation(self):
+        book, person = Book(), Person()
+        book._state.db, person._state.db = 'default', 'other'
+        self.assertIs(self.router.allow_relation(book, person), True)
+        person._state.db = 'unknown'
+        self.assertIsNone(self.router.allow_relation(book, person))
+
+
+@override_settings(DATABASE_ROUTERS=[PrimaryReplicaRouter(replicas=['other'])])
+class PrimaryReplicaRouterQueryTests(TestCase):
+    multi_db = True
+
+    def setUp(self):
+        unpin_from_primary()
+        self.addCleanup(unpin_from_primary)
+
+    def test_save_then_read(self):
+        self.assertEqual(Book.objects.all().db, 'default')
+        # Pretend to be outside of the test transaction to let reads use the
+        # replica.
+        outside_transaction = mock.patch.object(connections['default'], 'in_atomic_block', False)
+        with outside_transaction:
+            self.assertEqual(Book.objects.all().db, 'other')
+        Book.objects.create(title='Dive into Python', published=datetime.date(2009, 5, 4))
+        with outside_transaction:
+            self.assertEqual(Book.objects.all().db, 'default')
+            self.assertEqual(router.db_for_read(Person), 'default')
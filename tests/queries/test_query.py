@@ -10,7 +10,7 @@ from django.db.models.sql.query import Query
 from django.db.models.sql.where import OR
 from django.test import TestCase
 
-from .models import Author, Item, ObjectC, Ranking
+from .models import Author, Item, Note, ObjectC, Ranking
 
 
 class TestQuery(TestCase):
@@ -93,3 +93,43 @@ class TestQuery(TestCase):
         self.assertIsInstance(b_isnull, RelatedIsNull)
         self.assertIsInstance(b_isnull.lhs, SimpleCol)
         self.assertEqual(b_isnull.lhs.target, ObjectC._meta.get_field('objectb'))
+
+    def test_clone_shares_child_nodes(self):
+        query = Query(Author)
+        query.add_q(Q(num__gt=2) | Q(num__lt=0))
+        clone = query.clone()
+        self.assertIsNot(clone.where, query.where)
+        self.assertIs(clone.where.children[0], query.where.children[0])
+        clone.add_q(Q(name='foo'))
+        self.assertEqual(len(query.where.children), 1)
+        self.assertEqual(len(clone.where.children), 2)
+
+    def test_relabel_clone_leaves_original_unchanged(self):
+        query = Query(Author)
+        query.add_q(Q(num__gt=2) | Q(num__lt=0))
+        alias = query.get_initial_alias()
+        clone = query.relabeled_clone({alias: 'U0'})
+        self.assertEqual(clone.where.children[0].children[0].lhs.alias, 'U0')
+        self.assertEqual(query.where.children[0].children[0].lhs.alias, alias)
+
+    def test_names_to_path_memoized(self):
+        opts = Author._meta
+        opts._expire_cache()
+        query = Query(Author)
+        path, final_field, targets, rest = query.names_to_path(['extra', 'note', 'note', 'exact'], opts)
+        self.assertEqual(final_field, Note._meta.get_field('note'))
+        self.assertEqual(rest, ['exact'])
+        self.assertEqual(len(opts._lookup_path_cache), 1)
+        self.assertEqual(
+            Query(Author).names_to_path(['extra', 'note', 'note', 'exact'], opts),
+            (path, final_field, targets, rest),
+        )
+        opts._expire_cache()
+        self.assertEqual(opts._lookup_path_cache, {})
+
+    def test_names_to_path_memo_respects_annotations(self):
+        Query(Author).names_to_path(['extra', 'value_plus_one'], Author._meta)
+        query = Query(Author)
+        query.add_annotation(F('extra__value') + 1, 'value_plus_one')
+        _, _, _, rest = query.names_to_path(['extra', 'value_plus_one'], Author._meta)
+        self.assertEqual(rest, [])
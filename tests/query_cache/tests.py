@@ -0,0 +1,190 @@
+import unittest
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, transaction
+from django.db.models import Count, Exists, OuterRef
+from django.db.models.query_cache import (
+    get_query_tables, invalidate_raw_writes,
+)
+from django.test import (
+    SimpleTestCase, TestCase, TransactionTestCase, override_settings,
+)
+
+from .models import Author, Book, Tag
+
+
+@override_settings(QUERYSET_CACHE_ALIAS='default')
+class QuerySetCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name='Ann')
+        cls.book = Book.objects.create(title='First', author=cls.author)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_results_cached(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Author.objects.cache()), [self.author])
+        with self.assertNumQueries(0):
+            self.assertEqual(list(Author.objects.cache()), [self.author])
+
+    def test_get(self):
+        self.assertEqual(Author.objects.cache().get(name='Ann'), self.author)
+        with self.assertNumQueries(0):
+            self.assertEqual(Author.objects.cache().get(name='Ann'), self.author)
+
+    def test_uncached_queryset(self):
+        list(Author.objects.cache())
+        with self.assertNumQueries(1):
+            list(Author.objects.all())
+
+    def test_chaining_preserves_cache(self):
+        qs = Author.objects.cache().filter(name='Ann')
+        list(qs.order_by('name'))
+        with self.assertNumQueries(0):
+            self.assertEqual(list(qs.order_by('name')), [self.author])
+
+    def test_values(self):
+        self.assertEqual(list(Author.objects.cache().values_list('name', flat=True)), ['Ann'])
+        with self.assertNumQueries(0):
+            self.assertEqual(list(Author.objects.cache().values_list('name', flat=True)), ['Ann'])
+        # The same SQL evaluated with another iterable class isn't shared.
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Author.objects.cache().values('name')), [{'name': 'Ann'}])
+
+    def test_named_values_list_not_cached(self):
+        list(Author.objects.cache().values_list('name', named=True))
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Author.objects.cache().values_list('name', named=True))[0].name, 'Ann')
+
+    def test_save_invalidates(self):
+        list(Author.objects.cache())
+        Author.objects.create(name='Bob')
+        with self.assertNumQueries(1):
+            self.assertEqual(len(Author.objects.cache()), 2)
+
+    def test_delete_invalidates(self):
+        list(Book.objects.cache())
+        Author.objects.get(pk=self.author.pk).delete()
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Book.objects.cache()), [])
+
+    def test_queryset_delete_invalidates_related(self):
+        list(Book.objects.cache())
+        Author.objects.all().delete()
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Book.objects.cache()), [])
+
+    def test_update_invalidates(self):
+        list(Author.objects.cache())
+        Author.objects.update(name='Anne')
+        with self.assertNumQueries(1):
+            self.assertEqual(Author.objects.cache().get().name, 'Anne')
+
+    def test_bulk_create_invalidates(self):
+        list(Author.objects.cache())
+        Author.objects.bulk_create([Author(name='Bob')])
+        with self.assertNumQueries(1):
+            self.assertEqual(len(Author.objects.cache()), 2)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'PostgreSQL specific')
+    def test_copy_from_invalidates(self):
+        list(Author.objects.cache())
+        Author.objects.copy_from([Author(name='Bob')])
+        with self.assertNumQueries(1):
+            self.assertEqual(len(Author.objects.cache()), 2)
+
+    def test_rollback_invalidates(self):
+        """
+        Results read from uncommitted writes aren't served once the writes
+        are rolled back.
+        """
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                Author.objects.create(name='Ghost')
+                self.assertEqual(len(Author.objects.cache()), 2)
+                with self.assertNumQueries(0):
+                    self.assertEqual(len(Author.objects.cache()), 2)
+                raise ValueError
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Author.objects.cache()), [self.author])
+
+    def test_m2m_invalidates(self):
+        tag = Tag.objects.create(name='new')
+        list(Book.objects.cache().filter(tags__name='new'))
+        self.book.tags.add(tag)
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Book.objects.cache().filter(tags__name='new')), [self.book])
+
+    def test_join_invalidates(self):
+        qs = Book.objects.cache().filter(author__name='Ann')
+        list(qs)
+        Author.objects.update(name='Anne')
+        with self.assertNumQueries(1):
+            self.assertEqual(list(qs.all()), [])
+
+    def test_subquery_invalidates(self):
+        qs = Author.objects.cache().annotate(
+            has_books=Exists(Book.objects.filter(author=OuterRef('pk'))),
+        ).filter(has_books=True)
+        self.assertEqual(list(qs), [self.author])
+        Book.objects.all().delete()
+        with self.assertNumQueries(1):
+            self.assertEqual(list(qs.all()), [])
+
+    def test_raw_writes_invalidate(self):
+        list(Author.objects.cache())
+        with connection.execute_wrapper(invalidate_raw_writes):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'UPDATE %s SET name = %%s' % connection.ops.quote_name(Author._meta.db_table),
+                    ['Anne'],
+                )
+        with self.assertNumQueries(1):
+            self.assertEqual(Author.objects.cache().get().name, 'Anne')
+
+    def test_empty_result(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(list(Author.objects.cache().filter(pk__in=[])), [])
+
+
+class QuerySetCacheConfigurationTests(SimpleTestCase):
+    def test_not_configured(self):
+        msg = 'QuerySet.cache() requires the QUERYSET_CACHE_ALIAS setting'
+        with self.assertRaisesMessage(ImproperlyConfigured, msg):
+            Author.objects.cache()
+
+    def test_get_query_tables(self):
+        qs = Author.objects.annotate(Count('books__tags'))
+        str(qs.query)
+        self.assertEqual(
+            get_query_tables(qs.query),
+            {'query_cache_author', 'query_cache_book', 'query_cache_book_tags', 'query_cache_tag'},
+        )
+
+
+@override_settings(QUERYSET_CACHE_ALIAS='default')
+class QuerySetCacheTransactionTests(TransactionTestCase):
+    available_apps = ['query_cache']
+
+    def setUp(self):
+        cache.clear()
+
+    def test_rollback_invalidates(self):
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                Author.objects.create(name='Ghost')
+                self.assertEqual([author.name for author in Author.objects.cache()], ['Ghost'])
+                raise ValueError
+        self.assertEqual(list(Author.objects.values_list('name', flat=True)), [])
+        self.assertEqual(list(Author.objects.cache()), [])
+
+    def test_commit_keeps_caching(self):
+        with transaction.atomic():
+            Author.objects.create(name='Ann')
+            list(Author.objects.cache())
+        self.assertEqual([author.name for author in Author.objects.cache()], ['Ann'])
+        with self.assertNumQueries(0):
+            self.assertEqual(len(Author.objects.cache()), 1)
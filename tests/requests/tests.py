@@ -5,7 +5,7 @@ from urllib.parse import urlencode
 from django.core.exceptions import DisallowedHost
 from django.core.handlers.wsgi import LimitedStream, WSGIRequest
 from django.http import HttpRequest, RawPostDataException, UnreadablePostError
-from django.http.request import split_domain_port
+from django.http.request import HttpHeaders, split_domain_port
 from django.test import RequestFactory, SimpleTestCase, override_settings
 from django.test.client import FakePayload
 
@@ -85,6 +85,43 @@ class RequestsTests(SimpleTestCase):
         self.assertEqual(request.content_type, 'text/html')
         self.assertEqual(request.content_params, {'charset': 'utf8'})
 
+    def test_wsgirequest_lazy_attributes(self):
+        """
+        The content type, encoding, and body stream are set up on first
+        access.
+        """
+        request = WSGIRequest({
+            'PATH_INFO': '/',
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_TYPE': 'application/x-www-form-urlencoded; charset=iso-8859-1',
+            'CONTENT_LENGTH': '5',
+            'wsgi.input': BytesIO(b'a=%E9xxx'),
+        })
+        for attr in ('content_type', 'content_params', '_encoding', '_stream'):
+            self.assertNotIn(attr, request.__dict__)
+        self.assertEqual(request.encoding, 'iso-8859-1')
+        self.assertEqual(request.content_type, 'application/x-www-form-urlencoded')
+        self.assertEqual(request.POST, {'a': ['é']})
+        self.assertEqual(request.body, b'a=%E9')
+
+    def test_wsgirequest_encoding(self):
+        environ = {
+            'PATH_INFO': '/',
+            'REQUEST_METHOD': 'GET',
+            'QUERY_STRING': 'a=%E9',
+            'CONTENT_TYPE': 'text/plain; charset=bogus',
+            'wsgi.input': BytesIO(b''),
+        }
+        # An unknown charset is ignored.
+        self.assertIsNone(WSGIRequest(environ.copy()).encoding)
+        # An encoding set before the content type is parsed isn't replaced.
+        environ['CONTENT_TYPE'] = 'text/plain; charset=utf-8'
+        request = WSGIRequest(environ.copy())
+        request.encoding = 'iso-8859-1'
+        self.assertEqual(request.GET, {'a': ['é']})
+        self.assertEqual(request.content_params, {'charset': 'utf-8'})
+        self.assertEqual(request.encoding, 'iso-8859-1')
+
     def test_wsgirequest_with_script_name(self):
         """
         The request's path is correctly assembled, regardless of whether or
@@ -770,6 +807,69 @@ class HostValidationTests(SimpleTestCase):
         self.assertEqual(port, '8080')
 
 
+class RequestHeadersTests(SimpleTestCase):
+    ENVIRON = {
+        # Non-headers are ignored.
+        'PATH_INFO': '/somepath/',
+        'REQUEST_METHOD': 'GET',
+        'wsgi.input': BytesIO(b''),
+        # These non-HTTP prefixed headers are included.
+        'CONTENT_TYPE': 'text/html',
+        'CONTENT_LENGTH': '100',
+        # All HTTP-prefixed headers are included.
+        'HTTP_ACCEPT': '*',
+        'HTTP_HOST': 'example.com',
+        'HTTP_USER_AGENT': 'python-requests/1.2.0',
+    }
+
+    def test_base_request_headers(self):
+        request = HttpRequest()
+        request.META = self.ENVIRON
+        self.assertEqual(dict(request.headers), {
+            'Content-Type': 'text/html',
+            'Content-Length': '100',
+            'Accept': '*',
+            'Host': 'example.com',
+            'User-Agent': 'python-requests/1.2.0',
+        })
+
+    def test_wsgi_request_headers(self):
+        request = WSGIRequest(self.ENVIRON.copy())
+        self.assertEqual(len(request.headers), 5)
+        self.assertEqual(request.headers['User-Agent'], 'python-requests/1.2.0')
+        self.assertEqual(request.headers['content-length'], '100')
+        self.assertEqual(request.headers.get('ACCEPT'), '*')
+        self.assertIn('Host', request.headers)
+        self.assertNotIn('Path-Info', request.headers)
+        self.assertIsNone(request.headers.get('Referer'))
+
+    def test_wsgi_request_headers_view(self):
+        """request.headers reflects changes to META."""
+        request = WSGIRequest(self.ENVIRON.copy())
+        self.assertNotIn('Referer', request.headers)
+        request.META['HTTP_REFERER'] = 'https://example.com/'
+        self.assertEqual(request.headers['Referer'], 'https://example.com/')
+
+    def test_invalid_header_names(self):
+        headers = HttpHeaders({'HTTP_USER_AGENT': 'python-requests/1.2.0', 'CONTENT_TYPE': 'text/html'})
+        for name in ('User_Agent', 'HTTP_USER_AGENT', 'CONTENT_TYPE', 'Http-User-Agent', ''):
+            with self.subTest(name=name), self.assertRaisesMessage(KeyError, name):
+                headers[name]
+
+    def test_parse_header_name(self):
+        tests = (
+            ('PATH_INFO', None),
+            ('HTTP_ACCEPT', 'Accept'),
+            ('HTTP_USER_AGENT', 'User-Agent'),
+            ('HTTP_X_FORWARDED_PROTO', 'X-Forwarded-Proto'),
+            ('CONTENT_TYPE', 'Content-Type'),
+            ('CONTENT_LENGTH', 'Content-Length'),
+        )
+        for header, expected in tests:
+            with self.subTest(header=header):
+                self.assertEqual(HttpHeaders.parse_header_name(header), expected)
+
+
 class BuildAbsoluteURITests(SimpleTestCase):
     factory = RequestFactory()
 
@@ -3,10 +3,12 @@ import os
 import sys
 import tempfile
 from unittest import skipIf
+from urllib.parse import quote
 
 from django.core.files.base import ContentFile
 from django.http import FileResponse
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
+from django.utils.http import etag_from_stat
 
 
 class FileResponseTests(SimpleTestCase):
@@ -71,3 +73,105 @@ class FileResponseTests(SimpleTestCase):
             response['Content-Disposition'],
             "attachment; filename*=utf-8''%E7%A5%9D%E6%82%A8%E5%B9%B3%E5%AE%89.odt"
         )
+
+    def test_offload_header(self):
+        response = FileResponse(open(__file__, 'rb'))
+        with self.settings(FILE_RESPONSE_OFFLOAD_HEADER='X-Sendfile'):
+            self.assertIs(response.offload(), True)
+        self.assertEqual(response['X-Sendfile'], __file__)
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertIsNone(response.file_to_stream)
+        self.assertEqual(list(response), [])
+        response.close()
+
+    def test_offload_header_disabled(self):
+        response = FileResponse(open(__file__, 'rb'))
+        self.assertIs(response.offload(), False)
+        self.assertFalse(response.has_header('X-Sendfile'))
+        self.assertEqual(response['Content-Length'], str(os.path.getsize(__file__)))
+        response.close()
+
+    @override_settings(FILE_RESPONSE_OFFLOAD_HEADER='X-Accel-Redirect')
+    def test_offload_paths(self):
+        directory = os.path.dirname(__file__)
+        with tempfile.NamedTemporaryFile(dir=directory, prefix='fïle ') as tmp:
+            name = os.path.basename(tmp.name)
+            tests = [
+                ({}, tmp.name),
+                ({directory: '/protected/'}, '/protected/' + quote(name)),
+                ({directory + os.sep: '/protected'}, '/protected/' + quote(name)),
+                ({os.path.dirname(directory): '/protected/'}, '/protected/responses/' + quote(name)),
+                ({directory + 'x': '/protected/'}, None),
+            ]
+            for paths, location in tests:
+                with self.subTest(paths=paths), self.settings(FILE_RESPONSE_OFFLOAD_PATHS=paths):
+                    response = FileResponse(open(tmp.name, 'rb'))
+                    self.assertEqual(response.get_offload_location(), location)
+                    self.assertIs(response.offload(), location is not None)
+                    self.assertEqual(response.get('X-Accel-Redirect'), location)
+                    response.close()
+
+    @override_settings(FILE_RESPONSE_OFFLOAD_HEADER='X-Sendfile')
+    def test_offload_not_possible(self):
+        """
+        Files without an absolute path and partially read files aren't
+        offloaded.
+        """
+        response = FileResponse(io.BytesIO(b'binary content'))
+        self.assertIs(response.offload(), False)
+        with open(__file__, 'rb') as f:
+            f.read(10)
+            response = FileResponse(f)
+            self.assertIs(response.offload(), False)
+        response = FileResponse(ContentFile(b'binary content', name='file.txt'))
+        self.assertIs(response.offload(), False)
+
+    def test_etag(self):
+        response = FileResponse(open(__file__, 'rb'))
+        self.assertEqual(response['ETag'], etag_from_stat(os.stat(__file__)))
+        response.close()
+        response = FileResponse(io.BytesIO(b'binary content'))
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_supports_ranges(self):
+        response = FileResponse(io.BytesIO(b'binary content'))
+        self.assertIs(response.supports_ranges(), True)
+        response = FileResponse(io.BytesIO(b'binary content'), status=404)
+        self.assertIs(response.supports_ranges(), False)
+        response = FileResponse(iter([b'binary content']))
+        self.assertIs(response.supports_ranges(), False)
+        response = FileResponse(io.BufferedReader(io.BytesIO(b'binary content')))
+        self.assertIs(response.supports_ranges(), False)
+        with open(__file__, 'rb') as f, self.settings(FILE_RESPONSE_OFFLOAD_HEADER='X-Sendfile'):
+            self.assertIs(FileResponse(f).supports_ranges(), False)
+
+    def test_single_range(self):
+        response = FileResponse(io.BytesIO(b'binary content'))
+        response.set_ranges([(7, 13)])
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 7-13/14')
+        self.assertEqual(response['Content-Length'], '7')
+        self.assertEqual(b''.join(response), b'content')
+        self.assertIsNone(response.file_to_stream)
+
+    def test_multiple_ranges(self):
+        response = FileResponse(io.BytesIO(b'binary content'), content_type='text/plain')
+        response.set_ranges([(0, 5), (7, 13)])
+        self.assertEqual(response.status_code, 206)
+        content_type, boundary = response['Content-Type'].split('; boundary=')
+        self.assertEqual(content_type, 'multipart/byteranges')
+        content = b''.join(response)
+        self.assertEqual(len(content), int(response['Content-Length']))
+        self.assertEqual(content, (
+            '--{0}\r\nContent-Type: text/plain\r\nContent-Range: bytes 0-5/14\r\n\r\nbinary\r\n'
+            '--{0}\r\nContent-Type: text/plain\r\nContent-Range: bytes 7-13/14\r\n\r\ncontent\r\n'
+            '--{0}--\r\n'
+        ).format(boundary).encode())
+
+    def test_unsatisfiable_range(self):
+        response = FileResponse(io.BytesIO(b'binary content'))
+        response.set_ranges([])
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */14')
+        self.assertEqual(response['Content-Length'], '0')
+        self.assertEqual(b''.join(response), b'')
@@ -2,18 +2,32 @@ import datetime
 import decimal
 import json
 import re
+import unittest
+import uuid
+from io import BytesIO
+from unittest import mock
 
 from django.core import serializers
+from django.core.exceptions import ImproperlyConfigured
 from django.core.serializers.base import DeserializationError
-from django.core.serializers.json import DjangoJSONEncoder
+from django.core.serializers.json import (
+    DjangoJSONEncoder, JSONBackend, OrjsonBackend, get_json_backend,
+)
 from django.db import models
-from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.test import (
+    SimpleTestCase, TestCase, TransactionTestCase, override_settings,
+)
 from django.test.utils import isolate_apps
 from django.utils.translation import gettext_lazy, override
 
-from .models import Score
+from .models import Article, Category, Score
 from .tests import SerializersTestBase, SerializersTransactionTestBase
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class JsonSerializerTestCase(SerializersTestBase, TestCase):
     serializer_name = "json"
@@ -92,6 +106,25 @@ class JsonSerializerTestCase(SerializersTestBase, TestCase):
             for obj in serializers.deserialize("json", """[{"pk":1}"""):
                 pass
 
+    def test_deserializer_reads_incrementally(self):
+        """
+        Objects are yielded as the stream is parsed, before reaching invalid
+        data further in the stream.
+        """
+        serial_str = serializers.serialize(self.serializer_name, Article.objects.all())
+        stream = BytesIO(serial_str[:-1].encode() + b', {"pk": invalid}]')
+        objs = serializers.deserialize(self.serializer_name, stream)
+        self.assertEqual(next(objs).object.pk, self.a1.pk)
+        with self.assertRaises(DeserializationError):
+            list(objs)
+
+    def test_deserializer_multibyte_chunks(self):
+        """Characters split across the chunks read from a stream are decoded."""
+        serial_str = serializers.serialize(self.serializer_name, [Category(pk=1, name='Français ☃')])
+        with mock.patch('django.core.serializers.json.CHUNK_SIZE', 1):
+            obj = next(serializers.deserialize(self.serializer_name, BytesIO(serial_str.encode())))
+        self.assertEqual(obj.object.name, 'Français ☃')
+
     def test_helpful_error_message_invalid_pk(self):
         """
         If there is an invalid primary key, the error message should contain
@@ -305,3 +338,97 @@ class DjangoJSONEncoderTests(SimpleTestCase):
             json.dumps({'duration': duration}, cls=DjangoJSONEncoder),
             '{"duration": "P0DT00H00M00S"}'
         )
+
+
+class SortedJSONBackend(JSONBackend):
+    def dumps(self, obj, cls=DjangoJSONEncoder, **kwargs):
+        kwargs['sort_keys'] = True
+        return super().dumps(obj, cls=cls, **kwargs)
+
+
+class JSONBackendTests(SimpleTestCase):
+    data = {
+        'datetime': datetime.datetime(2018, 1, 2, 3, 4, 5, 678901),
+        'decimal': decimal.Decimal('1.10'),
+        'uuid': uuid.UUID('12345678123456781234567812345678'),
+        'text': 'łóżko',
+    }
+
+    def test_dumps(self):
+        backend = JSONBackend()
+        expected = json.dumps(self.data, cls=DjangoJSONEncoder)
+        self.assertEqual(backend.dumps(self.data), expected)
+        self.assertEqual(backend.dumps_bytes(self.data), expected.encode())
+        self.assertEqual(backend.dumps([1], indent=2), '[\n  1\n]')
+
+    def test_dumps_without_encoder(self):
+        backend = JSONBackend()
+        self.assertEqual(backend.dumps({'a': 1}, cls=None), '{"a": 1}')
+        with self.assertRaises(TypeError):
+            backend.dumps(self.data, cls=None)
+
+    def test_loads(self):
+        backend = JSONBackend()
+        self.assertEqual(backend.loads('{"a": [1, 2]}'), {'a': [1, 2]})
+        self.assertEqual(backend.loads('{"a": "ł"}'.encode()), {'a': 'ł'})
+        self.assertEqual(backend.loads('1.1', parse_float=decimal.Decimal), decimal.Decimal('1.1'))
+
+    def test_json_backend_setting(self):
+        self.assertIsInstance(get_json_backend(), JSONBackend)
+        self.assertIs(get_json_backend(), get_json_backend())
+        with override_settings(JSON_BACKEND='serializers.test_json.SortedJSONBackend'):
+            self.assertIsInstance(get_json_backend(), SortedJSONBackend)
+            data = serializers.serialize('json', [Score(score=1.0)], fields=['score'])
+            self.assertEqual(data, '[{"fields": {"score": 1.0}, "model": "serializers.score", "pk": null}]')
+        self.assertNotIsInstance(get_json_backend(), SortedJSONBackend)
+
+
+@unittest.skipUnless(orjson, 'orjson is not installed')
+class OrjsonBackendTests(SimpleTestCase):
+    def test_dumps(self):
+        backend = OrjsonBackend()
+        data = {
+            'datetime': datetime.datetime(2018, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+            'decimal': decimal.Decimal('1.10'),
+            'duration': datetime.timedelta(days=1),
+            'uuid': uuid.UUID('12345678123456781234567812345678'),
+            'lazy': gettext_lazy('French'),
+            1: 'ł',
+        }
+        self.assertEqual(
+            backend.dumps_bytes(data),
+            '{"datetime":"2018-01-02T03:04:05.678901Z","decimal":"1.10","duration":"P1DT00H00M00S",'
+            '"uuid":"12345678-1234-5678-1234-567812345678","lazy":"French","1":"ł"}'.encode(),
+        )
+        self.assertEqual(
+            backend.dumps({'b': 1, 'a': [2]}, sort_keys=True, indent=2),
+            '{\n  "a": [\n    2\n  ],\n  "b": 1\n}',
+        )
+
+    def test_dumps_without_encoder(self):
+        backend = OrjsonBackend()
+        self.assertEqual(backend.dumps({'a': 1}, cls=None, separators=(',', ':')), '{"a":1}')
+        with self.assertRaises(TypeError):
+            backend.dumps({'a': datetime.datetime(2018, 1, 1)}, cls=None)
+
+    def test_dumps_fallback(self):
+        class CustomEncoder(json.JSONEncoder):
+            def default(self, o):
+                return 'custom'
+
+        backend = OrjsonBackend()
+        self.assertEqual(backend.dumps({'a': object()}, cls=CustomEncoder), '{"a": "custom"}')
+        self.assertEqual(backend.dumps([1], indent=4), '[\n    1\n]')
+
+    def test_loads(self):
+        backend = OrjsonBackend()
+        self.assertEqual(backend.loads(b'{"a": [1, 2]}'), {'a': [1, 2]})
+        self.assertEqual(backend.loads('1.1', parse_float=decimal.Decimal), decimal.Decimal('1.1'))
+
+
+class OrjsonBackendNotInstalledTests(SimpleTestCase):
+    def test_orjson_not_installed(self):
+        msg = 'OrjsonBackend requires the orjson library.'
+        with mock.patch('django.core.serializers.json.orjson', None):
+            with self.assertRaisesMessage(ImproperlyConfigured, msg):
+                OrjsonBackend()
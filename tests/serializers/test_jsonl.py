@@ -0,0 +1,151 @@
+import decimal
+import json
+import re
+
+from django.core import serializers
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.json import JSONBackend
+from django.db import models
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import isolate_apps
+
+from .models import Score
+from .tests import SerializersTestBase, SerializersTransactionTestBase
+
+
+class RecordingJSONBackend(JSONBackend):
+    decoded = []
+
+    def loads(self, s, **kwargs):
+        self.decoded.append(s)
+        return super().loads(s, **kwargs)
+
+
+class JsonlSerializerTestCase(SerializersTestBase, TestCase):
+    serializer_name = "jsonl"
+    pkless_str = [
+        '{"pk": null,"model": "serializers.category","fields": {"name": "Reference"}}',
+        '{"model": "serializers.category","fields": {"name": "Non-fiction"}}',
+    ]
+    pkless_str = "\n".join([s.replace("\n", "") for s in pkless_str])
+
+    mapping_ordering_str = (
+        '{"model": "serializers.article","pk": %(article_pk)s,'
+        '"fields": {'
+        '"author": %(author_pk)s,'
+        '"headline": "Poker has no place on ESPN",'
+        '"pub_date": "2006-06-16T11:00:00",'
+        '"categories": [%(first_category_pk)s,%(second_category_pk)s],'
+        '"meta_data": []}}\n'
+    )
+
+    @staticmethod
+    def _validate_output(serial_str):
+        try:
+            for line in serial_str.split("\n"):
+                if line:
+                    json.loads(line)
+        except Exception:
+            return False
+        else:
+            return True
+
+    @staticmethod
+    def _get_pk_values(serial_str):
+        serial_list = [json.loads(line) for line in serial_str.split("\n") if line]
+        return [obj_dict['pk'] for obj_dict in serial_list]
+
+    @staticmethod
+    def _get_field_values(serial_str, field_name):
+        serial_list = [json.loads(line) for line in serial_str.split("\n") if line]
+        return [obj_dict['fields'][field_name] for obj_dict in serial_list if field_name in obj_dict['fields']]
+
+    def test_no_indentation(self):
+        s = serializers.jsonl.Serializer()
+        json_data = s.serialize([Score(score=5.0), Score(score=6.0)], indent=2)
+        for line in json_data.splitlines():
+            self.assertIsNone(re.search(r'.+,\s*$', line))
+
+    @isolate_apps('serializers')
+    def test_custom_encoder(self):
+        class ScoreDecimal(models.Model):
+            score = models.DecimalField()
+
+        class CustomJSONEncoder(json.JSONEncoder):
+            def default(self, o):
+                if isinstance(o, decimal.Decimal):
+                    return str(o)
+                return super().default(o)
+
+        s = serializers.jsonl.Serializer()
+        json_data = s.serialize(
+            [ScoreDecimal(score=decimal.Decimal(1.0))], cls=CustomJSONEncoder,
+        )
+        self.assertIn('"fields": {"score": "1"}', json_data)
+
+    def test_json_deserializer_exception(self):
+        with self.assertRaises(DeserializationError):
+            for obj in serializers.deserialize("jsonl", """[{"pk":1}"""):
+                pass
+
+    def test_helpful_error_message_invalid_pk(self):
+        """
+        If there is an invalid primary key, the error message contains the
+        model associated with it.
+        """
+        test_string = (
+            '{"pk": "badpk","model": "serializers.player",'
+            '"fields": {"name": "Bob","rank": 1,"team": "Team"}}'
+        )
+        with self.assertRaisesMessage(DeserializationError, "(serializers.player:pk=badpk)"):
+            list(serializers.deserialize('jsonl', test_string))
+
+    def test_helpful_error_message_invalid_field(self):
+        """
+        If there is an invalid field value, the error message contains the
+        model associated with it.
+        """
+        test_string = (
+            '{"pk": "1","model": "serializers.player",'
+            '"fields": {"name": "Bob","rank": "invalidint","team": "Team"}}'
+        )
+        expected = "(serializers.player:pk=1) field_value was 'invalidint'"
+        with self.assertRaisesMessage(DeserializationError, expected):
+            list(serializers.deserialize('jsonl', test_string))
+
+    @override_settings(JSON_BACKEND='serializers.test_jsonl.RecordingJSONBackend')
+    def test_json_backend(self):
+        """Each line is decoded by the JSON_BACKEND."""
+        RecordingJSONBackend.decoded.clear()
+        serial_str = serializers.serialize(self.serializer_name, [self.a1, self.a2])
+        objs = list(serializers.deserialize(self.serializer_name, serial_str))
+        self.assertEqual([obj.object.pk for obj in objs], [self.a1.pk, self.a2.pk])
+        self.assertEqual(RecordingJSONBackend.decoded, serial_str.splitlines())
+
+    def test_deserialize_bytes(self):
+        serial_str = serializers.serialize(self.serializer_name, [self.a1])
+        objs = list(serializers.deserialize(self.serializer_name, serial_str.encode()))
+        self.assertEqual(objs[0].object.pk, self.a1.pk)
+
+
+class JsonlSerializerTransactionTestCase(SerializersTransactionTestBase, TransactionTestCase):
+    serializer_name = "jsonl"
+    fwd_ref_str = [
+        (
+            '{"pk": 1,"model": "serializers.article",'
+            '"fields": {'
+            '"headline": "Forward references pose no problem",'
+            '"pub_date": "2006-06-16T15:00:00",'
+            '"categories": [1],'
+            '"author": 1}}'
+        ),
+        (
+            '{"pk": 1,"model": "serializers.category",'
+            '"fields": {"name": "Reference"}}'
+        ),
+        (
+            '{"pk": 1,"model": "serializers.author",'
+            '"fields": {"name": "Agnes"}}'
+        ),
+    ]
+    fwd_ref_str = "\n".join([s.replace("\n", "") for s in fwd_ref_str])
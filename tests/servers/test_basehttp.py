@@ -1,7 +1,14 @@
+import threading
+import time
+from http.client import HTTPConnection, RemoteDisconnected
 from io import BytesIO
+from unittest import mock
+from wsgiref import simple_server
 
 from django.core.handlers.wsgi import WSGIRequest
-from django.core.servers.basehttp import WSGIRequestHandler
+from django.core.servers.basehttp import (
+    ServerHandler, ThreadedWSGIServer, WSGIRequestHandler,
+)
 from django.test import SimpleTestCase
 from django.test.client import RequestFactory
 
@@ -101,3 +108,102 @@ class WSGIRequestHandlerTestCase(SimpleTestCase):
         body = list(wfile.readlines())[-1]
 
         self.assertEqual(body, b'HTTP_SOME_HEADER:good')
+
+
+def hello_app(environ, start_response):
+    start_response('200 OK', [('Content-Length', '5')])
+    return [b'hello']
+
+
+class ServerHandlerTests(SimpleTestCase):
+
+    def get_handler(self, stdin, content_length):
+        return ServerHandler(stdin, BytesIO(), BytesIO(), {'CONTENT_LENGTH': str(content_length)})
+
+    @mock.patch.object(simple_server.ServerHandler, 'close')
+    def test_close_discards_body_in_chunks(self, close):
+        stdin = mock.Mock(wraps=BytesIO(b'a' * 200000 + b'next request'))
+        self.get_handler(stdin, 200000).close()
+        self.assertEqual(stdin.read(), b'next request')
+        self.assertLessEqual(max(call[0][0] for call in stdin.read.call_args_list[:-1]), 64 * 1024)
+        close.assert_called_once_with()
+
+    @mock.patch.object(simple_server.ServerHandler, 'close')
+    def test_close_after_read_error(self, close):
+        stdin = mock.Mock(read=mock.Mock(side_effect=ConnectionResetError))
+        with self.assertRaises(ConnectionResetError):
+            self.get_handler(stdin, 10).close()
+        close.assert_called_once_with()
+
+
+class ThreadedWSGIServerTests(SimpleTestCase):
+
+    def start_server(self, handler_class=WSGIRequestHandler, **attrs):
+        server = ThreadedWSGIServer(('localhost', 0), handler_class)
+        server.__dict__.update(attrs)
+        server.set_app(hello_app)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+
+        def stop_server():
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        self.addCleanup(stop_server)
+        return server
+
+    def get(self, conn):
+        conn.request('GET', '/')
+        return conn.getresponse().read()
+
+    def test_bounded_thread_pool(self):
+        server = self.start_server(max_threads=2)
+        with self.assertLogs('django.server', 'INFO'):
+            for i in range(5):
+                conn = HTTPConnection(*server.server_address)
+                try:
+                    self.assertEqual(self.get(conn), b'hello')
+                finally:
+                    conn.close()
+        self.assertEqual(len(server._workers), 2)
+
+    def open_keep_alive_connections(self, server, count):
+        conns = []
+        self.addCleanup(lambda: [conn.close() for conn in conns])
+        with self.assertLogs('django.server', 'INFO'):
+            for i in range(count):
+                conn = HTTPConnection(*server.server_address, timeout=2)
+                conns.append(conn)
+                self.assertEqual(self.get(conn), b'hello')
+        return conns
+
+    def test_idle_connections_free_workers(self):
+        """
+        Idle persistent connections are closed when other connections are
+        waiting for a worker thread.
+        """
+        server = self.start_server(max_threads=2)
+        self.open_keep_alive_connections(server, 5)
+        self.assertEqual(len(server._workers), 2)
+
+    def test_thread_per_connection(self):
+        """Without max_threads, each connection is handled in a new thread."""
+        server = self.start_server()
+        self.open_keep_alive_connections(server, 20)
+        self.assertIsNone(server._request_queue)
+
+    def test_keep_alive_timeout(self):
+        class RequestHandler(WSGIRequestHandler):
+            keep_alive_timeout = 0.1
+
+        server = self.start_server(RequestHandler)
+        conn = HTTPConnection(*server.server_address)
+        try:
+            with self.assertLogs('django.server', 'INFO'):
+                self.assertEqual(self.get(conn), b'hello')
+                self.assertEqual(self.get(conn), b'hello')
+            time.sleep(0.5)
+            with self.assertRaises((RemoteDisconnected, ConnectionResetError, BrokenPipeError)):
+                self.get(conn)
+        finally:
+            conn.close()
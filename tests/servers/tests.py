@@ -4,8 +4,8 @@ Tests for django.core.servers.
 import errno
 import os
 import socket
-import sys
-from http.client import HTTPConnection, RemoteDisconnected
+from http.client import HTTPConnection
+from unittest import mock
 from urllib.error import HTTPError
 from urllib.parse import urlencode
 from urllib.request import urlopen
@@ -57,29 +57,57 @@ class LiveServerViews(LiveServerBase):
         with self.urlopen('/example_view/') as f:
             self.assertEqual(f.version, 11)
 
-    @override_settings(MIDDLEWARE=[])
     def test_closes_connection_without_content_length(self):
         """
-        The server doesn't support keep-alive because Python's http.server
-        module that it uses hangs if a Content-Length header isn't set (for
-        example, if CommonMiddleware isn't enabled or if the response is a
-        StreamingHttpResponse) (#28440 / https://bugs.python.org/issue31076).
+        The server closes the connection if a Content-Length header isn't set
+        (for example, if CommonMiddleware isn't enabled or if the response is
+        a StreamingHttpResponse), as the end of the content is marked by
+        closing the connection (#28440 / https://bugs.python.org/issue31076).
         """
         conn = HTTPConnection(LiveServerViews.server_thread.host, LiveServerViews.server_thread.port, timeout=1)
+        try:
+            conn.request('GET', '/streaming_example_view/', headers={'Connection': 'keep-alive'})
+            response = conn.getresponse()
+            self.assertTrue(response.will_close)
+            self.assertEqual(response.read(), b'Iamastream')
+            self.assertEqual(response.getheader('Connection'), 'close')
+            self.assertIsNone(conn.sock)
+        finally:
+            conn.close()
+
+    def test_keep_alive_on_connection_with_content_length(self):
+        """The server keeps the connection open if Content-Length is set."""
+        conn = HTTPConnection(LiveServerViews.server_thread.host, LiveServerViews.server_thread.port)
         try:
             conn.request('GET', '/example_view/', headers={'Connection': 'keep-alive'})
-            response = conn.getresponse().read()
+            response = conn.getresponse()
+            self.assertFalse(response.will_close)
+            self.assertEqual(response.read(), b'example view')
+            self.assertIsNone(response.getheader('Connection'))
+            sock = conn.sock
+            self.assertIsNotNone(sock)
             conn.request('GET', '/example_view/', headers={'Connection': 'close'})
-            # macOS may give ConnectionResetError.
-            with self.assertRaises((RemoteDisconnected, ConnectionResetError)):
-                try:
-                    conn.getresponse()
-                except ConnectionAbortedError:
-                    if sys.platform == 'win32':
-                        self.skipTest('Ignore nondeterministic failure on Windows.')
+            self.assertIs(conn.sock, sock)
+            response = conn.getresponse()
+            self.assertTrue(response.will_close)
+            self.assertEqual(response.getheader('Connection'), 'close')
+            self.assertEqual(response.read(), b'example view')
+        finally:
+            conn.close()
+
+    def test_keep_alive_connection_clears_previous_request_data(self):
+        """The unread request body doesn't leak into the next request."""
+        conn = HTTPConnection(LiveServerViews.server_thread.host, LiveServerViews.server_thread.port)
+        try:
+            conn.request('POST', '/method_view/', b'{}', headers={'Connection': 'keep-alive'})
+            response = conn.getresponse()
+            self.assertFalse(response.will_close)
+            self.assertEqual(response.read(), b'POST')
+            conn.request('POST', '/method_view/', b'{}', headers={'Connection': 'close'})
+            response = conn.getresponse()
+            self.assertEqual(response.read(), b'POST')
         finally:
             conn.close()
-        self.assertEqual(response, b'example view')
 
     def test_404(self):
         with self.assertRaises(HTTPError) as err:
@@ -110,6 +138,13 @@ class LiveServerViews(LiveServerBase):
         with self.urlopen('/media/example_media_file.txt') as f:
             self.assertEqual(f.read().rstrip(b'\r\n'), b'example media file')
 
+    def test_media_files_sendfile(self):
+        """Files are sent with socket.sendfile()."""
+        patcher = mock.patch.object(socket.socket, 'sendfile', autospec=True, side_effect=socket.socket.sendfile)
+        with patcher as sendfile, self.urlopen('/media/example_media_file.txt') as f:
+            self.assertEqual(f.read().rstrip(b'\r\n'), b'example media file')
+        self.assertEqual(sendfile.call_count, 1)
+
     def test_environ(self):
         with self.urlopen('/environ_view/?%s' % urlencode({'q': 'тест'})) as f:
             self.assertIn(b"QUERY_STRING: 'q=%D1%82%D0%B5%D1%81%D1%82'", f.read())
@@ -1,6 +1,7 @@
 from urllib.request import urlopen
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
 
 from .models import Person
 
@@ -9,6 +10,10 @@ def example_view(request):
     return HttpResponse('example view')
 
 
+def streaming_example_view(request):
+    return StreamingHttpResponse((b'I', b'am', b'a', b'stream'))
+
+
 def model_view(request):
     people = Person.objects.all()
     return HttpResponse('\n'.join(person.name for person in people))
@@ -24,6 +29,11 @@ def environ_view(request):
     return HttpResponse("\n".join("%s: %r" % (k, v) for k, v in request.environ.items()))
 
 
+@csrf_exempt
+def method_view(request):
+    return HttpResponse(request.method)
+
+
 def subview(request):
     return HttpResponse('subview')
 
@@ -1,10 +1,17 @@
 import datetime
 
 from django.core import signing
-from django.test import SimpleTestCase
+from django.core.serializers.json import DjangoJSONEncoder, JSONBackend
+from django.test import SimpleTestCase, override_settings
 from django.test.utils import freeze_time
 
 
+class NonASCIIJSONBackend(JSONBackend):
+    def dumps(self, obj, cls=DjangoJSONEncoder, **kwargs):
+        kwargs['ensure_ascii'] = False
+        return super().dumps(obj, cls=cls, **kwargs)
+
+
 class TestSigner(SimpleTestCase):
 
     def test_signature(self):
@@ -96,6 +103,14 @@ class TestSigner(SimpleTestCase):
             with self.assertRaises(signing.BadSignature):
                 signing.loads(transform(encoded))
 
+    @override_settings(JSON_BACKEND='signing.tests.NonASCIIJSONBackend')
+    def test_dumps_loads_json_backend(self):
+        value = {'łóżko': ['é', 1]}
+        encoded = signing.dumps(value)
+        self.assertEqual(signing.loads(encoded), value)
+        with override_settings(JSON_BACKEND='django.core.serializers.json.JSONBackend'):
+            self.assertEqual(signing.loads(encoded), value)
+
     def test_works_with_non_ascii_keys(self):
         binary_key = b'\xe7'  # Set some binary (non-ASCII key)
 
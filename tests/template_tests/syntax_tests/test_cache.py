@@ -133,6 +133,16 @@ class CacheTagTests(SimpleTestCase):
         output = self.engine.render_to_string('second')
         self.assertEqual(output, 'content')
 
+    @setup({'esi_include01': '{% load cache %}{% esi_include "/menu/" %}'})
+    def test_esi_include01(self):
+        output = self.engine.render_to_string('esi_include01')
+        self.assertEqual(output, '<esi:include src="/menu/" />')
+
+    @setup({'esi_include02': '{% load cache %}{% esi_include url %}'})
+    def test_esi_include02(self):
+        output = self.engine.render_to_string('esi_include02', {'url': '/menu/?a=1&b="2"'})
+        self.assertEqual(output, '<esi:include src="/menu/?a=1&amp;b=&quot;2&quot;" />')
+
 
 class CacheTests(SimpleTestCase):
 
@@ -1,3 +1,4 @@
+import os
 import unittest
 from datetime import datetime
 
@@ -5,10 +6,11 @@ from django.test import SimpleTestCase, ignore_warnings
 from django.utils.datastructures import MultiValueDict
 from django.utils.deprecation import RemovedInDjango30Warning
 from django.utils.http import (
-    base36_to_int, cookie_date, escape_leading_slashes, http_date,
-    int_to_base36, is_safe_url, is_same_domain, parse_etags, parse_http_date,
-    quote_etag, urlencode, urlquote, urlquote_plus, urlsafe_base64_decode,
-    urlsafe_base64_encode, urlunquote, urlunquote_plus,
+    base36_to_int, cookie_date, escape_leading_slashes, etag_from_stat,
+    http_date, int_to_base36, is_safe_url, is_same_domain, parse_etags,
+    parse_http_date, parse_range_header, quote_etag, urlencode, urlquote,
+    urlquote_plus, urlsafe_base64_decode, urlsafe_base64_encode, urlunquote,
+    urlunquote_plus,
 )
 
 
@@ -253,6 +255,46 @@ class ETagProcessingTests(unittest.TestCase):
         self.assertEqual(quote_etag('"etag"'), '"etag"')  # quoted
         self.assertEqual(quote_etag('W/"etag"'), 'W/"etag"')  # quoted, weak
 
+    def test_etag_from_stat(self):
+        stat_result = os.stat(__file__)
+        etag = etag_from_stat(stat_result)
+        self.assertEqual(parse_etags(etag), [etag])
+        self.assertEqual(etag, '"%x-%x"' % (stat_result.st_mtime_ns, stat_result.st_size))
+
+
+class RangeProcessingTests(unittest.TestCase):
+    def test_parsing(self):
+        tests = [
+            ('bytes=0-499', [(0, 499)]),
+            ('bytes=500-999', [(500, 999)]),
+            ('bytes=-500', [(9500, 9999)]),
+            ('bytes=9500-', [(9500, 9999)]),
+            ('bytes=0-0,-1', [(0, 0), (9999, 9999)]),
+            ('Bytes = 500-600, 601-999', [(500, 999)]),
+            ('bytes=500-700,601-999', [(500, 999)]),
+            ('bytes=900-999,0-99', [(0, 99), (900, 999)]),
+            ('bytes=9000-20000', [(9000, 9999)]),
+            ('bytes=-20000', [(0, 9999)]),
+            # Unsatisfiable ranges.
+            ('bytes=10000-', []),
+            ('bytes=10000-10100,-0', []),
+            # Ignored headers.
+            ('items=0-5', None),
+            ('bytes=', None),
+            ('bytes=5', None),
+            ('bytes=-', None),
+            ('bytes=a-b', None),
+            ('bytes=500-400', None),
+            ('bytes=0-5,x', None),
+        ]
+        for header, ranges in tests:
+            with self.subTest(header=header):
+                self.assertEqual(parse_range_header(header, 10000), ranges)
+
+    def test_empty_representation(self):
+        self.assertEqual(parse_range_header('bytes=0-', 0), [])
+        self.assertEqual(parse_range_header('bytes=-1', 0), [])
+
 
 class HttpDateProcessingTests(unittest.TestCase):
     def test_http_date(self):
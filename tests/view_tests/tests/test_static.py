@@ -1,4 +1,5 @@
 import mimetypes
+import os
 import unittest
 from os import path
 from urllib.parse import quote
@@ -7,7 +8,7 @@ from django.conf.urls.static import static
 from django.core.exceptions import ImproperlyConfigured
 from django.http import FileResponse, HttpResponseNotModified
 from django.test import SimpleTestCase, override_settings
-from django.utils.http import http_date
+from django.utils.http import etag_from_stat, http_date
 from django.views.static import was_modified_since
 
 from .. import urls
@@ -104,6 +105,67 @@ class StaticTests(SimpleTestCase):
             self.assertEqual(fp.read(), response_content)
         self.assertEqual(len(response_content), int(response['Content-Length']))
 
+    def get_file_content(self, file_name):
+        with open(path.join(media_dir, file_name), 'rb') as fp:
+            return fp.read()
+
+    def test_etag(self):
+        file_name = 'file.txt'
+        response = self.client.get('/%s/%s' % (self.prefix, file_name))
+        response.close()
+        self.assertEqual(response['ETag'], etag_from_stat(os.stat(path.join(media_dir, file_name))))
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        response = self.client.get('/%s/%s' % (self.prefix, file_name), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get('/%s/%s' % (self.prefix, file_name), HTTP_IF_MATCH='"other"')
+        self.assertEqual(response.status_code, 412)
+
+    def test_range(self):
+        file_name = 'file.txt'
+        content = self.get_file_content(file_name)
+        response = self.client.get('/%s/%s' % (self.prefix, file_name), HTTP_RANGE='bytes=2-5')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 2-5/%d' % len(content))
+        self.assertEqual(b''.join(response), content[2:6])
+
+    def test_multiple_ranges(self):
+        file_name = 'file.txt'
+        content = self.get_file_content(file_name)
+        response = self.client.get('/%s/%s' % (self.prefix, file_name), HTTP_RANGE='bytes=0-1,-2')
+        self.assertEqual(response.status_code, 206)
+        self.assertTrue(response['Content-Type'].startswith('multipart/byteranges; boundary='))
+        response_content = b''.join(response)
+        self.assertEqual(len(response_content), int(response['Content-Length']))
+        self.assertIn(b'Content-Type: text/plain\r\nContent-Range: bytes 0-1/', response_content)
+        self.assertIn(b'\r\n\r\n' + content[:2] + b'\r\n', response_content)
+        self.assertIn(b'\r\n\r\n' + content[-2:] + b'\r\n', response_content)
+
+    def test_unsatisfiable_range(self):
+        file_name = 'file.txt'
+        size = len(self.get_file_content(file_name))
+        response = self.client.get('/%s/%s' % (self.prefix, file_name), HTTP_RANGE='bytes=%d-' % size)
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */%d' % size)
+
+    def test_if_range(self):
+        file_name = 'file.txt'
+        content = self.get_file_content(file_name)
+        url = '/%s/%s' % (self.prefix, file_name)
+        response = self.client.get(url)
+        response.close()
+        tests = [
+            (response['ETag'], 206),
+            (response['Last-Modified'], 206),
+            ('"other"', 200),
+            ('W/' + response['ETag'], 200),
+            ('Thu, 1 Jan 1970 00:00:00 GMT', 200),
+        ]
+        for if_range, status_code in tests:
+            with self.subTest(if_range=if_range):
+                response = self.client.get(url, HTTP_RANGE='bytes=0-1', HTTP_IF_RANGE=if_range)
+                self.assertEqual(response.status_code, status_code)
+                self.assertEqual(b''.join(response), content[:2] if status_code == 206 else content)
+
     def test_404(self):
         response = self.client.get('/%s/nonexistent_resource' % self.prefix)
         self.assertEqual(404, response.status_code)